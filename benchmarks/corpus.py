@@ -0,0 +1,196 @@
+"""
+합성 이미지 코퍼스 생성기
+
+piexif 로 EXIF 를 채운 JPEG/TIFF 파일을 만들어 벤치마크 입력으로 사용함.
+개수, 파일 크기, GPS 포함 비율, 시간 패턴, 추가 태그 수를 조절할 수 있고
+같은 seed 로 만들면 같은 코퍼스가 생성됨
+
+사용 예:
+    python -m benchmarks.corpus /tmp/corpus --count 1000 --formats jpeg,tiff --gps-ratio 0.8
+"""
+import io
+import os
+import json
+import random
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Sequence
+
+import piexif
+
+# 좌표 생성 기준점 (서울 시청)
+CENTER = (37.5665, 126.9780)
+
+TIMESTAMP_PATTERNS = ('consistent', 'drift', 'missing', 'mixed')
+
+EXTENSIONS = {'jpeg': '.jpg', 'tiff': '.tif'}
+
+# 직접 채우거나 파일 구조를 가리키는 태그는 추가 태그 후보에서 제외
+_RESERVED_TAGS = {
+    piexif.ImageIFD.Make, piexif.ImageIFD.Model, piexif.ImageIFD.DateTime,
+    piexif.ImageIFD.ExifTag, piexif.ImageIFD.GPSTag, piexif.ImageIFD.StripOffsets,
+    piexif.ImageIFD.StripByteCounts, piexif.ImageIFD.JPEGInterchangeFormat,
+    piexif.ImageIFD.JPEGInterchangeFormatLength, piexif.ImageIFD.TileOffsets,
+    piexif.ImageIFD.TileByteCounts, piexif.ImageIFD.SubIFDs,
+    piexif.ExifIFD.DateTimeOriginal, piexif.ExifIFD.DateTimeDigitized,
+    piexif.ExifIFD.InteroperabilityTag,
+}
+
+# 추가 태그 후보 (ASCII, SHORT, LONG, RATIONAL 형식)
+_FILLER_TAGS = [(ifd, tag, spec['type'])
+                for ifd, ifd_name in (('0th', 'Image'), ('Exif', 'Exif'))
+                for tag, spec in sorted(piexif.TAGS[ifd_name].items())
+                if spec['type'] in (2, 3, 4, 5) and tag not in _RESERVED_TAGS]
+
+
+def generate_corpus(directory: str, count: int = 100, formats: Sequence[str] = ('jpeg',),
+                    file_size_kb: int = 0, gps_ratio: float = 1.0, timestamp_pattern: str = 'consistent',
+                    tag_density: int = 0, spread_km: float = 5.0, seed: int = 0) -> Dict[str, Any]:
+    """
+    합성 코퍼스 생성
+
+    Args:
+        directory: 파일을 만들 디렉토리
+        count: 생성할 파일 수 (형식을 번갈아 사용)
+        formats: 파일 형식 목록 ('jpeg', 'tiff')
+        file_size_kb: 0보다 크면 파일 끝을 채워 해당 크기(KB)로 맞춤 (읽기 I/O 비용 조절)
+        gps_ratio: GPS 태그를 넣을 파일 비율 (0~1)
+        timestamp_pattern: 'consistent'(모든 시간 일치), 'drift'(기록/GPS 시간 차이),
+                           'missing'(시간 태그 없음), 'mixed'(파일마다 무작위)
+        tag_density: 파일마다 추가할 기타 태그 수
+        spread_km: 기준점에서 좌표를 흩뿌릴 최대 거리 (km)
+        seed: 난수 시드
+
+    Returns:
+        Dict: 생성 설정과 파일 경로 목록
+    """
+    if timestamp_pattern not in TIMESTAMP_PATTERNS:
+        raise ValueError(f"지원되지 않는 시간 패턴: {timestamp_pattern}")
+    unknown = [fmt for fmt in formats if fmt not in EXTENSIONS]
+    if unknown:
+        raise ValueError(f"지원되지 않는 형식: {', '.join(unknown)}")
+
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    base_jpeg = _base_jpeg()
+    tag_density = min(tag_density, len(_FILLER_TAGS))
+    start = datetime(2024, 5, 1, 9, 0, 0)
+
+    paths = []
+    for i in range(count):
+        fmt = formats[i % len(formats)]
+        shot_at = start + timedelta(minutes=i)
+        pattern = rng.choice(TIMESTAMP_PATTERNS[:3]) if timestamp_pattern == 'mixed' else timestamp_pattern
+        exif_bytes = piexif.dump(_build_exif(rng, i, shot_at, pattern, rng.random() < gps_ratio,
+                                             tag_density, spread_km))
+
+        if fmt == 'jpeg':
+            output = io.BytesIO()
+            piexif.insert(exif_bytes, base_jpeg, output)
+            data = output.getvalue()
+        else:
+            # piexif.dump 결과는 'Exif\0\0' 뒤에 TIFF 구조가 오므로 그대로 TIFF 파일이 됨
+            data = exif_bytes[6:]
+
+        padding = file_size_kb * 1024 - len(data)
+        path = os.path.join(directory, f"synthetic_{i:06d}{EXTENSIONS[fmt]}")
+        with open(path, 'wb') as f:
+            f.write(data)
+            if padding > 0:
+                f.write(rng.randbytes(padding))
+        paths.append(path)
+
+    return {
+        'directory': directory,
+        'count': count,
+        'formats': list(formats),
+        'file_size_kb': file_size_kb,
+        'gps_ratio': gps_ratio,
+        'timestamp_pattern': timestamp_pattern,
+        'tag_density': tag_density,
+        'spread_km': spread_km,
+        'seed': seed,
+        'paths': paths,
+    }
+
+
+def _base_jpeg() -> bytes:
+    """EXIF 를 넣을 작은 JPEG"""
+    from PIL import Image
+    output = io.BytesIO()
+    Image.new('RGB', (64, 48), (90, 120, 150)).save(output, 'JPEG', quality=85)
+    return output.getvalue()
+
+
+def _build_exif(rng: random.Random, index: int, shot_at: datetime, pattern: str, with_gps: bool,
+                tag_density: int, spread_km: float) -> Dict[str, Any]:
+    """piexif.dump 에 넘길 EXIF 딕셔너리"""
+    zeroth = {
+        piexif.ImageIFD.Make: rng.choice([b'Canon', b'NIKON CORPORATION', b'SONY', b'Apple']),
+        piexif.ImageIFD.Model: f"Model {index % 7}".encode('ascii'),
+    }
+    exif = {}
+    gps = {}
+
+    if pattern != 'missing':
+        stamp = shot_at.strftime('%Y:%m:%d %H:%M:%S').encode('ascii')
+        zeroth[piexif.ImageIFD.DateTime] = stamp
+        exif[piexif.ExifIFD.DateTimeOriginal] = stamp
+        digitized = shot_at + timedelta(minutes=rng.randint(5, 180)) if pattern == 'drift' else shot_at
+        exif[piexif.ExifIFD.DateTimeDigitized] = digitized.strftime('%Y:%m:%d %H:%M:%S').encode('ascii')
+
+    if with_gps:
+        # 기준점에서 spread_km 이내 (위도 1도 ≈ 111km)
+        latitude = CENTER[0] + rng.uniform(-spread_km, spread_km) / 111.0
+        longitude = CENTER[1] + rng.uniform(-spread_km, spread_km) / 88.0
+        gps[piexif.GPSIFD.GPSLatitudeRef] = b'N'
+        gps[piexif.GPSIFD.GPSLatitude] = _to_dms(latitude)
+        gps[piexif.GPSIFD.GPSLongitudeRef] = b'E'
+        gps[piexif.GPSIFD.GPSLongitude] = _to_dms(longitude)
+        gps[piexif.GPSIFD.GPSAltitudeRef] = 0
+        gps[piexif.GPSIFD.GPSAltitude] = (rng.randint(0, 50000), 100)
+        if pattern != 'missing':
+            gps_at = shot_at + timedelta(minutes=rng.randint(-240, 240)) if pattern == 'drift' else shot_at
+            gps[piexif.GPSIFD.GPSDateStamp] = gps_at.strftime('%Y:%m:%d').encode('ascii')
+            gps[piexif.GPSIFD.GPSTimeStamp] = ((gps_at.hour, 1), (gps_at.minute, 1), (gps_at.second, 1))
+
+    ifds = {'0th': zeroth, 'Exif': exif}
+    for ifd, tag, kind in rng.sample(_FILLER_TAGS, tag_density):
+        if kind == 2:
+            value = f"synthetic {tag}".encode('ascii')
+        elif kind == 5:
+            value = (rng.randint(1, 1000), rng.randint(1, 100))
+        else:
+            value = rng.randint(0, 255)
+        ifds[ifd][tag] = value
+
+    return {'0th': zeroth, 'Exif': exif, 'GPS': gps, '1st': {}, 'thumbnail': None}
+
+
+def _to_dms(value: float):
+    """십진 도를 EXIF (도, 분, 초) 유리수 튜플로 변환"""
+    degrees = int(value)
+    minutes_float = (value - degrees) * 60
+    minutes = int(minutes_float)
+    seconds = round((minutes_float - minutes) * 60 * 10000)
+    return ((degrees, 1), (minutes, 1), (seconds, 10000))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='합성 이미지 코퍼스 생성')
+    parser.add_argument('directory', help='파일을 만들 디렉토리')
+    parser.add_argument('--count', type=int, default=100, help='생성할 파일 수')
+    parser.add_argument('--formats', type=str, default='jpeg', help='파일 형식 (쉼표 구분: jpeg, tiff)')
+    parser.add_argument('--file-size-kb', type=int, default=0, help='파일 크기 (KB, 0이면 채우지 않음)')
+    parser.add_argument('--gps-ratio', type=float, default=1.0, help='GPS 태그를 넣을 파일 비율')
+    parser.add_argument('--timestamp-pattern', type=str, default='consistent', choices=TIMESTAMP_PATTERNS,
+                        help='시간 태그 패턴')
+    parser.add_argument('--tag-density', type=int, default=0, help='파일마다 추가할 기타 태그 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    args = parser.parse_args()
+
+    corpus = generate_corpus(args.directory, args.count, [fmt.strip() for fmt in args.formats.split(',')],
+                             args.file_size_kb, args.gps_ratio, args.timestamp_pattern, args.tag_density,
+                             seed=args.seed)
+    corpus.pop('paths')
+    print(json.dumps(corpus, indent=2, ensure_ascii=False))
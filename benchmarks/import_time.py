@@ -0,0 +1,89 @@
+"""
+시작 시간(임포트 비용) 벤치마크
+
+새 인터프리터에서 CLI 진입 경로를 여러 번 실행해 소요 시간의 중앙값을 측정하고,
+분석 경로에서 무거운 의존성(보고서/지도/GUI 라이브러리)이 로드되지 않는지 확인함
+
+사용 예:
+    python -m benchmarks.import_time --repeat 10
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import statistics
+import subprocess
+from typing import Dict, Any, List
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 단일 파일 분석 경로에서는 로드되지 않아야 하는 모듈
+HEAVY_MODULES = ['folium', 'geopy', 'reportlab', 'pandas', 'numpy', 'matplotlib',
+                 'jinja2', 'tkinter', 'timezonefinder', 'PIL.Image', 'pyarrow']
+
+SCENARIOS = {
+    'cli_help': [os.path.join(PROJECT_DIR, 'main.py'), '--help'],
+    'import_analyzer': ['-c', 'import components.exifanalyzer'],
+}
+
+
+def measure(args: List[str], repeat: int, cwd: str) -> Dict[str, float]:
+    """
+    새 인터프리터로 명령을 반복 실행해 소요 시간 통계를 계산
+
+    Args:
+        args: python 뒤에 붙일 인자
+        repeat: 반복 횟수
+        cwd: 실행 디렉토리 (로그 디렉토리가 있어야 함)
+
+    Returns:
+        Dict: 중앙값/최솟값/최댓값 (밀리초)
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_DIR)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + args, cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 1),
+        'min_ms': round(min(samples), 1),
+        'max_ms': round(max(samples), 1),
+    }
+
+
+def loaded_heavy_modules(cwd: str) -> List[str]:
+    """분석기 모듈을 임포트한 직후 로드되어 있는 무거운 모듈 목록"""
+    code = ("import sys, json, components.exifanalyzer; "
+            f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))")
+    env = dict(os.environ, PYTHONPATH=PROJECT_DIR)
+    output = subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True,
+                            capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int = 5) -> Dict[str, Any]:
+    """
+    모든 시나리오 측정
+
+    Args:
+        repeat: 시나리오별 반복 횟수
+
+    Returns:
+        Dict: 시나리오별 측정 결과와 로드된 무거운 모듈 목록
+    """
+    with tempfile.TemporaryDirectory() as cwd:
+        os.makedirs(os.path.join(cwd, 'log'), exist_ok=True)
+        results = {name: measure(args, repeat, cwd) for name, args in SCENARIOS.items()}
+        results['heavy_modules_loaded'] = loaded_heavy_modules(cwd)
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='시작 시간(임포트 비용) 벤치마크')
+    parser.add_argument('--repeat', type=int, default=5, help='시나리오별 반복 횟수')
+    args = parser.parse_args()
+    print(json.dumps(run(args.repeat), indent=2, ensure_ascii=False))
@@ -0,0 +1,232 @@
+"""
+단계별 처리량/최대 메모리 벤치마크
+
+합성 코퍼스(benchmarks.corpus)를 만들어 추출, 위치 검증(지오코더 대체), 시간 분석,
+보고서 작성기별, analyze_directory 전체 경로를 측정하고 결과를 JSON 으로 저장함.
+각 단계는 예열 호출 뒤 시간 측정과 tracemalloc 메모리 측정을 따로 실행해 임포트/메모리 추적 비용이 시간에 섞이지 않게 함
+
+사용 예:
+    python -m benchmarks.stages --count 500 --output bench.json
+    python -m benchmarks.stages --count 500 --compare bench.json
+"""
+import os
+import json
+import time
+import logging
+import platform
+import argparse
+import tempfile
+import tracemalloc
+from datetime import datetime
+from typing import Dict, Any, Callable, List
+
+from benchmarks.corpus import generate_corpus, CENTER
+from components.exifanalyzer import ExifAnalyzer
+
+# 지오코더 대체 결과 (네트워크 지연을 측정에서 제외)
+STUB_ADDRESS = {'full_address': 'Synthetic address', 'components': {'country': 'KR', 'city': 'Seoul'}}
+
+REFERENCE_LOCATION = CENTER
+MAX_DISTANCE = 3.0
+
+
+def _stub_reverse_geocode(latitude: float, longitude: float) -> Dict[str, Any]:
+    return STUB_ADDRESS
+
+
+def new_analyzer(output_dir: str) -> ExifAnalyzer:
+    """지오코더를 대체한 분석기"""
+    analyzer = ExifAnalyzer(output_dir)
+    analyzer.location_validator.reverse_geocode = _stub_reverse_geocode
+    return analyzer
+
+
+def measure(func: Callable[[], int], memory: bool = True) -> Dict[str, Any]:
+    """
+    단계 한 개 측정
+
+    측정 전에 한 번 더 호출해 지연 임포트(reportlab, jinja2, matplotlib, folium)와
+    템플릿/폰트 로딩 비용이 첫 측정에 섞이지 않게 함
+
+    Args:
+        func: 처리한 항목 수를 반환하는 함수 (예열, 시간 측정, 메모리 측정에서 각각 한 번씩 호출)
+        memory: False 이면 메모리 측정 생략
+
+    Returns:
+        Dict: 항목 수, 소요 시간, 초당 처리량, 최대 메모리 (KB)
+    """
+    try:
+        func()
+        start = time.perf_counter()
+        items = func()
+        seconds = time.perf_counter() - start
+    except ImportError as e:
+        return {'skipped': f"의존성 없음: {e}"}
+
+    result = {
+        'items': items,
+        'seconds': round(seconds, 4),
+        'items_per_second': round(items / seconds, 1) if seconds > 0 else None,
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            result['peak_memory_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run(count: int = 200, formats: List[str] = ('jpeg',), file_size_kb: int = 0, gps_ratio: float = 1.0,
+        timestamp_pattern: str = 'mixed', tag_density: int = 20, seed: int = 0,
+        report_count: int = 200, memory: bool = True) -> Dict[str, Any]:
+    """
+    모든 단계 측정
+
+    Args:
+        count: 코퍼스 파일 수
+        formats: 코퍼스 파일 형식 목록
+        file_size_kb: 코퍼스 파일 크기 (KB)
+        gps_ratio: GPS 태그를 넣을 파일 비율
+        timestamp_pattern: 시간 태그 패턴
+        tag_density: 파일마다 추가할 기타 태그 수
+        seed: 난수 시드
+        report_count: 보고서 작성기에 넘길 결과 수 (보고서는 느리므로 코퍼스 일부만 사용)
+        memory: False 이면 최대 메모리 측정 생략
+
+    Returns:
+        Dict: 실행 환경, 코퍼스 설정, 단계별 측정 결과
+    """
+    # 이미지마다 남는 INFO 로그가 측정에 섞이지 않도록 경고 이상만 기록
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus = generate_corpus(os.path.join(workdir, 'corpus'), count, formats, file_size_kb,
+                                 gps_ratio, timestamp_pattern, tag_density, seed=seed)
+        paths = corpus.pop('paths')
+        output_dir = os.path.join(workdir, 'output')
+        analyzer = new_analyzer(output_dir)
+        extractor = analyzer.extractor
+        validator = analyzer.location_validator
+        time_analyzer = analyzer.time_analyzer
+
+        # 이후 단계 입력 준비 (측정 대상 아님)
+        exif_list = [exif for exif in (extractor.extract_exif(path) for path in paths) if exif]
+        results = analyzer.analyze_directory(corpus['directory'], REFERENCE_LOCATION, MAX_DISTANCE)
+        report_results = results[:report_count]
+        coordinates_list, labels = validator.collect_map_points(report_results)
+        generator = analyzer.report_generator
+        # 보고서 조각 캐시를 쓰지 않아 매번 전체를 렌더링
+        generator.fragment_cache = None
+
+        def extract():
+            for path in paths:
+                extractor.extract_exif(path)
+            return len(paths)
+
+        def validate_location():
+            for exif in exif_list:
+                validator.validate_location(exif, REFERENCE_LOCATION, MAX_DISTANCE)
+            return len(exif_list)
+
+        def analyze_time():
+            for exif in exif_list:
+                time_analyzer.analyze_time_consistency(exif)
+            return len(exif_list)
+
+        def report(method: str, file_name: str, *args):
+            def write():
+                if not getattr(generator, method)(report_results, *args, os.path.join(output_dir, file_name)):
+                    raise RuntimeError(f"{method} 실패")
+                return len(report_results)
+            return write
+
+        def write_map():
+            if not validator.create_map(coordinates_list, labels, os.path.join(output_dir, 'map.html'),
+                                        use_cache=False):
+                raise ImportError("folium")
+            return len(coordinates_list)
+
+        def analyze_directory():
+            return len(new_analyzer(output_dir).analyze_directory(
+                corpus['directory'], REFERENCE_LOCATION, MAX_DISTANCE))
+
+        stages = {
+            'extract_exif': extract,
+            'validate_location': validate_location,
+            'analyze_time_consistency': analyze_time,
+            'report_pdf': report('generate_pdf_report', 'bench.pdf'),
+            'report_html': report('generate_html_report', 'bench.html', None),
+            'report_visualization': report('generate_data_visualization', 'bench.png'),
+            'report_map': write_map,
+            'analyze_directory': analyze_directory,
+        }
+        measurements = {}
+        for name, func in stages.items():
+            try:
+                measurements[name] = measure(func, memory)
+            except Exception as e:
+                measurements[name] = {'error': f"{type(e).__name__}: {e}"}
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'corpus': corpus,
+        'report_count': len(report_results),
+        'stages': measurements,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any]) -> str:
+    """
+    두 측정 결과의 단계별 처리량/메모리 비교표
+
+    Args:
+        baseline: 이전 측정 결과
+        current: 현재 측정 결과
+
+    Returns:
+        str: 비교표 텍스트
+    """
+    lines = [f"{'stage':<26}{'items/s (base)':>16}{'items/s (now)':>16}{'change':>10}{'peak KB (now)':>16}"]
+    for name, now in current['stages'].items():
+        base = baseline.get('stages', {}).get(name, {})
+        before, after = base.get('items_per_second'), now.get('items_per_second')
+        change = f"{(after / before - 1) * 100:+.1f}%" if before and after else '-'
+        lines.append(f"{name:<26}{before or '-':>16}{after or '-':>16}{change:>10}"
+                     f"{now.get('peak_memory_kb', '-'):>16}")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='단계별 처리량/최대 메모리 벤치마크')
+    parser.add_argument('--count', type=int, default=200, help='코퍼스 파일 수')
+    parser.add_argument('--formats', type=str, default='jpeg', help='코퍼스 파일 형식 (쉼표 구분: jpeg, tiff)')
+    parser.add_argument('--file-size-kb', type=int, default=0, help='코퍼스 파일 크기 (KB)')
+    parser.add_argument('--gps-ratio', type=float, default=1.0, help='GPS 태그를 넣을 파일 비율')
+    parser.add_argument('--timestamp-pattern', type=str, default='mixed', help='시간 태그 패턴')
+    parser.add_argument('--tag-density', type=int, default=20, help='파일마다 추가할 기타 태그 수')
+    parser.add_argument('--seed', type=int, default=0, help='난수 시드')
+    parser.add_argument('--report-count', type=int, default=200, help='보고서 작성기에 넘길 결과 수')
+    parser.add_argument('--no-memory', action='store_true', help='최대 메모리 측정 생략')
+    parser.add_argument('--output', type=str, help='측정 결과 JSON 저장 경로')
+    parser.add_argument('--compare', type=str, metavar='FILE', help='비교할 이전 측정 결과 JSON')
+    args = parser.parse_args()
+
+    outcome = run(args.count, [fmt.strip() for fmt in args.formats.split(',')], args.file_size_kb,
+                  args.gps_ratio, args.timestamp_pattern, args.tag_density, args.seed,
+                  args.report_count, not args.no_memory)
+    text = json.dumps(outcome, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+    print(text)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            print(compare(json.load(f), outcome))
@@ -0,0 +1,424 @@
+import os
+import json
+import stat
+import time
+import signal
+import logging
+import threading
+import socketserver
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+from components.metrics import metrics as stage_metrics
+from components import profiler
+from components.logconfig import init_worker_logging, worker_log_args
+from components.locationvalidator import GeocodeThrottle
+
+logger = logging.getLogger(__name__)
+
+# 작업 프로세스마다 한 번 만들어 재사용하는 분석기 (프로세스 시작 시 _init_worker 에서 생성)
+_worker_analyzer = None
+# 서비스 시작 시 실행 중이던 프로파일 모드 (요청마다 프로파일해 결과를 서비스 프로세스로 넘김)
+_worker_profile_mode = None
+
+
+def _init_worker(output_dir: str, geocode_throttle: Optional[GeocodeThrottle] = None,
+                 profile_mode: Optional[str] = None, log_queue=None, log_level: Optional[int] = None) -> None:
+    """작업 프로세스 초기화 (임포트와 ExifAnalyzer 생성 비용을 요청 전에 미리 치름)"""
+    global _worker_analyzer, _worker_profile_mode
+    _worker_profile_mode = profile_mode
+    init_worker_logging(log_queue, log_level)
+    # Ctrl+C 는 서비스 프로세스가 받아 풀을 정리하므로 작업 프로세스는 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    from components.exifanalyzer import ExifAnalyzer
+    _worker_analyzer = ExifAnalyzer(output_dir)
+    if geocode_throttle:
+        # 모든 작업 프로세스가 하나의 조절기를 공유해 서비스 전체로 지오코딩 요청 간격을 지킴
+        _worker_analyzer.location_validator.throttle = geocode_throttle
+    # fork 로 복사된 서비스 프로세스의 지표는 버림 (작업마다 스냅샷으로 넘겨 서비스 쪽에서 합산)
+    stage_metrics.reset()
+
+
+def _ping() -> int:
+    """작업 프로세스 예열용 빈 작업"""
+    return os.getpid()
+
+
+def _analyze_in_worker(image_path: str, reference_location: Optional[Tuple[float, float]],
+                       max_distance: float) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[Dict[str, Any]]]:
+    """작업 프로세스에서 이미지 한 건 분석 (결과, 그 동안 기록된 단계별 지표 스냅샷, 프로파일 데이터를 반환)"""
+    result, profile = profiler.profile_call(_worker_profile_mode, _worker_analyzer.analyze_image,
+                                            image_path, reference_location, max_distance)
+    return result, stage_metrics.snapshot(reset=True), profile
+
+
+class AnalysisService:
+    """미리 띄워 둔 ExifAnalyzer 작업 프로세스 풀로 분석 요청을 처리하는 로컬 HTTP 서비스"""
+
+    def __init__(self, output_dir: str, workers: int = 4, max_concurrent: int = 8, max_batch: int = 1000,
+                 reference_location: Optional[Tuple[float, float]] = None, max_distance: float = 1.0):
+        """
+        초기화 메서드
+
+        Args:
+            output_dir: 작업 프로세스 분석기의 출력 디렉토리
+            workers: 작업 프로세스 수
+            max_concurrent: 동시에 처리하는 분석 요청 수 (초과 요청은 503 으로 즉시 거절)
+            max_batch: 일괄 분석 요청 한 건의 최대 경로 수
+            reference_location: 요청에 기준 위치가 없을 때 사용할 기준 위치 (위도, 경도)
+            max_distance: 요청에 허용 거리가 없을 때 사용할 허용 최대 거리 (km)
+        """
+        self.output_dir = output_dir
+        self.workers = max(1, workers)
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_batch = max(1, max_batch)
+        self.reference_location = reference_location
+        self.max_distance = max_distance
+        self.started_at = time.time()
+
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.metrics = {
+            'requests': {},      # 엔드포인트 -> 요청 수
+            'rejected': 0,       # 동시 처리 한도 초과로 거절한 요청 수
+            'errors': 0,         # 4xx/5xx 응답 수
+            'images': 0,         # 분석한 이미지 수
+            'image_errors': 0,   # 분석에 실패한 이미지 수
+            'in_flight': 0,      # 처리 중인 분석 요청 수
+            'seconds': 0.0,      # 분석 요청 처리 시간 합계
+            'pool_restarts': 0,  # 작업 프로세스 비정상 종료로 풀을 다시 만든 횟수
+        }
+        # 작업 프로세스 풀 재생성 (한 스레드만 수행하고, 진행 중에는 /health 가 degraded 를 반환)
+        self._executor_lock = threading.Lock()
+        self._rebuilding = threading.Event()
+
+        os.makedirs(output_dir, exist_ok=True)
+        # 작업 프로세스들이 공유하는 지오코딩 조절기 (Nominatim 초당 1건 정책을 프로세스 수와 무관하게 지킴)
+        self.geocode_throttle = GeocodeThrottle(lock=multiprocessing.Lock(),
+                                                last_call=multiprocessing.RawValue('d', 0.0))
+        self.executor = self._start_executor()
+
+    def _start_executor(self) -> ProcessPoolExecutor:
+        """작업 프로세스 풀을 만들고 모든 작업 프로세스를 미리 띄움"""
+        executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                       initargs=(self.output_dir, self.geocode_throttle, profiler.active_mode(),
+                                                 *worker_log_args()))
+        # 작업 프로세스를 모두 미리 띄워 첫 요청이 프로세스 시작/임포트 비용을 치르지 않게 함
+        pids = set(future.result() for future in [executor.submit(_ping) for _ in range(self.workers)])
+        logger.info(f"분석 서비스 작업 프로세스 {len(pids)}개 준비 완료")
+        return executor
+
+    def _rebuild_executor(self, broken: ProcessPoolExecutor) -> None:
+        """
+        작업 프로세스가 비정상 종료되어 사용할 수 없게 된 풀(BrokenProcessPool)을 새로 만듦
+
+        여러 요청이 동시에 발견해도 한 번만 만들며, 이미 교체된 풀이면 아무것도 하지 않음
+
+        Args:
+            broken: 실패를 발견한 요청이 사용하던 풀
+        """
+        with self._executor_lock:
+            if self.executor is not broken:
+                return
+            self._rebuilding.set()
+            try:
+                logger.error("작업 프로세스가 비정상 종료되어 작업 프로세스 풀을 다시 만듭니다")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.executor = self._start_executor()
+                with self._lock:
+                    self.metrics['pool_restarts'] += 1
+            finally:
+                self._rebuilding.clear()
+
+    def _pool_broken(self) -> bool:
+        """풀이 깨졌는지 확인하고 깨졌으면 백그라운드에서 다시 만듦 (깨진 풀은 submit 에서 바로 예외 발생)"""
+        executor = self.executor
+        try:
+            executor.submit(_ping)
+            return False
+        except BrokenProcessPool:
+            threading.Thread(target=self._rebuild_executor, args=(executor,), daemon=True).start()
+            return True
+
+    def analyze(self, image_path: str, reference_location: Optional[Tuple[float, float]] = None,
+                max_distance: Optional[float] = None) -> Dict[str, Any]:
+        """
+        이미지 한 건 분석
+
+        Args:
+            image_path: 분석할 이미지 경로
+            reference_location: 기준 위치 (생략 시 서비스 기본값)
+            max_distance: 허용 최대 거리 (생략 시 서비스 기본값)
+
+        Returns:
+            Dict: 분석 결과 (실패 시 'error' 키 포함)
+        """
+        return self.analyze_batch([image_path], reference_location, max_distance)[0]
+
+    def analyze_batch(self, image_paths: List[str], reference_location: Optional[Tuple[float, float]] = None,
+                      max_distance: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        여러 이미지를 작업 프로세스에 나눠 분석
+
+        Args:
+            image_paths: 분석할 이미지 경로 목록
+            reference_location: 기준 위치 (생략 시 서비스 기본값)
+            max_distance: 허용 최대 거리 (생략 시 서비스 기본값)
+
+        Returns:
+            List[Dict]: 경로 순서대로의 분석 결과
+        """
+        reference_location = reference_location or self.reference_location
+        max_distance = self.max_distance if max_distance is None else max_distance
+        executor = self.executor
+        futures = []
+        for path in image_paths:
+            try:
+                futures.append(executor.submit(_analyze_in_worker, path, reference_location, max_distance))
+            except BrokenProcessPool as e:
+                futures.append(e)
+
+        results = []
+        broken = False
+        for path, future in zip(image_paths, futures):
+            try:
+                if isinstance(future, BaseException):
+                    raise future
+                result, snapshot, profile = future.result()
+                stage_metrics.merge(snapshot)
+                profiler.merge_worker_profile(profile)
+            except Exception as e:
+                # 작업 프로세스가 비정상 종료된 경우 (풀이 깨지면 남은 작업도 모두 실패)
+                broken = broken or isinstance(e, BrokenProcessPool)
+                logger.error(f"분석 작업 실패: {path}: {e}")
+                result = {'error': str(e)}
+            if 'error' in result:
+                result = {'file_path': path, 'error': result['error']}
+            results.append(result)
+
+        with self._lock:
+            self.metrics['images'] += len(results)
+            self.metrics['image_errors'] += sum(1 for result in results if 'error' in result)
+        if broken:
+            # 이후 요청이 계속 실패하지 않도록 같은 초기화 함수로 풀을 다시 만듦
+            self._rebuild_executor(executor)
+        return results
+
+    def health(self) -> Dict[str, Any]:
+        """상태 정보 (작업 프로세스 풀을 다시 만드는 중이면 status 가 'degraded')"""
+        degraded = self._rebuilding.is_set() or self._pool_broken()
+        with self._lock:
+            in_flight = self.metrics['in_flight']
+            pool_restarts = self.metrics['pool_restarts']
+        return {
+            'status': 'degraded' if degraded else 'ok',
+            'workers': self.workers,
+            'pool_restarts': pool_restarts,
+            'max_concurrent': self.max_concurrent,
+            'in_flight': in_flight,
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+        }
+
+    def metrics_text(self) -> str:
+        """Prometheus 텍스트 형식 지표"""
+        with self._lock:
+            metrics = dict(self.metrics, requests=dict(self.metrics['requests']))
+        lines = [
+            '# HELP exif_service_requests_total Requests by endpoint.',
+            '# TYPE exif_service_requests_total counter',
+        ]
+        lines += [f'exif_service_requests_total{{endpoint="{endpoint}"}} {count}'
+                  for endpoint, count in sorted(metrics['requests'].items())]
+        for name, kind, value, description in (
+                ('rejected_total', 'counter', metrics['rejected'], 'Requests rejected by the concurrency limit.'),
+                ('errors_total', 'counter', metrics['errors'], 'Requests answered with an error status.'),
+                ('images_total', 'counter', metrics['images'], 'Images analyzed.'),
+                ('image_errors_total', 'counter', metrics['image_errors'], 'Images that failed to analyze.'),
+                ('in_flight', 'gauge', metrics['in_flight'], 'Analysis requests in progress.'),
+                ('analyze_seconds_total', 'counter', round(metrics['seconds'], 6),
+                 'Total time spent serving analysis requests.'),
+                ('pool_restarts_total', 'counter', metrics['pool_restarts'],
+                 'Worker pool rebuilds after a worker process died.'),
+                ('workers', 'gauge', self.workers, 'Worker processes.')):
+            lines += [f'# HELP exif_service_{name} {description}', f'# TYPE exif_service_{name} {kind}',
+                      f'exif_service_{name} {value}']
+        # 작업 프로세스에서 합산한 단계별 소요 시간/카운터
+        return '\n'.join(lines) + '\n' + stage_metrics.prometheus_text()
+
+    def serve(self, host: str = '127.0.0.1', port: int = 8765, socket_path: Optional[str] = None) -> None:
+        """
+        요청 처리 시작 (Ctrl+C 로 종료할 때까지 블록)
+
+        Args:
+            host: 수신 주소 (기본값은 로컬 접속만 허용)
+            port: 수신 포트
+            socket_path: 지정하면 TCP 대신 Unix 도메인 소켓으로 수신
+
+        Raises:
+            FileExistsError: socket_path 에 소켓이 아닌 파일이 이미 있는 경우
+        """
+        if socket_path:
+            # 이전 실행이 남긴 소켓만 지우고 일반 파일 등은 건드리지 않음
+            if _is_socket(socket_path):
+                os.remove(socket_path)
+            elif os.path.lexists(socket_path):
+                raise FileExistsError(f"소켓이 아닌 파일이 이미 있습니다: {socket_path}")
+            server = _UnixHTTPServer(socket_path, _RequestHandler)
+            address = socket_path
+        else:
+            server = ThreadingHTTPServer((host, port), _RequestHandler)
+            address = f"http://{host}:{server.server_address[1]}"
+        server.service = self
+        # SIGTERM 도 Ctrl+C 와 같이 처리해 소켓과 작업 프로세스를 정리하고 종료
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+        logger.info(f"분석 서비스 시작: {address}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            _ignore_stop_signals()
+            server.server_close()
+            if socket_path and _is_socket(socket_path):
+                os.remove(socket_path)
+            logger.info("분석 서비스 종료")
+
+    def close(self) -> None:
+        """작업 프로세스 종료"""
+        _ignore_stop_signals()
+        self.executor.shutdown()
+
+    def __enter__(self) -> 'AnalysisService':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _ignore_stop_signals() -> None:
+    """종료 정리 중 추가 Ctrl+C/SIGTERM 으로 정리가 끊기지 않도록 무시 (신호 처리기는 주 스레드에서만 바꿀 수 있음)"""
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+
+def _is_socket(path: str) -> bool:
+    """경로가 Unix 도메인 소켓인지 여부 (심볼릭 링크는 따라가지 않음)"""
+    try:
+        return stat.S_ISSOCK(os.lstat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix 도메인 소켓으로 수신하는 HTTP 서버"""
+    daemon_threads = True
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """분석 서비스 HTTP 요청 처리
+
+    GET  /health          상태 정보 (JSON)
+    GET  /metrics         지표 (Prometheus 텍스트 형식)
+    POST /analyze         {"path": ..., "reference_location": [위도, 경도], "max_distance": km}
+    POST /analyze/batch   {"paths": [...], "reference_location": ..., "max_distance": ...}
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def address_string(self) -> str:
+        # Unix 소켓 연결은 클라이언트 주소가 없음
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self) -> None:
+        service = self.server.service
+        self._count(self.path)
+        if self.path == '/health':
+            self._send_json(200, service.health())
+        elif self.path == '/metrics':
+            self._send(200, service.metrics_text().encode('utf-8'), 'text/plain; version=0.0.4')
+        else:
+            self._send_json(404, {'error': f"알 수 없는 경로: {self.path}"})
+
+    def do_POST(self) -> None:
+        service = self.server.service
+        self._count(self.path)
+        if self.path not in ('/analyze', '/analyze/batch'):
+            self._send_json(404, {'error': f"알 수 없는 경로: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length) or b'{}')
+            reference_location = request.get('reference_location')
+            if reference_location is not None:
+                reference_location = (float(reference_location[0]), float(reference_location[1]))
+            max_distance = request.get('max_distance')
+            max_distance = float(max_distance) if max_distance is not None else None
+            if self.path == '/analyze':
+                paths = [request['path']]
+            else:
+                paths = request['paths']
+            if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+                raise ValueError("paths 는 문자열 목록이어야 합니다")
+        except (ValueError, KeyError, TypeError, IndexError, AttributeError) as e:
+            self._send_json(400, {'error': f"잘못된 요청: {e}"})
+            return
+        if len(paths) > service.max_batch:
+            self._send_json(413, {'error': f"한 요청의 경로는 최대 {service.max_batch}개입니다"})
+            return
+
+        # 동시 처리 한도를 넘으면 대기열에 쌓지 않고 바로 거절 (호출 측에서 재시도)
+        if not service._slots.acquire(blocking=False):
+            with service._lock:
+                service.metrics['rejected'] += 1
+            self._send_json(503, {'error': "처리 중인 요청이 많습니다. 잠시 후 다시 시도하세요."},
+                            {'Retry-After': '1'})
+            return
+
+        start = time.perf_counter()
+        with service._lock:
+            service.metrics['in_flight'] += 1
+        try:
+            results = service.analyze_batch(paths, reference_location, max_distance)
+        finally:
+            service._slots.release()
+            with service._lock:
+                service.metrics['in_flight'] -= 1
+                service.metrics['seconds'] += time.perf_counter() - start
+
+        if self.path == '/analyze':
+            self._send_json(422 if 'error' in results[0] else 200, results[0])
+        else:
+            self._send_json(200, {'results': results})
+
+    def _count(self, endpoint: str) -> None:
+        """엔드포인트별 요청 수 집계 (알 수 없는 경로는 하나로 묶음)"""
+        if endpoint not in ('/health', '/metrics', '/analyze', '/analyze/batch'):
+            endpoint = 'other'
+        service = self.server.service
+        with service._lock:
+            service.metrics['requests'][endpoint] = service.metrics['requests'].get(endpoint, 0) + 1
+
+    def _send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        self._send(status, json.dumps(body, ensure_ascii=False, default=str).encode('utf-8'),
+                   'application/json; charset=utf-8', headers)
+
+    def _send(self, status: int, payload: bytes, content_type: str,
+              headers: Optional[Dict[str, str]] = None) -> None:
+        if status >= 400:
+            service = self.server.service
+            with service._lock:
+                service.metrics['errors'] += 1
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
@@ -0,0 +1,120 @@
+import io
+import os
+import logging
+import tarfile
+import zipfile
+import threading
+from typing import Any, Callable, Iterator, List, Tuple, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveReader:
+    """ZIP/TAR 증거 아카이브의 이미지 멤버를 디스크에 풀지 않고 읽는 클래스"""
+
+    ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+    # 결과 경로에서 아카이브와 멤버를 구분하는 문자
+    MEMBER_SEPARATOR = '!'
+
+    def __init__(self, archive_path: str):
+        """
+        초기화 메서드
+
+        Args:
+            archive_path: ZIP 또는 TAR 아카이브 경로
+        """
+        self.archive_path = archive_path
+        self.kind = 'zip' if archive_path.lower().endswith('.zip') else 'tar'
+        # 압축되지 않은 TAR 와 ZIP 은 멤버 단위 임의 접근이 가능
+        self.seekable = self.kind == 'zip' or archive_path.lower().endswith('.tar')
+        self._local = threading.local()
+        self._handles = []
+        self._handles_lock = threading.Lock()
+
+    @classmethod
+    def is_archive(cls, path: str) -> bool:
+        """
+        지원되는 아카이브 파일인지 확인
+
+        Args:
+            path: 확인할 파일 경로
+
+        Returns:
+            bool: 아카이브이면 True
+        """
+        return os.path.isfile(path) and path.lower().endswith(cls.ARCHIVE_EXTENSIONS)
+
+    def member_path(self, member_name: str) -> str:
+        """결과에 기록할 'archive!member' 경로"""
+        return f"{self.archive_path}{self.MEMBER_SEPARATOR}{member_name}"
+
+    def iter_members(self, accept: Callable[[str], bool]) -> Iterator[Tuple[str, Callable[[], BinaryIO]]]:
+        """
+        accept 를 통과한 멤버를 순서대로 반환
+
+        임의 접근이 가능한 아카이브는 작업 스레드에서 필요한 부분만 읽도록
+        열기 함수를 넘기고, 압축 TAR 는 스트림 순서대로 멤버를 메모리에 읽어 넘김
+
+        Args:
+            accept: 멤버 이름을 받아 분석 대상 여부를 반환하는 함수
+
+        Yields:
+            Tuple: (멤버 이름, 바이너리 파일 객체를 여는 함수)
+        """
+        if self.seekable:
+            for name, info in self._list_members():
+                if accept(name):
+                    yield name, (lambda info=info: self._open_member(info))
+            return
+
+        with tarfile.open(self.archive_path, 'r|*') as archive:
+            for member in archive:
+                if not member.isfile() or not accept(member.name):
+                    continue
+                data = archive.extractfile(member).read()
+                yield member.name, (lambda data=data: io.BytesIO(data))
+
+    def close(self) -> None:
+        """작업 스레드에서 연 아카이브 핸들을 모두 닫음"""
+        with self._handles_lock:
+            for handle in self._handles:
+                handle.close()
+            self._handles = []
+        self._local = threading.local()
+
+    def _list_members(self) -> List[Tuple[str, Any]]:
+        """
+        임의 접근 가능한 아카이브의 파일 멤버 목록
+
+        헤더는 여기서 한 번만 읽고, 멤버는 이름이 아닌 ZipInfo/TarInfo 로 열어
+        (tarfile 의 이름 조회는 멤버 목록 전체를 역순으로 탐색하고 같은 이름이면 마지막 멤버를 반환함)
+        스레드별 핸들이 헤더를 다시 읽지 않고 데이터 위치로 바로 이동하게 함
+
+        Returns:
+            List[Tuple]: (멤버 이름, ZipInfo 또는 TarInfo)
+        """
+        archive = self._get_handle()
+        if self.kind == 'zip':
+            return [(info.filename, info) for info in archive.infolist() if not info.is_dir()]
+        return [(member.name, member) for member in archive.getmembers() if member.isfile()]
+
+    def _open_member(self, info) -> BinaryIO:
+        """현재 스레드의 아카이브 핸들로 멤버(ZipInfo/TarInfo)를 탐색 가능한 스트림으로 열기"""
+        archive = self._get_handle()
+        if self.kind == 'zip':
+            return archive.open(info)
+        return archive.extractfile(info)
+
+    def _get_handle(self):
+        """스레드별 아카이브 핸들 (zipfile/tarfile 객체는 스레드 간 공유하지 않음)"""
+        handle = getattr(self._local, 'handle', None)
+        if handle is None:
+            if self.kind == 'zip':
+                handle = zipfile.ZipFile(self.archive_path)
+            else:
+                handle = tarfile.open(self.archive_path, 'r:')
+            self._local.handle = handle
+            with self._handles_lock:
+                self._handles.append(handle)
+        return handle
@@ -1,10 +1,16 @@
 import os
 import logging
-from typing import Dict, Any, List, Tuple, Optional
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, List, Tuple, Optional
+from components.archivereader import ArchiveReader
 from components.exifextractor import ExifExtractor
 from components.locationvalidator import LocationValidator
 from components.timeanalyzer import TimeAnalyzer
 from components.reportgenerator import ReportGenerator
+from components.taskgraph import TaskGraph
+from components.metrics import metrics, timed
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +34,61 @@ class ExifAnalyzer:
         self.report_generator = ReportGenerator(output_dir)
         
         self.results = []
+        self.report_timings = {}
+        self.result_listeners = []
+        # False 이면 결과를 메모리에 모으지 않고 등록된 함수에만 전달 (스트리밍 출력 시 메모리 사용량 고정)
+        self.retain_results = True
+        self.result_count = 0
+        self.progress_listeners = []
+        # 설정되면 진행 중인 analyze_* 가 다음 이미지부터 중단하고 그때까지의 결과를 반환 (GUI 취소 등)
+        self.cancel_event = threading.Event()
         logger.info(f"ExifAnalyzer 초기화 완료 (출력 디렉토리: {output_dir})")
     
+    def add_result_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        분석이 끝난 결과를 즉시 전달받을 함수 등록 (결과 내보내기 등)
+        
+        Args:
+            listener: 분석 결과 한 건을 받는 함수 (분석 스레드가 아닌 호출 스레드에서 순서대로 호출됨)
+        """
+        self.result_listeners.append(listener)
+    
+    def add_progress_listener(self, listener: Callable[[int, Optional[int]], None]) -> None:
+        """
+        이미지 한 건을 처리할 때마다(실패 포함) 진행 상황을 전달받을 함수 등록
+        
+        Args:
+            listener: (처리한 이미지 수, 전체 이미지 수 또는 알 수 없으면 None) 을 받는 함수
+        """
+        self.progress_listeners.append(listener)
+    
+    def _report_progress(self, done: int, total: Optional[int]) -> None:
+        """등록된 함수에 진행 상황 전달"""
+        for listener in self.progress_listeners:
+            try:
+                listener(done, total)
+            except Exception as e:
+                logger.error(f"진행 상황 전달 중 오류 발생: {e}")
+    
+    def _collect(self, results: List[Dict[str, Any]], result: Dict[str, Any]) -> None:
+        """
+        분석 결과를 등록된 함수에 전달하고 목록에 추가 (전달 실패해도 분석은 계속 진행)
+
+        출력을 읽던 쪽이 종료되면(BrokenPipeError) 결과를 세지 않고 예외를 그대로 올려
+        analyze_* 가 분석을 조용히 중단하게 함
+        """
+        for listener in self.result_listeners:
+            try:
+                listener(result)
+            except BrokenPipeError:
+                raise
+            except Exception as e:
+                logger.error(f"분석 결과 전달 중 오류 발생: {e}")
+        self.result_count += 1
+        if self.retain_results:
+            results.append(result)
+    
+    @timed('analyze_image')
     def analyze_image(self, image_path: str, reference_location: Tuple[float, float] = None,
                      max_distance: float = 1.0) -> Dict[str, Any]:
         """
@@ -44,34 +103,121 @@ class ExifAnalyzer:
             Dict: 분석 결과
         """
         try:
-            logger.info(f"이미지 분석 시작: {image_path}")
+            logger.debug(f"이미지 분석 시작: {image_path}")
             
             # EXIF 데이터 추출
             exif_data = self.extractor.extract_exif(image_path)
-            if not exif_data:
-                logger.warning(f"EXIF 데이터를 추출할 수 없음: {image_path}")
-                return {'error': 'EXIF 데이터 없음'}
+            return self._analyze_exif(exif_data, image_path, reference_location, max_distance)
             
-            # 위치 검증
-            location_result = self.location_validator.validate_location(
-                exif_data, reference_location, max_distance)
+        except Exception as e:
+            metrics.error('analyze_image')
+            logger.error(f"이미지 분석 중 오류 발생: {e}")
+            return {'error': str(e)}
+    
+    def _analyze_exif(self, exif_data: Dict[str, Any], image_path: str,
+                      reference_location: Tuple[float, float] = None,
+                      max_distance: float = 1.0) -> Dict[str, Any]:
+        """
+        추출된 EXIF 데이터에 위치 검증과 시간 분석을 수행
+        
+        Args:
+            exif_data: 추출된 EXIF 데이터
+            image_path: 로그 표시용 이미지 경로
+            reference_location: 기준 위치 (위도, 경도)
+            max_distance: 허용 최대 거리 (km)
             
-            # 시간 정보 분석
-            time_result = self.time_analyzer.analyze_time_consistency(exif_data)
+        Returns:
+            Dict: 분석 결과
+        """
+        if not exif_data:
+            # 이미지마다 흔한 상황이므로 개별 로그는 DEBUG 로 두고 건수는 지표로 집계
+            metrics.increment('images_without_exif')
+            logger.debug(f"EXIF 데이터를 추출할 수 없음: {image_path}")
+            return {'error': 'EXIF 데이터 없음'}
+        
+        # 위치 검증
+        location_result = self.location_validator.validate_location(
+            exif_data, reference_location, max_distance)
+        
+        # 시간 정보 분석
+        time_result = self.time_analyzer.analyze_time_consistency(exif_data)
+        
+        # 분석 결과 취합
+        result = {
+            'exif_data': exif_data,
+            'location_result': location_result,
+            'time_result': time_result
+        }
+        
+        logger.debug(f"이미지 분석 완료: {image_path}")
+        return result
+    
+    def analyze_archive(self, archive_path: str, reference_location: Tuple[float, float] = None,
+                        max_distance: float = 1.0, workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        ZIP/TAR 아카이브 내 모든 이미지를 디스크에 풀지 않고 분석
+        
+        Args:
+            archive_path: 분석할 아카이브 경로
+            reference_location: 기준 위치 (위도, 경도)
+            max_distance: 허용 최대 거리 (km)
+            workers: 동시에 분석할 멤버 수
             
-            # 분석 결과 취합
-            result = {
-                'exif_data': exif_data,
-                'location_result': location_result,
-                'time_result': time_result
-            }
+        Returns:
+            List[Dict]: 분석 결과 목록 (file_path 는 'archive!member' 형식)
+        """
+        results = []
+        self.result_count = 0
+        self.extractor.reset_format_stats()
+        archive = ArchiveReader(archive_path)
+        
+        def analyze_member(name, open_member):
+            image_path = archive.member_path(name)
+            try:
+                with open_member() as f:
+                    exif_data = self.extractor.extract_exif_from_stream(
+                        f, image_path, os.path.basename(name))
+                return self._analyze_exif(exif_data, image_path, reference_location, max_distance)
+            except Exception as e:
+                logger.error(f"아카이브 멤버 분석 중 오류 발생: {image_path}: {e}")
+                return {'error': str(e)}
+        
+        try:
+            # 메모리 사용을 제한하기 위해 진행 중인 작업 수를 workers 의 2배로 유지
+            pending = deque()
+            done = 0
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                for name, open_member in archive.iter_members(self.extractor.is_supported_format):
+                    if self.cancel_event.is_set():
+                        logger.info(f"아카이브 분석 취소됨: {archive_path}")
+                        break
+                    pending.append(executor.submit(analyze_member, name, open_member))
+                    if len(pending) >= max(1, workers) * 2:
+                        result = pending.popleft().result()
+                        done += 1
+                        if 'error' not in result:
+                            self._collect(results, result)
+                        self._report_progress(done, None)
+                while pending:
+                    result = pending.popleft().result()
+                    done += 1
+                    if 'error' not in result:
+                        self._collect(results, result)
+                    self._report_progress(done, None)
             
-            logger.info(f"이미지 분석 완료: {image_path}")
-            return result
+            logger.info(f"{self.result_count}개의 이미지 분석 완료: {archive_path}")
+            self.results = results
+            return results
             
+        except BrokenPipeError:
+            logger.info(f"출력이 닫혀 아카이브 분석 중단: {archive_path} ({self.result_count}개 전달)")
+            self.results = results
+            return results
         except Exception as e:
-            logger.error(f"이미지 분석 중 오류 발생: {e}")
-            return {'error': str(e)}
+            logger.error(f"아카이브 분석 중 오류 발생: {e}")
+            return results
+        finally:
+            archive.close()
     
     def analyze_directory(self, directory_path: str, reference_location: Tuple[float, float] = None,
                          max_distance: float = 1.0) -> List[Dict[str, Any]]:
@@ -87,14 +233,17 @@ class ExifAnalyzer:
             List[Dict]: 분석 결과 목록
         """
         results = []
+        self.result_count = 0
+        self.extractor.reset_format_stats()
         
         try:
             if not os.path.isdir(directory_path):
                 logger.error(f"유효한 디렉토리가 아님: {directory_path}")
                 return results
             
+            # 실행마다 같은 순서로 분석하도록 정렬 (보고서 볼륨/샤드가 이전 실행의 조각을 재사용할 수 있음)
             image_files = []
-            for file in os.listdir(directory_path):
+            for file in sorted(os.listdir(directory_path)):
                 file_path = os.path.join(directory_path, file)
                 if os.path.isfile(file_path) and self.extractor.is_supported_format(file_path):
                     image_files.append(file_path)
@@ -102,24 +251,84 @@ class ExifAnalyzer:
             logger.info(f"{len(image_files)}개의 이미지 파일 발견: {directory_path}")
             
             # 각 이미지 분석
-            for image_path in image_files:
+            for done, image_path in enumerate(image_files, 1):
+                if self.cancel_event.is_set():
+                    logger.info(f"디렉토리 분석 취소됨: {directory_path} ({done - 1}/{len(image_files)})")
+                    break
                 result = self.analyze_image(image_path, reference_location, max_distance)
                 if 'error' not in result:
-                    results.append(result)
+                    self._collect(results, result)
+                self._report_progress(done, len(image_files))
             
             self.results = results
+            for format_name, stats in self.extractor.get_format_stats().items():
+                logger.info(f"형식별 처리 통계 - {format_name}: {stats['count']}개, "
+                            f"{stats['seconds']:.2f}초 (평균 {stats['avg_ms']:.1f}ms)")
             return results
             
+        except BrokenPipeError:
+            logger.info(f"출력이 닫혀 디렉토리 분석 중단: {directory_path} ({self.result_count}개 전달)")
+            self.results = results
+            return results
         except Exception as e:
             logger.error(f"디렉토리 분석 중 오류 발생: {e}")
             return results
     
-    def generate_reports(self, output_format: str = 'all') -> Dict[str, str]:
+    def analyze_paths(self, entries: Iterable[Tuple[str, Dict[str, Any]]],
+                      reference_location: Tuple[float, float] = None,
+                      max_distance: float = 1.0) -> List[Dict[str, Any]]:
+        """
+        경로 목록(매니페스트/표준 입력)을 디렉토리 탐색 없이 순서대로 분석
+        
+        Args:
+            entries: (이미지 경로, 메타데이터 열) 튜플을 지연 생성하는 이터러블
+            reference_location: 기준 위치 (위도, 경도)
+            max_distance: 허용 최대 거리 (km)
+            
+        Returns:
+            List[Dict]: 분석 결과 목록 (메타데이터 열은 'manifest' 키에 기록)
+        """
+        results = []
+        self.result_count = 0
+        self.extractor.reset_format_stats()
+        
+        # 목록 길이를 알 수 있으면(리스트 등) 진행률에 사용, 스트림이면 None
+        total = len(entries) if hasattr(entries, '__len__') else None
+        
+        try:
+            for done, (image_path, metadata) in enumerate(entries, 1):
+                if self.cancel_event.is_set():
+                    logger.info("경로 목록 분석 취소됨")
+                    break
+                result = self.analyze_image(image_path, reference_location, max_distance)
+                if 'error' not in result:
+                    if metadata:
+                        result['manifest'] = metadata
+                    self._collect(results, result)
+                self._report_progress(done, total)
+            
+            logger.info(f"{self.result_count}개의 이미지 분석 완료 (경로 목록)")
+            self.results = results
+            return results
+            
+        except BrokenPipeError:
+            logger.info(f"출력이 닫혀 경로 목록 분석 중단 ({self.result_count}개 전달)")
+            self.results = results
+            return results
+        except Exception as e:
+            logger.error(f"경로 목록 분석 중 오류 발생: {e}")
+            return results
+    
+    def generate_reports(self, output_format: str = 'all', pdf_volume_size: int = 0,
+                         workers: int = 1, html_shard_size: int = 0) -> Dict[str, str]:
         """
         분석 결과 보고서 생성
         
         Args:
             output_format: 출력 형식 ('pdf', 'html', 'all')
+            pdf_volume_size: 0보다 크면 PDF 를 평균 해당 이미지 수 단위의 볼륨과 색인으로 분할
+            workers: 전체 프로세스 수 (산출물 동시 생성과 PDF 볼륨/HTML 샤드 작성에 나눠 사용)
+            html_shard_size: 0보다 크면 HTML 을 색인 페이지와 평균 해당 이미지 수 단위의 샤드로 분할
             
         Returns:
             Dict: 생성된 보고서 파일 경로
@@ -131,45 +340,106 @@ class ExifAnalyzer:
         reports = {}
         
         try:
-            # 지도 생성
-            coordinates_list = []
-            labels = []
+            coordinates_list, labels = LocationValidator.collect_map_points(self.results)
             
-            for result in self.results:
-                exif_data = result.get('exif_data', {})
-                if 'gps' in exif_data and 'coordinates' in exif_data['gps']:
-                    coordinates_list.append(exif_data['gps']['coordinates'])
-                    labels.append(exif_data.get('file_name', 'unknown'))
+            want_pdf = output_format in ['pdf', 'all']
+            want_html = output_format in ['html', 'all']
             
-            map_path = None
+            # 그래프 작업 프로세스 수 x 볼륨/샤드 작성 프로세스 수가 workers 를 넘지 않도록 나눔
+            # (작업 수만큼 그래프 프로세스가 뜨면 볼륨/샤드는 각 작업 안에서 순차 작성)
+            graph_workers = min(max(1, workers), bool(coordinates_list) + 1 + want_pdf + want_html)
+            writer_workers = max(1, workers) // graph_workers
+            
+            # 작업마다 전체 결과 대신 읽는 필드만 넘겨 프로세스 간 피클링 양을 줄임
+            report_results = _report_view(self.results, REPORT_EXIF_KEYS)
+            
+            # 산출물은 서로 독립적이며 HTML 만 지도 경로에 의존
+            # (지도는 GUI 등에서 같은 좌표로 이미 만들었으면 재사용됨)
+            graph = TaskGraph()
             if coordinates_list:
-                map_path = self.location_validator.create_map(
-                    coordinates_list, labels, 
-                    os.path.join(self.output_dir, 'location_map.html')
-                )
-                reports['map'] = map_path
-            
-            # 시각화 생성
-            vis_path = self.report_generator.generate_data_visualization(
-                self.results, os.path.join(self.output_dir, 'visualization.png'))
-            reports['visualization'] = vis_path
-            
-            # PDF 보고서
-            if output_format in ['pdf', 'all']:
-                pdf_path = self.report_generator.generate_pdf_report(
-                    self.results, os.path.join(self.output_dir, 'exif_report.pdf'))
-                reports['pdf'] = pdf_path
-            
-            # HTML 보고서
-            if output_format in ['html', 'all']:
-                html_path = self.report_generator.generate_html_report(
-                    self.results, map_path, 
-                    os.path.join(self.output_dir, 'exif_report.html'))
-                reports['html'] = html_path
-            
-            logger.info(f"보고서 생성 완료: {', '.join(reports.keys())}")
+                graph.add('map', _build_map, (self.output_dir, coordinates_list, labels))
+            graph.add('visualization', _build_visualization,
+                      (self.output_dir, _report_view(self.results, VISUALIZATION_EXIF_KEYS)))
+            if want_pdf:
+                graph.add('pdf', _build_pdf_report,
+                          (self.output_dir, report_results, pdf_volume_size, writer_workers))
+            if want_html:
+                graph.add('html', _build_html_report,
+                          (self.output_dir, report_results, html_shard_size, writer_workers), deps=['map'])
+            
+            outputs, timings, errors = graph.run(graph_workers)
+            self.report_timings = timings
+            
+            for name in ('map', 'visualization', 'pdf', 'html'):
+                if name in outputs and name not in errors:
+                    reports[name] = outputs[name]
+            
+            logger.info(f"보고서 생성 완료: {', '.join(reports.keys())} "
+                        f"({', '.join(f'{k} {v:.2f}초' for k, v in timings.items())})")
             return reports
             
         except Exception as e:
             logger.error(f"보고서 생성 중 오류 발생: {e}")
-            return reports
\ No newline at end of file
+            return reports
+
+
+# 보고서 작업이 읽는 exif_data 필드 (나머지 태그(other) 등은 작업 프로세스로 보내지 않음)
+REPORT_EXIF_KEYS = ('file_name', 'file_path', 'camera', 'gps', 'image')
+VISUALIZATION_EXIF_KEYS = ('camera', 'gps')
+
+
+def _report_view(results: List[Dict[str, Any]], exif_keys: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    """
+    보고서 작업에 넘길 결과 목록 (exif_data 는 지정한 필드만 남김)
+
+    Args:
+        results: 분석 결과 목록
+        exif_keys: 남길 exif_data 필드
+
+    Returns:
+        List[Dict]: exif_data/location_result/time_result 만 담은 결과 목록
+    """
+    view = []
+    for result in results:
+        exif_data = result.get('exif_data', {})
+        view.append({
+            'exif_data': {key: exif_data[key] for key in exif_keys if key in exif_data},
+            'location_result': result.get('location_result', {}),
+            'time_result': result.get('time_result', {}),
+        })
+    return view
+
+
+def _build_map(output_dir: str, coordinates_list: List[Tuple[float, float]],
+               labels: List[str], deps: Dict[str, Any]) -> str:
+    """지도 산출물 작업 (TaskGraph 작업 단위)"""
+    return LocationValidator().create_map(
+        coordinates_list, labels, os.path.join(output_dir, 'location_map.html'))
+
+
+def _build_visualization(output_dir: str, results: List[Dict[str, Any]], deps: Dict[str, Any]) -> str:
+    """시각화 산출물 작업 (TaskGraph 작업 단위)"""
+    return ReportGenerator(output_dir).generate_data_visualization(
+        results, os.path.join(output_dir, 'visualization.png'))
+
+
+def _build_pdf_report(output_dir: str, results: List[Dict[str, Any]], pdf_volume_size: int,
+                      workers: int, deps: Dict[str, Any]) -> str:
+    """PDF 보고서 산출물 작업 (TaskGraph 작업 단위)"""
+    report_generator = ReportGenerator(output_dir)
+    if pdf_volume_size > 0:
+        return report_generator.generate_pdf_volumes(
+            results, pdf_volume_size, workers, os.path.join(output_dir, 'exif_report'))['index']
+    return report_generator.generate_pdf_report(results, os.path.join(output_dir, 'exif_report.pdf'))
+
+
+def _build_html_report(output_dir: str, results: List[Dict[str, Any]], html_shard_size: int,
+                       workers: int, deps: Dict[str, Any]) -> str:
+    """HTML 보고서 산출물 작업 (TaskGraph 작업 단위, 지도 작업 결과를 사용)"""
+    report_generator = ReportGenerator(output_dir)
+    map_path = deps.get('map') or None
+    output_file = os.path.join(output_dir, 'exif_report.html')
+    if html_shard_size > 0:
+        return report_generator.generate_sharded_html_report(
+            results, map_path, output_file, html_shard_size, workers)
+    return report_generator.generate_html_report(results, map_path, output_file)
@@ -1,8 +1,15 @@
+import io
 import os
+import time
 import logging
-from PIL import Image
 import exifread
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO, Optional, Tuple, TYPE_CHECKING
+from components.formatreader import FormatRegistry, read_exif_thumbnail
+from components.metrics import metrics
+
+# PIL 은 미리보기에서만 사용하므로 필요할 때 임포트
+if TYPE_CHECKING:
+    from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -12,11 +19,14 @@ class ExifExtractor:
     def __init__(self):
         """초기화 메서드"""
         self.supported_formats = ['.jpg', '.jpeg', '.tiff', '.tif', '.png', '.heic']
+        # 확장자가 아닌 파일 내용으로 형식을 판별하는 리더 레지스트리
+        self.format_registry = FormatRegistry()
         logger.info("ExifExtractor 초기화 완료")
     
     def is_supported_format(self, file_path: str) -> bool:
         """
-        지원되는 이미지 형식인지 확인
+        지원되는 이미지 형식인지 확인 (디렉토리 탐색용 확장자 사전 필터,
+        실제 형식은 extract_exif 에서 파일 내용으로 판별)
         
         Args:
             file_path: 확인할 파일 경로
@@ -41,35 +51,160 @@ class ExifExtractor:
             logger.error(f"파일이 존재하지 않습니다: {file_path}")
             return {}
             
-        if not self.is_supported_format(file_path):
-            logger.warning(f"지원되지 않는 이미지 형식: {file_path}")
-            return {}
-        
         try:
-            # exifread를 사용한 EXIF 추출
             with open(file_path, 'rb') as f:
-                tags = exifread.process_file(f, details=True)
+                return self.extract_exif_from_stream(f, file_path)
+        except Exception as e:
+            logger.error(f"EXIF 추출 중 오류 발생: {e}")
+            return {}
+    
+    def extract_exif_from_stream(self, f: BinaryIO, file_path: str,
+                                 file_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        열린 바이너리 스트림(아카이브 멤버 등)에서 EXIF 데이터를 추출
+        
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+            file_path: 결과에 기록할 경로 (아카이브 멤버는 'archive!member')
+            file_name: 결과에 기록할 파일명 (생략 시 file_path 의 basename)
             
-            # Pillow를 사용한 추가 이미지 정보 추출
-            img = Image.open(file_path)
-            img_info = {
-                'format': img.format,
-                'mode': img.mode,
-                'size': img.size,
-            }
+        Returns:
+            Dict: 추출된 EXIF 데이터
+        """
+        start = time.perf_counter()
+        try:
+            tags, img_info = self._read_metadata(f, file_path)
+            metrics.increment('files')
+            # 읽은 위치까지를 읽은 바이트로 근사 (리더가 건너뛴 부분도 포함될 수 있음)
+            metrics.increment('bytes_read', f.tell())
+            if img_info is None:
+                metrics.increment('files_rejected')
+                return {}
             
             # 추출한 EXIF 데이터 전처리
             exif_data = self._process_exif_tags(tags)
             exif_data['image_info'] = img_info
             exif_data['file_path'] = file_path
-            exif_data['file_name'] = os.path.basename(file_path)
+            exif_data['file_name'] = file_name or os.path.basename(file_path)
             
-            logger.info(f"EXIF 데이터 추출 성공: {file_path}")
+            logger.debug(f"EXIF 데이터 추출 성공: {file_path}")
             return exif_data
             
         except Exception as e:
+            metrics.error('extract')
             logger.error(f"EXIF 추출 중 오류 발생: {e}")
             return {}
+        finally:
+            metrics.observe('extract', time.perf_counter() - start)
+    
+    def _read_metadata(self, f: BinaryIO, file_path: str):
+        """
+        파일 앞부분으로 실제 형식을 판별하고 해당 형식의 리더로 메타데이터를 읽음
+        
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+            file_path: 로그 표시용 파일 경로
+            
+        Returns:
+            Tuple: (exifread 원시 태그, 이미지 정보) - 이미지가 아니면 ({}, None)
+        """
+        start = time.perf_counter()
+        reader = self.format_registry.sniff_file(f)
+        if reader is None:
+            self.format_registry.record('rejected', time.perf_counter() - start)
+            logger.warning(f"지원되지 않는 이미지 형식: {file_path}")
+            return {}, None
+        
+        info = reader.read(f)
+        if reader.embeds_tiff:
+            # 파일 자체가 TIFF 스트림이므로 exifread 에 그대로 전달
+            f.seek(0)
+            tags = exifread.process_file(f, details=True)
+        elif info['exif']:
+            tags = exifread.process_file(io.BytesIO(info['exif']), details=True)
+        else:
+            tags = {}
+        
+        img_info = {
+            'format': info['format'],
+            'mode': info['mode'],
+            'size': info['size'],
+        }
+        self.format_registry.record(reader.format_name, time.perf_counter() - start)
+        return tags, img_info
+    
+    def extract_thumbnail(self, file_path: str) -> Optional[bytes]:
+        """
+        EXIF IFD1 에 내장된 JPEG 썸네일을 픽셀 디코딩 없이 추출
+        
+        Args:
+            file_path: 이미지 파일 경로
+            
+        Returns:
+            Optional[bytes]: JPEG 썸네일 바이트 또는 None
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                reader = self.format_registry.sniff_file(f)
+                if reader is None:
+                    return None
+                if reader.embeds_tiff:
+                    return read_exif_thumbnail(f)
+                info = reader.read(f)
+            if not info['exif']:
+                return None
+            return read_exif_thumbnail(io.BytesIO(info['exif']))
+        except Exception as e:
+            logger.error(f"썸네일 추출 중 오류 발생: {e}")
+            return None
+    
+    def load_preview(self, file_path: str, max_size: Tuple[int, int]) -> Optional['Image.Image']:
+        """
+        미리보기용 축소 이미지 생성
+        
+        내장 썸네일이 있으면 그것만 디코딩하고, 없으면 Image.draft 로
+        축소 디코딩(JPEG DCT 스케일링)한 뒤 max_size 에 맞춤
+        
+        Args:
+            file_path: 이미지 파일 경로
+            max_size: 최대 (폭, 높이)
+            
+        Returns:
+            Optional[Image.Image]: 비율을 유지해 max_size 에 맞춘 이미지 또는 None
+        """
+        try:
+            from PIL import Image
+            
+            thumbnail = self.extract_thumbnail(file_path)
+            if thumbnail:
+                image = Image.open(io.BytesIO(thumbnail))
+            else:
+                image = Image.open(file_path)
+                image.draft('RGB', max_size)
+            image.load()
+            
+            # 비율 유지하며 max_size 에 맞춤 (작은 내장 썸네일은 확대)
+            ratio = min(max_size[0] / image.width, max_size[1] / image.height)
+            new_size = (max(1, int(image.width * ratio)), max(1, int(image.height * ratio)))
+            if new_size != image.size:
+                image = image.resize(new_size, Image.BILINEAR)
+            return image
+        except Exception as e:
+            logger.error(f"미리보기 생성 중 오류 발생: {e}")
+            return None
+    
+    def get_format_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        형식별 처리 건수와 소요 시간 통계
+        
+        Returns:
+            Dict: {형식: {'count', 'seconds', 'avg_ms'}}
+        """
+        return self.format_registry.get_stats()
+    
+    def reset_format_stats(self) -> None:
+        """형식별 통계 초기화 (분석 실행마다 호출해 이전 실행 통계가 섞이지 않게 함)"""
+        self.format_registry.reset_stats()
     
     def _process_exif_tags(self, tags: Dict) -> Dict[str, Any]:
         """
@@ -0,0 +1,187 @@
+import os
+import sys
+import json
+import select
+import logging
+from typing import Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class FolderWatcher:
+    """감시 폴더에서 새로 들어오거나 수정된 이미지 파일을 찾는 클래스 (inotify 이벤트 대기, 없으면 scandir 폴링)"""
+
+    # inotify 이벤트 (쓰기 후 닫힘, 폴더로 이동됨)
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+
+    def __init__(self, directory: str, is_supported: Callable[[str], bool], state_path: Optional[str] = None,
+                 poll_interval: float = 2.0, rescan_interval: float = 300.0):
+        """
+        초기화 메서드
+
+        Args:
+            directory: 감시할 디렉토리
+            is_supported: 분석 대상 파일이면 True 를 반환하는 함수
+            state_path: 분석을 마친 파일 스냅샷 저장 경로 (재시작 시 이미 분석한 파일은 건너뜀)
+            poll_interval: 폴링 주기 및 파일 복사가 끝났는지 다시 확인하는 간격 (초)
+            rescan_interval: inotify 사용 시 놓친 이벤트에 대비해 전체를 다시 확인하는 간격 (초)
+        """
+        self.directory = directory
+        self.is_supported = is_supported
+        self.state_path = state_path
+        self.poll_interval = poll_interval
+        self.rescan_interval = rescan_interval
+        self.snapshot = {}  # 분석을 마친 파일 경로 -> (수정 시각 ns, 크기)
+        self.pending = {}   # 새로 보였지만 아직 복사 중일 수 있는 파일 경로 -> (수정 시각 ns, 크기)
+        self._ready = {}    # scan 이 반환했고 commit 을 기다리는 파일 경로 -> (수정 시각 ns, 크기)
+        self._inotify_fd = self._open_inotify()
+        # wake() 가 쓰면 wait 가 바로 반환되는 파이프 (신호 처리기에서 대기를 깨울 때 사용)
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+
+        if state_path and os.path.exists(state_path):
+            try:
+                with open(state_path, 'r', encoding='utf-8') as f:
+                    self.snapshot = {path: tuple(stat) for path, stat in json.load(f).items()}
+                logger.info(f"감시 상태 불러옴: 분석된 파일 {len(self.snapshot)}개 ({state_path})")
+            except (OSError, ValueError) as e:
+                logger.warning(f"감시 상태 파일을 읽지 못해 처음부터 분석합니다: {e}")
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify_fd is not None
+
+    def _open_inotify(self) -> Optional[int]:
+        """inotify 감시 등록 (사용할 수 없으면 None 을 반환하고 폴링으로 동작)"""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            import ctypes
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+            wd = libc.inotify_add_watch(fd, os.fsencode(self.directory), self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+            if wd < 0:
+                os.close(fd)
+                raise OSError(ctypes.get_errno(), "inotify_add_watch 실패")
+            return fd
+        except (OSError, AttributeError) as e:
+            logger.warning(f"inotify 를 사용할 수 없어 폴링으로 감시합니다: {e}")
+            return None
+
+    def scan(self) -> List[str]:
+        """
+        분석할 파일 찾기
+
+        이전 확인 때와 (수정 시각, 크기) 가 같은 파일만 복사가 끝난 것으로 보고 반환하며,
+        반환된 파일은 분석 후 commit 해야 다음 확인에서 제외됨
+
+        Returns:
+            List[str]: 새로 들어오거나 수정된 파일 경로 (수정 시각 순)
+        """
+        seen = {}
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.is_file() and self.is_supported(entry.path):
+                    stat = entry.stat()
+                    seen[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        ready = []
+        pending = {}
+        for path, stat in seen.items():
+            if self.snapshot.get(path) == stat:
+                continue
+            if self.pending.get(path) == stat:
+                ready.append(path)
+            else:
+                pending[path] = stat
+        self.pending = pending
+
+        # 삭제된 파일은 스냅샷에서 제거 (같은 이름으로 다시 들어오면 새 파일로 분석)
+        removed = [path for path in self.snapshot if path not in seen]
+        for path in removed:
+            del self.snapshot[path]
+        if removed and not ready:
+            self._save()
+
+        self._ready = {path: seen[path] for path in ready}
+        return sorted(ready, key=lambda path: seen[path])
+
+    def commit(self, paths: List[str]) -> None:
+        """
+        분석을 마친 파일을 스냅샷에 기록하고 상태 파일 저장
+
+        Args:
+            paths: scan 이 반환한 경로 중 처리가 끝난 경로
+        """
+        for path in paths:
+            stat = self._ready.pop(path, None)
+            if stat is not None:
+                self.snapshot[path] = stat
+        self._save()
+
+    def wait(self) -> None:
+        """
+        다음 확인까지 대기 (inotify 사용 시 이벤트가 올 때까지 블록하므로 유휴 시 CPU 를 쓰지 않음)
+
+        wake() 가 호출되면 바로 반환함 (신호로 중단되어도 select/sleep 은 남은 시간만큼 다시 대기하므로 필요)
+        """
+        fds = [self._wake_r]
+        if self._inotify_fd is None or self.pending:
+            timeout = self.poll_interval
+        else:
+            fds.append(self._inotify_fd)
+            timeout = self.rescan_interval
+
+        readable, _, _ = select.select(fds, [], [], timeout)
+        # 이벤트 내용은 사용하지 않고 비우기만 함 (변경 여부는 scan 의 스냅샷 비교로 판단)
+        for fd in readable:
+            self._drain(fd)
+
+    def wake(self) -> None:
+        """진행 중이거나 다음에 호출되는 wait 를 바로 반환시킴 (신호 처리기에서 호출해도 안전)"""
+        try:
+            os.write(self._wake_w, b'\0')
+        except OSError:
+            # 파이프가 가득 찼으면 이미 깨울 예정이고, 닫혔으면 감시가 끝난 것
+            pass
+
+    @staticmethod
+    def _drain(fd: int) -> None:
+        """논블로킹 파일 디스크립터에 쌓인 내용을 비움"""
+        try:
+            while os.read(fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """inotify 감시와 깨우기 파이프 해제"""
+        if self._inotify_fd is not None:
+            os.close(self._inotify_fd)
+            self._inotify_fd = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd is not None:
+                os.close(fd)
+        self._wake_r = self._wake_w = None
+
+    def _save(self) -> None:
+        """스냅샷 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.state_path:
+            return
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"감시 상태 저장 실패: {e}")
+
+    def __enter__(self) -> 'FolderWatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
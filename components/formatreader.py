@@ -0,0 +1,604 @@
+import os
+import struct
+import logging
+import threading
+from typing import Dict, Any, List, Optional, BinaryIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class JpegReader:
+    """JPEG 마커를 순회하며 APP1 EXIF 블록과 SOF 크기 정보를 읽는 경량 리더"""
+
+    format_name = 'JPEG'
+    embeds_tiff = False
+
+    # SOF 컴포넌트 수 -> PIL 모드
+    COMPONENT_MODES = {1: 'L', 3: 'RGB', 4: 'CMYK'}
+
+    @staticmethod
+    def matches(header: bytes) -> bool:
+        """SOI 마커로 시작하는지 확인"""
+        return header[:3] == b'\xff\xd8\xff'
+
+    def read(self, f: BinaryIO) -> Dict[str, Any]:
+        """
+        SOS 이전의 마커 세그먼트만 읽어 메타데이터를 추출
+
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+
+        Returns:
+            Dict: format, mode, size, exif(TIFF 헤더부터 시작하는 바이트 또는 None)
+        """
+        result = {'format': self.format_name, 'mode': None, 'size': None, 'exif': None}
+
+        f.seek(2)
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                break
+            code = marker[1]
+            # 채움 바이트 및 길이가 없는 마커
+            if code == 0xFF:
+                f.seek(-1, os.SEEK_CUR)
+                continue
+            if code in (0x01, 0xD8) or 0xD0 <= code <= 0xD7:
+                continue
+            if code in (0xD9, 0xDA):  # EOI, SOS 이후는 압축 데이터
+                break
+
+            length_bytes = f.read(2)
+            if len(length_bytes) < 2:
+                break
+            length = struct.unpack('>H', length_bytes)[0] - 2
+
+            if code == 0xE1 and result['exif'] is None:
+                data = f.read(length)
+                if data.startswith(b'Exif\x00\x00'):
+                    result['exif'] = data[6:]
+            elif 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                data = f.read(length)
+                height, width, components = struct.unpack('>HHB', data[1:6])
+                result['size'] = (width, height)
+                result['mode'] = self.COMPONENT_MODES.get(components)
+            else:
+                f.seek(length, os.SEEK_CUR)
+
+            if result['exif'] is not None and result['size'] is not None:
+                break
+
+        return result
+
+
+class TiffReader:
+    """TIFF IFD0 에서 이미지 크기를 읽는 경량 리더 (EXIF 는 파일 자체가 TIFF 스트림)"""
+
+    format_name = 'TIFF'
+    embeds_tiff = True
+
+    # 태그 타입 -> (struct 형식, 크기)
+    FIELD_TYPES = {3: ('H', 2), 4: ('I', 4)}
+
+    @staticmethod
+    def matches(header: bytes) -> bool:
+        """II*\0 또는 MM\0* 바이트 순서 헤더인지 확인"""
+        return header[:4] in (b'II*\x00', b'MM\x00*')
+
+    def read(self, f: BinaryIO) -> Dict[str, Any]:
+        """
+        IFD0 의 ImageWidth/ImageLength/PhotometricInterpretation 태그만 읽음
+
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+
+        Returns:
+            Dict: format, mode, size, exif(항상 None, 파일 전체를 exifread 로 처리)
+        """
+        result = {'format': self.format_name, 'mode': None, 'size': None, 'exif': None}
+
+        f.seek(0)
+        header = f.read(8)
+        order = '<' if header[:2] == b'II' else '>'
+        ifd_offset = struct.unpack(order + 'I', header[4:8])[0]
+
+        f.seek(ifd_offset)
+        count_bytes = f.read(2)
+        if len(count_bytes) < 2:
+            return result
+        entry_count = struct.unpack(order + 'H', count_bytes)[0]
+        entries = f.read(entry_count * 12)
+
+        values = {}
+        for i in range(len(entries) // 12):
+            tag, field_type, count = struct.unpack(order + 'HHI', entries[i * 12:i * 12 + 8])
+            if field_type in self.FIELD_TYPES and count == 1:
+                fmt, size = self.FIELD_TYPES[field_type]
+                values[tag] = struct.unpack(order + fmt, entries[i * 12 + 8:i * 12 + 8 + size])[0]
+
+        if 256 in values and 257 in values:
+            result['size'] = (values[256], values[257])
+        photometric = values.get(262)
+        if photometric in (0, 1):
+            result['mode'] = '1' if values.get(258) == 1 else 'L'
+        elif photometric == 2:
+            result['mode'] = 'RGBA' if values.get(277) == 4 else 'RGB'
+        elif photometric == 3:
+            result['mode'] = 'P'
+        elif photometric == 5:
+            result['mode'] = 'CMYK'
+
+        return result
+
+
+class HeicReader:
+    """HEIC/HEIF(ISOBMFF) 컨테이너에서 EXIF 블록과 이미지 크기를 읽는 경량 리더"""
+
+    format_name = 'HEIF'
+    embeds_tiff = False
+
+    # ftyp 주 브랜드 중 HEIF 계열로 처리할 목록
+    BRANDS = {b'heic', b'heix', b'hevc', b'hevx', b'heim', b'heis', b'mif1', b'msf1', b'avif'}
+
+    @staticmethod
+    def matches(header: bytes) -> bool:
+        """ftyp 박스의 주 브랜드가 HEIF 계열인지 확인"""
+        return header[4:8] == b'ftyp' and header[8:12] in HeicReader.BRANDS
+
+    def read(self, f: BinaryIO) -> Dict[str, Any]:
+        """
+        박스 구조(meta/iinf/iloc/iprp)만 따라가며 메타데이터를 읽음
+
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+
+        Returns:
+            Dict: format, mode, size, exif(TIFF 헤더부터 시작하는 바이트 또는 None)
+        """
+        result = {'format': self.format_name, 'mode': None, 'size': None, 'exif': None}
+
+        meta = self._find_top_level_box(f, b'meta')
+        if meta is None:
+            logger.warning("HEIC meta 박스를 찾을 수 없습니다.")
+            return result
+
+        # meta 는 FullBox 이므로 version/flags 4바이트를 건너뜀
+        meta_start, meta_end = meta
+        children = self._read_children(f, meta_start + 4, meta_end)
+
+        primary_id = None
+        if b'pitm' in children:
+            primary_id = self._parse_pitm(f, *children[b'pitm'])
+
+        exif_ids = self._parse_iinf(f, *children[b'iinf']) if b'iinf' in children else []
+        locations = self._parse_iloc(f, *children[b'iloc']) if b'iloc' in children else {}
+        idat_start = children[b'idat'][0] if b'idat' in children else None
+
+        if b'iprp' in children:
+            result['size'] = self._parse_primary_size(f, *children[b'iprp'], primary_id)
+
+        for item_id in exif_ids:
+            if item_id not in locations:
+                continue
+            payload = self._read_item(f, locations[item_id], idat_start)
+            exif = self._strip_exif_header(payload)
+            if exif:
+                result['exif'] = exif
+                break
+
+        return result
+
+    def _read_box_header(self, f: BinaryIO, offset: int,
+                         limit: Optional[int]) -> Optional[Tuple[bytes, int, int]]:
+        """
+        offset 위치의 박스 헤더를 읽음
+
+        Returns:
+            Optional[Tuple]: (박스 타입, 페이로드 시작 위치, 박스 끝 위치) 또는 None
+        """
+        f.seek(offset)
+        header = f.read(8)
+        if len(header) < 8:
+            return None
+        size, box_type = struct.unpack('>I4s', header)
+        payload_start = offset + 8
+        if size == 1:
+            large = f.read(8)
+            if len(large) < 8:
+                return None
+            size = struct.unpack('>Q', large)[0]
+            payload_start += 8
+        elif size == 0:
+            # 파일 끝까지 이어지는 박스
+            if limit is None:
+                f.seek(0, os.SEEK_END)
+                limit = f.tell()
+            size = limit - offset
+        if size < payload_start - offset:
+            return None
+        return box_type, payload_start, offset + size
+
+    def _find_top_level_box(self, f: BinaryIO, box_type: bytes) -> Optional[Tuple[int, int]]:
+        """최상위 박스 중 box_type 을 찾아 (페이로드 시작, 끝) 반환"""
+        offset = 0
+        while True:
+            header = self._read_box_header(f, offset, None)
+            if header is None:
+                return None
+            found_type, payload_start, box_end = header
+            if found_type == box_type:
+                return payload_start, box_end
+            offset = box_end
+
+    def _read_children(self, f: BinaryIO, start: int, end: int) -> Dict[bytes, Tuple[int, int]]:
+        """컨테이너 박스의 자식 박스 위치 목록 (타입별 첫 번째 박스만)"""
+        children = {}
+        offset = start
+        while offset + 8 <= end:
+            header = self._read_box_header(f, offset, end)
+            if header is None:
+                break
+            box_type, payload_start, box_end = header
+            children.setdefault(box_type, (payload_start, box_end))
+            if box_end <= offset:
+                break
+            offset = box_end
+        return children
+
+    def _read_full_box_header(self, f: BinaryIO, start: int) -> Tuple[int, int]:
+        """FullBox 의 version, flags 반환"""
+        f.seek(start)
+        value = struct.unpack('>I', f.read(4))[0]
+        return value >> 24, value & 0xFFFFFF
+
+    def _parse_pitm(self, f: BinaryIO, start: int, end: int) -> int:
+        """기본(primary) 아이템 ID"""
+        version, _ = self._read_full_box_header(f, start)
+        if version == 0:
+            return struct.unpack('>H', f.read(2))[0]
+        return struct.unpack('>I', f.read(4))[0]
+
+    def _parse_iinf(self, f: BinaryIO, start: int, end: int) -> List[int]:
+        """iinf 에서 item_type 이 'Exif' 인 아이템 ID 목록"""
+        version, _ = self._read_full_box_header(f, start)
+        entry_count_size = 2 if version == 0 else 4
+        offset = start + 4 + entry_count_size
+
+        exif_ids = []
+        while offset + 8 <= end:
+            header = self._read_box_header(f, offset, end)
+            if header is None:
+                break
+            box_type, payload_start, box_end = header
+            if box_type == b'infe':
+                infe_version, _ = self._read_full_box_header(f, payload_start)
+                if infe_version >= 2:
+                    id_format = '>H' if infe_version == 2 else '>I'
+                    item_id = struct.unpack(id_format, f.read(struct.calcsize(id_format)))[0]
+                    f.read(2)  # item_protection_index
+                    item_type = f.read(4)
+                    if item_type == b'Exif':
+                        exif_ids.append(item_id)
+            offset = box_end
+        return exif_ids
+
+    def _parse_iloc(self, f: BinaryIO, start: int, end: int) -> Dict[int, Dict[str, Any]]:
+        """iloc 에서 아이템별 저장 위치(구성 방식, extent 목록)"""
+        version, _ = self._read_full_box_header(f, start)
+        sizes = struct.unpack('>H', f.read(2))[0]
+        offset_size = (sizes >> 12) & 0xF
+        length_size = (sizes >> 8) & 0xF
+        base_offset_size = (sizes >> 4) & 0xF
+        index_size = sizes & 0xF if version in (1, 2) else 0
+
+        item_count = struct.unpack('>H' if version < 2 else '>I', f.read(2 if version < 2 else 4))[0]
+
+        locations = {}
+        for _ in range(item_count):
+            item_id = struct.unpack('>H' if version < 2 else '>I', f.read(2 if version < 2 else 4))[0]
+            construction_method = 0
+            if version in (1, 2):
+                construction_method = struct.unpack('>H', f.read(2))[0] & 0xF
+            f.read(2)  # data_reference_index
+            base_offset = self._read_uint(f, base_offset_size)
+            extent_count = struct.unpack('>H', f.read(2))[0]
+
+            extents = []
+            for _ in range(extent_count):
+                if index_size:
+                    self._read_uint(f, index_size)
+                extent_offset = self._read_uint(f, offset_size)
+                extent_length = self._read_uint(f, length_size)
+                extents.append((base_offset + extent_offset, extent_length))
+
+            locations[item_id] = {'construction_method': construction_method, 'extents': extents}
+        return locations
+
+    def _parse_primary_size(self, f: BinaryIO, start: int, end: int,
+                            primary_id: Optional[int]) -> Optional[Tuple[int, int]]:
+        """iprp/ipco 의 ispe 속성에서 기본 아이템의 (폭, 높이)"""
+        children = self._read_children(f, start, end)
+        if b'ipco' not in children:
+            return None
+
+        # ipco 속성은 순서(1부터 시작)로 참조됨
+        properties = []
+        ipco_start, ipco_end = children[b'ipco']
+        offset = ipco_start
+        while offset + 8 <= ipco_end:
+            header = self._read_box_header(f, offset, ipco_end)
+            if header is None:
+                break
+            properties.append(header)
+            offset = header[2]
+
+        def ispe_size(prop):
+            f.seek(prop[1] + 4)
+            return struct.unpack('>II', f.read(8))
+
+        candidates = [p for p in properties if p[0] == b'ispe']
+        if primary_id is not None and b'ipma' in children:
+            for index in self._parse_ipma(f, *children[b'ipma']).get(primary_id, []):
+                if 0 < index <= len(properties) and properties[index - 1][0] == b'ispe':
+                    return ispe_size(properties[index - 1])
+
+        if candidates:
+            # 연관 정보가 없으면 가장 큰 크기를 기본 이미지로 간주
+            return max((ispe_size(p) for p in candidates), key=lambda s: s[0] * s[1])
+        return None
+
+    def _parse_ipma(self, f: BinaryIO, start: int, end: int) -> Dict[int, List[int]]:
+        """ipma 에서 아이템별 속성 인덱스 목록"""
+        version, flags = self._read_full_box_header(f, start)
+        entry_count = struct.unpack('>I', f.read(4))[0]
+
+        associations = {}
+        for _ in range(entry_count):
+            item_id = struct.unpack('>H' if version < 1 else '>I', f.read(2 if version < 1 else 4))[0]
+            count = f.read(1)[0]
+            indices = []
+            for _ in range(count):
+                if flags & 1:
+                    indices.append(struct.unpack('>H', f.read(2))[0] & 0x7FFF)
+                else:
+                    indices.append(f.read(1)[0] & 0x7F)
+            associations[item_id] = indices
+        return associations
+
+    def _read_item(self, f: BinaryIO, location: Dict[str, Any], idat_start: Optional[int]) -> bytes:
+        """iloc extent 를 이어붙여 아이템 데이터를 읽음"""
+        base = 0
+        if location['construction_method'] == 1:
+            if idat_start is None:
+                return b''
+            base = idat_start
+        elif location['construction_method'] != 0:
+            return b''
+
+        chunks = []
+        for extent_offset, extent_length in location['extents']:
+            f.seek(base + extent_offset)
+            chunks.append(f.read(extent_length))
+        return b''.join(chunks)
+
+    def _strip_exif_header(self, payload: bytes) -> Optional[bytes]:
+        """HEIF Exif 아이템 앞의 TIFF 헤더 오프셋(4바이트)을 제거"""
+        if len(payload) < 4:
+            return None
+        tiff_offset = struct.unpack('>I', payload[:4])[0]
+        tiff = payload[4 + tiff_offset:]
+        if tiff[:2] not in (b'II', b'MM'):
+            return None
+        return tiff
+
+    def _read_uint(self, f: BinaryIO, size: int) -> int:
+        """size 바이트(0, 4, 8) 부호 없는 정수"""
+        if size == 0:
+            return 0
+        return int.from_bytes(f.read(size), 'big')
+
+
+class PngReader:
+    """PNG 청크를 순회하며 eXIf 블록과 이미지 크기를 읽는 경량 리더"""
+
+    format_name = 'PNG'
+    embeds_tiff = False
+    SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+    # IHDR 컬러 타입 -> PIL 모드
+    COLOR_MODES = {0: 'L', 2: 'RGB', 3: 'P', 4: 'LA', 6: 'RGBA'}
+
+    @staticmethod
+    def matches(header: bytes) -> bool:
+        """PNG 시그니처로 시작하는지 확인"""
+        return header[:8] == PngReader.SIGNATURE
+
+    def read(self, f: BinaryIO) -> Dict[str, Any]:
+        """
+        IDAT 을 압축 해제하지 않고 청크 헤더만 따라가며 메타데이터를 읽음
+
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+
+        Returns:
+            Dict: format, mode, size, exif(TIFF 헤더부터 시작하는 바이트 또는 None)
+        """
+        result = {'format': self.format_name, 'mode': None, 'size': None, 'exif': None}
+
+        f.seek(0)
+        if f.read(8) != self.SIGNATURE:
+            logger.warning("PNG 시그니처가 올바르지 않습니다.")
+            return result
+
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                break
+            length, chunk_type = struct.unpack('>I4s', header)
+
+            if chunk_type == b'IHDR':
+                data = f.read(length)
+                width, height, bit_depth, color_type = struct.unpack('>IIBB', data[:10])
+                result['size'] = (width, height)
+                mode = self.COLOR_MODES.get(color_type)
+                if mode == 'L' and bit_depth == 16:
+                    mode = 'I;16'
+                result['mode'] = mode
+                f.seek(4, os.SEEK_CUR)  # CRC
+            elif chunk_type == b'eXIf':
+                data = f.read(length)
+                # 일부 프로그램은 JPEG APP1 처럼 'Exif\0\0' 을 앞에 붙여 저장함
+                if data.startswith(b'Exif\x00\x00'):
+                    data = data[6:]
+                if data[:2] in (b'II', b'MM'):
+                    result['exif'] = data
+                break
+            elif chunk_type == b'IEND':
+                break
+            else:
+                # IDAT 등 나머지 청크는 읽지 않고 건너뜀
+                f.seek(length + 4, os.SEEK_CUR)
+
+        return result
+
+
+class FormatRegistry:
+    """파일 앞부분을 검사해 실제 형식에 맞는 리더로 연결하는 레지스트리"""
+
+    # 형식 판별에 필요한 최대 바이트 수
+    SNIFF_SIZE = 16
+
+    def __init__(self):
+        """초기화 메서드"""
+        self.readers = []
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+        for reader in (JpegReader(), TiffReader(), PngReader(), HeicReader()):
+            self.register(reader)
+
+    def register(self, reader) -> None:
+        """
+        리더 등록 (먼저 등록된 리더가 우선)
+
+        Args:
+            reader: format_name, embeds_tiff, matches(), read() 를 갖는 리더 객체
+        """
+        self.readers.append(reader)
+
+    def sniff(self, header: bytes):
+        """
+        헤더 바이트로 리더를 찾음
+
+        Args:
+            header: 파일 앞부분 (SNIFF_SIZE 바이트)
+
+        Returns:
+            리더 객체 또는 None (이미지가 아닌 경우)
+        """
+        for reader in self.readers:
+            if reader.matches(header):
+                return reader
+        return None
+
+    def sniff_file(self, f: BinaryIO):
+        """
+        파일 객체의 앞부분만 읽어 리더를 찾음
+
+        Args:
+            f: 탐색 가능한 바이너리 파일 객체
+
+        Returns:
+            리더 객체 또는 None (이미지가 아닌 경우)
+        """
+        f.seek(0)
+        reader = self.sniff(f.read(self.SNIFF_SIZE))
+        f.seek(0)
+        return reader
+
+    def record(self, format_name: str, elapsed: float) -> None:
+        """
+        형식별 처리 건수와 소요 시간 누적
+
+        Args:
+            format_name: 형식 이름 (판별 실패 시 'rejected')
+            elapsed: 소요 시간 (초)
+        """
+        with self._stats_lock:
+            entry = self.stats.setdefault(format_name, {'count': 0, 'seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += elapsed
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        형식별 통계 반환
+
+        Returns:
+            Dict: {형식: {'count', 'seconds', 'avg_ms'}}
+        """
+        return {
+            name: {
+                'count': entry['count'],
+                'seconds': entry['seconds'],
+                'avg_ms': entry['seconds'] / entry['count'] * 1000 if entry['count'] else 0.0,
+            }
+            for name, entry in self.stats.items()
+        }
+
+    def reset_stats(self) -> None:
+        """통계 초기화"""
+        self.stats = {}
+
+
+def read_exif_thumbnail(f: BinaryIO) -> Optional[bytes]:
+    """
+    EXIF IFD1 의 JPEGInterchangeFormat(0x0201/0x0202) 이 가리키는 내장 썸네일을 읽음
+
+    Args:
+        f: TIFF 헤더가 0 위치에 오는 탐색 가능한 바이너리 파일 객체
+
+    Returns:
+        Optional[bytes]: JPEG 썸네일 바이트 또는 None
+    """
+    f.seek(0)
+    header = f.read(8)
+    if len(header) < 8 or header[:2] not in (b'II', b'MM'):
+        return None
+    order = '<' if header[:2] == b'II' else '>'
+
+    # IFD0 를 건너뛰어 다음 IFD(IFD1) 오프셋을 구함
+    ifd0_offset = struct.unpack(order + 'I', header[4:8])[0]
+    f.seek(ifd0_offset)
+    count_bytes = f.read(2)
+    if len(count_bytes) < 2:
+        return None
+    entry_count = struct.unpack(order + 'H', count_bytes)[0]
+    f.seek(ifd0_offset + 2 + entry_count * 12)
+    next_bytes = f.read(4)
+    if len(next_bytes) < 4:
+        return None
+    ifd1_offset = struct.unpack(order + 'I', next_bytes)[0]
+    if ifd1_offset == 0:
+        return None
+
+    f.seek(ifd1_offset)
+    count_bytes = f.read(2)
+    if len(count_bytes) < 2:
+        return None
+    entry_count = struct.unpack(order + 'H', count_bytes)[0]
+    entries = f.read(entry_count * 12)
+
+    values = {}
+    for i in range(len(entries) // 12):
+        tag, field_type, count = struct.unpack(order + 'HHI', entries[i * 12:i * 12 + 8])
+        if tag in (0x0201, 0x0202) and count == 1:
+            fmt = 'H' if field_type == 3 else 'I'
+            values[tag] = struct.unpack(order + fmt, entries[i * 12 + 8:i * 12 + 8 + struct.calcsize(fmt)])[0]
+
+    if 0x0201 not in values or not values.get(0x0202):
+        return None
+
+    f.seek(values[0x0201])
+    thumbnail = f.read(values[0x0202])
+    if not thumbnail.startswith(b'\xff\xd8'):
+        return None
+    return thumbnail
@@ -0,0 +1,121 @@
+import os
+import json
+import hashlib
+import logging
+from typing import Any, Optional, Set
+from components.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class FragmentCache:
+    """보고서 조각(HTML 카드, PDF 볼륨, HTML 샤드)을 내용 해시로 저장하는 디스크 캐시"""
+
+    def __init__(self, cache_dir: str, namespace: str = 'default'):
+        """
+        초기화 메서드
+
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+            namespace: 조각 종류 (종류별 하위 디렉토리로 분리되어 독립적으로 정리됨)
+        """
+        self.cache_dir = cache_dir
+        self.namespace_name = namespace
+        self.directory = os.path.join(cache_dir, namespace)
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.used_keys = set()
+
+    def namespace(self, name: str) -> 'FragmentCache':
+        """
+        같은 캐시 루트를 쓰는 다른 종류의 캐시
+
+        Args:
+            name: 조각 종류 이름
+
+        Returns:
+            FragmentCache: 해당 종류의 캐시
+        """
+        return FragmentCache(self.cache_dir, name)
+
+    @staticmethod
+    def make_key(content: Any, salt: str = '') -> str:
+        """
+        내용 해시 키 생성
+
+        Args:
+            content: JSON 직렬화 가능한 내용 (분석 결과 등)
+            salt: 템플릿 버전 등 내용 외에 결과물에 영향을 주는 값
+
+        Returns:
+            str: SHA-256 16진수 문자열
+        """
+        digest = hashlib.sha256(salt.encode('utf-8'))
+        digest.update(json.dumps(content, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 조각 조회
+
+        Args:
+            key: make_key 로 만든 키
+
+        Returns:
+            Optional[str]: 캐시된 조각 또는 None
+        """
+        self.used_keys.add(key)
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                value = f.read()
+            self.hits += 1
+            metrics.increment('fragment_cache_hits')
+            return value
+        except FileNotFoundError:
+            self.misses += 1
+            metrics.increment('fragment_cache_misses')
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """
+        조각 저장 (임시 파일에 쓴 뒤 교체하므로 동시 실행 중에도 깨진 조각을 읽지 않음)
+
+        Args:
+            key: make_key 로 만든 키
+            value: 저장할 조각
+        """
+        self.used_keys.add(key)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"보고서 조각 캐시 저장 실패: {e}")
+
+    def prune(self, keep: Optional[Set[str]] = None) -> int:
+        """
+        이번 실행에서 사용하지 않은 조각 삭제
+
+        Args:
+            keep: 유지할 키 집합 (생략 시 get/put 으로 사용한 키)
+
+        Returns:
+            int: 삭제한 조각 수
+        """
+        keep = self.used_keys if keep is None else keep
+        removed = 0
+        for name in os.listdir(self.directory):
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def _path(self, key: str) -> str:
+        """키에 해당하는 파일 경로"""
+        return os.path.join(self.directory, key)
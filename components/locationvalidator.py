@@ -1,24 +1,83 @@
 import os
+import time
 import logging
-import folium
-from geopy.geocoders import Nominatim
-from typing import Dict, Any, List, Tuple, Optional
+import threading
+from typing import Dict, Any, Iterable, List, Tuple, Optional
+from components.fragmentcache import FragmentCache
+from components.metrics import metrics, timed
 
 logger = logging.getLogger(__name__)
 
+# Nominatim 사용 정책: 요청은 초당 1건 이하
+NOMINATIM_MIN_INTERVAL = 1.0
+
+
+class GeocodeThrottle:
+    """지오코딩 요청을 한 번에 하나씩, 최소 간격을 두고 보내도록 조절하는 클래스"""
+    
+    def __init__(self, min_interval: float = NOMINATIM_MIN_INTERVAL, lock=None, last_call=None):
+        """
+        초기화 메서드
+        
+        Args:
+            min_interval: 요청 사이 최소 간격 (초)
+            lock: 요청을 직렬화할 잠금 (여러 프로세스가 공유하려면 multiprocessing.Lock, 생략 시 스레드 잠금)
+            last_call: 마지막 요청 시각을 공유할 multiprocessing.RawValue('d') (생략 시 이 객체 안에만 기록)
+        """
+        self.min_interval = min_interval
+        self._lock = lock if lock is not None else threading.Lock()
+        self._last_call = last_call
+        self._last = 0.0
+    
+    def __enter__(self) -> 'GeocodeThrottle':
+        self._lock.acquire()
+        last = self._last_call.value if self._last_call is not None else self._last
+        wait = last + self.min_interval - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # 응답을 받은 시각부터 다음 요청까지 간격을 둠
+        now = time.monotonic()
+        if self._last_call is not None:
+            self._last_call.value = now
+        self._last = now
+        self._lock.release()
+
+
+# 같은 프로세스의 모든 LocationValidator 가 공유하는 기본 조절기 (아카이브 분석 스레드 등)
+_default_throttle = GeocodeThrottle()
+
+
 class LocationValidator:
     """위치 정보 검증 및 시각화를 담당하는 클래스"""
     
-    def __init__(self, user_agent: str = "ExifAnalyzer/1.0"):
+    # 지도 표시 옵션 (지도 캐시 키에 포함되므로 바꾸면 지도를 다시 생성함)
+    MAP_OPTIONS = {'zoom_start': 13, 'line_color': 'blue', 'line_weight': 2, 'line_opacity': 0.7}
+    
+    def __init__(self, user_agent: str = "ExifAnalyzer/1.0", throttle: Optional[GeocodeThrottle] = None):
         """
         초기화 메서드
         
         Args:
             user_agent: 지오코딩 요청 시 사용할 User-Agent
+            throttle: 지오코딩 요청 조절기 (생략 시 프로세스 공용 조절기, 여러 프로세스가 함께 요청하면 공유 조절기를 지정)
         """
-        self.geolocator = Nominatim(user_agent=user_agent)
+        self.user_agent = user_agent
+        self.throttle = throttle or _default_throttle
+        self._geolocator = None
         logger.info("LocationValidator 초기화 완료")
     
+    @property
+    def geolocator(self):
+        """지오코더 (geopy 임포트 비용이 커서 처음 사용할 때 생성)"""
+        if self._geolocator is None:
+            from geopy.geocoders import Nominatim
+            self._geolocator = Nominatim(user_agent=self.user_agent)
+        return self._geolocator
+    
+    @timed('geocode')
     def reverse_geocode(self, latitude: float, longitude: float) -> Dict[str, Any]:
         """
         좌표를 주소로 변환
@@ -30,8 +89,11 @@ class LocationValidator:
         Returns:
             Dict: 변환된 주소 정보
         """
+        metrics.increment('geocode_calls')
         try:
-            location = self.geolocator.reverse((latitude, longitude), language='ko')
+            # 병렬 분석 중에도 요청은 하나씩 정책 간격에 맞춰 보냄
+            with self.throttle:
+                location = self.geolocator.reverse((latitude, longitude), language='ko')
             
             if location:
                 address_data = {
@@ -47,25 +109,54 @@ class LocationValidator:
                         address_components[key] = value
                 
                 address_data['components'] = address_components
-                logger.info(f"역지오코딩 성공: ({latitude}, {longitude}) -> {location.address}")
+                logger.debug(f"역지오코딩 성공: ({latitude}, {longitude}) -> {location.address}")
                 return address_data
             else:
                 logger.warning(f"역지오코딩 결과 없음: ({latitude}, {longitude})")
                 return {'error': 'No results found'}
                 
+        except ImportError:
+            logger.warning("geopy 라이브러리가 설치되지 않았습니다.")
+            return {'error': 'geopy not installed'}
         except Exception as e:
+            metrics.error('geocode')
             logger.error(f"역지오코딩 중 오류 발생: {e}")
             return {'error': str(e)}
     
+    @staticmethod
+    def collect_map_points(results: Iterable[Dict[str, Any]]) -> Tuple[List[Tuple[float, float]], List[str]]:
+        """
+        분석 결과에서 지도에 표시할 좌표와 레이블 추출
+        
+        Args:
+            results: 이미지 분석 결과 목록
+            
+        Returns:
+            Tuple: (좌표 목록, 레이블 목록)
+        """
+        coordinates_list = []
+        labels = []
+        for result in results:
+            exif_data = result.get('exif_data', {})
+            if 'gps' in exif_data and 'coordinates' in exif_data['gps']:
+                coordinates_list.append(exif_data['gps']['coordinates'])
+                labels.append(exif_data.get('file_name', 'unknown'))
+        return coordinates_list, labels
+    
+    @timed('report_map')
     def create_map(self, coordinates_list: List[Tuple[float, float]], 
-                   labels: List[str] = None, output_path: str = 'map.html') -> str:
+                   labels: List[str] = None, output_path: str = 'map.html',
+                   use_cache: bool = True) -> str:
         """
         좌표 목록으로 지도 생성
         
+        같은 경로에 같은 좌표/레이블/옵션으로 이미 만든 지도가 있으면 다시 생성하지 않음
+        
         Args:
             coordinates_list: (위도, 경도) 튜플의 리스트
             labels: 각 좌표에 대한 레이블 리스트
             output_path: 저장할 HTML 파일 경로
+            use_cache: False 이면 항상 다시 생성
             
         Returns:
             str: 생성된 지도 HTML 파일 경로
@@ -74,17 +165,33 @@ class LocationValidator:
             logger.warning("지도 생성을 위한 좌표가 없습니다.")
             return ""
         
+        labels = [labels[i] if labels and i < len(labels) else f"Point {i+1}"
+                  for i in range(len(coordinates_list))]
+        
+        # 출력 경로별로 마지막에 만든 지도의 내용 키를 기록해 두고 같으면 재사용
+        cache = stamp_key = map_key = None
+        if use_cache:
+            cache = FragmentCache(os.path.join(os.path.dirname(os.path.abspath(output_path)), '.report_cache'), 'map')
+            stamp_key = FragmentCache.make_key(os.path.abspath(output_path))
+            map_key = FragmentCache.make_key({'coordinates': coordinates_list, 'labels': labels,
+                                              'options': self.MAP_OPTIONS})
+            if os.path.exists(output_path) and cache.get(stamp_key) == map_key:
+                metrics.increment('map_cache_hits')
+                logger.info(f"지도 재사용 (변경 없음): {output_path}")
+                return output_path
+        
         try:
+            import folium
+            
             # 중심점 계산 (모든 좌표의 평균)
             center_lat = sum(coord[0] for coord in coordinates_list) / len(coordinates_list)
             center_lon = sum(coord[1] for coord in coordinates_list) / len(coordinates_list)
             
             # 지도 생성
-            map_obj = folium.Map(location=[center_lat, center_lon], zoom_start=13)
+            map_obj = folium.Map(location=[center_lat, center_lon], zoom_start=self.MAP_OPTIONS['zoom_start'])
             
             # 마커 추가
-            for i, coords in enumerate(coordinates_list):
-                label = labels[i] if labels and i < len(labels) else f"Point {i+1}"
+            for coords, label in zip(coordinates_list, labels):
                 popup_text = f"{label}<br>위도: {coords[0]}<br>경도: {coords[1]}"
                 folium.Marker(
                     location=coords,
@@ -95,20 +202,29 @@ class LocationValidator:
             # 모든 점을 연결하는 선 추가 (시간순서대로 연결)
             folium.PolyLine(
                 coordinates_list,
-                color='blue',
-                weight=2,
-                opacity=0.7
+                color=self.MAP_OPTIONS['line_color'],
+                weight=self.MAP_OPTIONS['line_weight'],
+                opacity=self.MAP_OPTIONS['line_opacity']
             ).add_to(map_obj)
             
-            # 지도 저장
-            map_obj.save(output_path)
+            # 지도 저장 (임시 파일에 쓴 뒤 교체하므로 갱신 중에도 깨진 지도를 열지 않음)
+            tmp_path = f"{output_path}.{os.getpid()}.tmp"
+            map_obj.save(tmp_path)
+            os.replace(tmp_path, output_path)
+            if cache:
+                cache.put(stamp_key, map_key)
             logger.info(f"지도 생성 완료: {output_path}")
             return output_path
             
+        except ImportError:
+            logger.warning("folium 라이브러리가 설치되지 않아 지도를 생성하지 않습니다.")
+            return ""
         except Exception as e:
+            metrics.error('report_map')
             logger.error(f"지도 생성 중 오류 발생: {e}")
             return ""
     
+    @timed('validate_location')
     def validate_location(self, exif_data: Dict[str, Any], 
                           reference_location: Optional[Tuple[float, float]] = None, 
                           max_distance: float = 1.0) -> Dict[str, Any]:
@@ -133,7 +249,9 @@ class LocationValidator:
         
         # GPS 데이터 확인
         if 'gps' not in exif_data or 'coordinates' not in exif_data['gps']:
-            logger.warning(f"GPS 데이터 없음: {exif_data.get('file_path', 'unknown')}")
+            # 이미지마다 흔한 상황이므로 개별 로그는 DEBUG 로 두고 건수는 지표로 집계
+            metrics.increment('images_without_gps')
+            logger.debug(f"GPS 데이터 없음: {exif_data.get('file_path', 'unknown')}")
             return validation_result
         
         validation_result['has_gps_data'] = True
@@ -157,7 +275,7 @@ class LocationValidator:
                 validation_result['distance_from_reference'] = distance
                 validation_result['within_threshold'] = distance <= max_distance
                 validation_result['reference_location'] = reference_location
-                logger.info(f"거리 계산: {distance:.2f}km (기준치: {max_distance}km)")
+                logger.debug(f"거리 계산: {distance:.2f}km (기준치: {max_distance}km)")
             except Exception as e:
                 logger.error(f"거리 계산 중 오류: {e}")
         
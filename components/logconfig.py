@@ -0,0 +1,98 @@
+import os
+import sys
+import atexit
+import logging
+import multiprocessing
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional, Tuple
+
+LOG_FORMAT = '%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s'
+
+# DEBUG 로 실행해도 외부 라이브러리의 상세 로그(exifread 는 태그마다 한 줄)는 남기지 않음
+QUIET_LOGGERS = ('exifread', 'matplotlib', 'PIL', 'urllib3', 'fontTools', 'asyncio')
+
+# 실행 중인 로그 큐와 수신기 (configure_logging 에서 생성, 작업 프로세스에서는 init_worker_logging 이 큐만 저장)
+_queue = None
+_listener = None
+
+
+def configure_logging(level: str = 'INFO', log_file: Optional[str] = 'log/exif_analyzer.log') -> None:
+    """
+    로그 기록을 큐로 보내고 별도 스레드(QueueListener)에서 파일/표준 오류에 쓰도록 설정
+
+    로그를 남기는 스레드는 큐에 넣기만 하므로 파일 I/O 를 기다리지 않으며,
+    큐는 프로세스 간 큐라서 작업 프로세스의 로그도 같은 수신기에서 한 파일로 모임
+
+    Args:
+        level: 로그 레벨 이름 (DEBUG, INFO, WARNING, ERROR)
+        log_file: 로그 파일 경로 (None 이면 표준 오류에만 출력)
+    """
+    global _queue, _listener
+    stop_logging()
+    numeric_level = logging.getLevelName(level.upper())
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler(sys.stderr)]
+    if log_file:
+        os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
+        handlers.append(logging.FileHandler(log_file, encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    _queue = multiprocessing.Queue()
+    _listener = QueueListener(_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _install_queue_handler(_queue, numeric_level)
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """남은 로그를 모두 기록하고 수신기 종료"""
+    global _queue, _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue = None
+
+
+def worker_log_args() -> Tuple:
+    """
+    작업 프로세스 풀 initializer(init_worker_logging) 에 넘길 인자
+
+    Returns:
+        Tuple: (로그 큐, 로그 레벨) - configure_logging 전이면 (None, None)
+    """
+    if _queue is None:
+        return None, None
+    return _queue, logging.getLogger().level
+
+
+def init_worker_logging(queue=None, level: Optional[int] = None) -> None:
+    """
+    작업 프로세스에서 로그를 부모 프로세스의 수신기로 보내도록 설정 (프로세스 풀 initializer)
+
+    fork 로 부모의 핸들러를 물려받은 경우에도 한 번만 전달되도록 기존 핸들러를 교체함.
+    큐를 모듈에 저장하므로 spawn 으로 시작된 작업 프로세스가 다시 프로세스 풀을 만들어도
+    worker_log_args 가 같은 큐와 레벨을 반환함
+
+    Args:
+        queue: worker_log_args 가 반환한 로그 큐 (None 이면 아무것도 하지 않음)
+        level: 로그 레벨
+    """
+    global _queue
+    if queue is not None:
+        _queue = queue
+        _install_queue_handler(queue, level)
+
+
+def _install_queue_handler(queue, level: int) -> None:
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(queue))
+    root.setLevel(level)
+    for name in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(max(level, logging.INFO))
@@ -0,0 +1,78 @@
+import os
+import logging
+from typing import Dict, Any, Iterator, List, Tuple, BinaryIO
+
+logger = logging.getLogger(__name__)
+
+
+class ManifestReader:
+    """파일 목록(매니페스트/표준 입력)에서 분석할 경로를 지연 스트리밍하는 클래스"""
+
+    # 한 번에 읽을 바이트 수 (목록 길이와 관계없이 메모리 사용량 고정)
+    CHUNK_SIZE = 64 * 1024
+
+    DELIMITERS = {'newline': b'\n', 'nul': b'\0'}
+
+    def __init__(self, stream: BinaryIO, delimiter: str = 'auto', column_separator: str = '\t'):
+        """
+        초기화 메서드
+
+        Args:
+            stream: 매니페스트 바이너리 스트림 (파일 또는 sys.stdin.buffer)
+            delimiter: 레코드 구분자 ('auto', 'newline', 'nul')
+            column_separator: 경로 뒤에 붙는 메타데이터 열 구분자
+        """
+        self.stream = stream
+        self.delimiter = delimiter
+        self.column_separator = column_separator
+        self.columns = None
+
+    def __iter__(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        매니페스트 레코드를 순서대로 반환
+
+        첫 레코드가 '#' 으로 시작하면 열 이름 헤더로 사용 (예: '# path<TAB>case<TAB>device')
+
+        Yields:
+            Tuple: (파일 경로, 메타데이터 열 딕셔너리)
+        """
+        for index, record in enumerate(self._iter_records()):
+            line = os.fsdecode(record).rstrip('\r')
+            if not line.strip():
+                continue
+            if index == 0 and line.startswith('#'):
+                self.columns = [c.strip() for c in line[1:].split(self.column_separator)][1:]
+                continue
+
+            fields = line.split(self.column_separator)
+            path = fields[0]
+            yield path, self._build_metadata(fields[1:])
+
+    def _iter_records(self) -> Iterator[bytes]:
+        """고정 크기 청크로 읽으며 구분자 단위 레코드를 반환"""
+        separator = self.DELIMITERS.get(self.delimiter)
+        remainder = b''
+
+        while True:
+            chunk = self.stream.read(self.CHUNK_SIZE)
+            if not chunk:
+                break
+            if separator is None:
+                # 첫 청크에 NUL 이 있으면 NUL 구분(find -print0 등), 아니면 줄 단위
+                separator = b'\0' if b'\0' in chunk else b'\n'
+            records = (remainder + chunk).split(separator)
+            remainder = records.pop()
+            for record in records:
+                yield record
+
+        if remainder:
+            yield remainder
+
+    def _build_metadata(self, values: List[str]) -> Dict[str, Any]:
+        """열 값 목록을 헤더 이름(없으면 col1, col2 ...)으로 매핑"""
+        metadata = {}
+        for i, value in enumerate(values):
+            name = self.columns[i] if self.columns and i < len(self.columns) else f"col{i + 1}"
+            metadata[name] = value
+        return metadata
+
@@ -0,0 +1,250 @@
+import json
+import time
+import functools
+import bisect
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Metrics:
+    """단계별 소요 시간 히스토그램, 카운터, 오류 수를 모으는 스레드 안전 지표 저장소"""
+
+    # 히스토그램 버킷 상한 (초), 마지막 버킷은 그 이상 전체
+    BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self):
+        """초기화 메서드"""
+        self._lock = threading.Lock()
+        self.stages = {}    # 단계 -> {'buckets': [...], 'count': n, 'sum': 초, 'max': 초}
+        self.counters = {}  # 이름 -> 값
+        self.errors = {}    # 단계 -> 오류 수
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        """
+        블록 실행 시간을 단계 히스토그램에 기록 (예외가 나면 오류 수도 증가)
+
+        Args:
+            stage: 단계 이름
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.error(stage)
+            raise
+        finally:
+            self.observe(stage, time.perf_counter() - start)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """단계 소요 시간 한 건 기록"""
+        index = bisect.bisect_left(self.BUCKETS, seconds)
+        with self._lock:
+            histogram = self.stages.get(stage)
+            if histogram is None:
+                histogram = self.stages[stage] = {'buckets': [0] * (len(self.BUCKETS) + 1),
+                                                  'count': 0, 'sum': 0.0, 'max': 0.0}
+            histogram['buckets'][index] += 1
+            histogram['count'] += 1
+            histogram['sum'] += seconds
+            if seconds > histogram['max']:
+                histogram['max'] = seconds
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """카운터 증가"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def count(self, name: str) -> float:
+        """카운터 현재 값 (없으면 0)"""
+        with self._lock:
+            return self.counters.get(name, 0)
+
+    def error(self, stage: str) -> None:
+        """단계 오류 수 증가"""
+        with self._lock:
+            self.errors[stage] = self.errors.get(stage, 0) + 1
+
+    def snapshot(self, reset: bool = False) -> Dict[str, Any]:
+        """
+        현재 지표 복사본 (작업 프로세스에서 부모 프로세스로 넘길 때 사용)
+
+        Args:
+            reset: True 이면 복사 후 비움 (다음 스냅샷에는 그 이후 기록만 포함)
+
+        Returns:
+            Dict: 'stages', 'counters', 'errors'
+        """
+        with self._lock:
+            snapshot = {
+                'stages': {stage: dict(h, buckets=list(h['buckets'])) for stage, h in self.stages.items()},
+                'counters': dict(self.counters),
+                'errors': dict(self.errors),
+            }
+            if reset:
+                self.stages, self.counters, self.errors = {}, {}, {}
+        return snapshot
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """다른 프로세스에서 받은 스냅샷을 더함"""
+        with self._lock:
+            for stage, other in snapshot.get('stages', {}).items():
+                histogram = self.stages.get(stage)
+                if histogram is None:
+                    self.stages[stage] = dict(other, buckets=list(other['buckets']))
+                    continue
+                histogram['buckets'] = [a + b for a, b in zip(histogram['buckets'], other['buckets'])]
+                histogram['count'] += other['count']
+                histogram['sum'] += other['sum']
+                histogram['max'] = max(histogram['max'], other['max'])
+            for name, value in snapshot.get('counters', {}).items():
+                self.counters[name] = self.counters.get(name, 0) + value
+            for stage, value in snapshot.get('errors', {}).items():
+                self.errors[stage] = self.errors.get(stage, 0) + value
+
+    def reset(self) -> None:
+        """모든 지표 비우기"""
+        self.snapshot(reset=True)
+
+    @classmethod
+    def _quantile(cls, histogram: Dict[str, Any], q: float) -> float:
+        """히스토그램 버킷으로 추정한 분위수 (해당 버킷 상한, 마지막 버킷은 최댓값)"""
+        target = q * histogram['count']
+        seen = 0
+        for index, count in enumerate(histogram['buckets']):
+            seen += count
+            if seen >= target and count:
+                return min(cls.BUCKETS[index], histogram['max']) if index < len(cls.BUCKETS) else histogram['max']
+        return histogram['max']
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        요약 지표 (JSON 저장용)
+
+        Returns:
+            Dict: 단계별 횟수/합계/평균/p50/p95/최댓값(초)과 히스토그램, 카운터, 오류 수
+        """
+        snapshot = self.snapshot()
+        stages = {}
+        for stage, histogram in sorted(snapshot['stages'].items()):
+            count = histogram['count']
+            stages[stage] = {
+                'count': count,
+                'total_seconds': round(histogram['sum'], 6),
+                'mean_seconds': round(histogram['sum'] / count, 6) if count else 0.0,
+                'p50_seconds': round(self._quantile(histogram, 0.5), 6),
+                'p95_seconds': round(self._quantile(histogram, 0.95), 6),
+                'max_seconds': round(histogram['max'], 6),
+                'errors': snapshot['errors'].get(stage, 0),
+                'buckets': dict(zip([str(b) for b in self.BUCKETS] + ['+Inf'], histogram['buckets'])),
+            }
+        errors_only = {stage: n for stage, n in snapshot['errors'].items() if stage not in stages}
+        return {'stages': stages, 'counters': dict(sorted(snapshot['counters'].items())), 'errors': errors_only}
+
+    def write_json(self, path: str) -> str:
+        """
+        요약 지표를 JSON 파일로 저장
+
+        Args:
+            path: 저장 경로
+
+        Returns:
+            str: 저장 경로
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
+        return path
+
+    def summary_text(self) -> str:
+        """실행 종료 시 출력할 단계별 요약표"""
+        summary = self.to_dict()
+        # 한글은 터미널에서 두 칸을 차지해 열이 어긋나므로 머리글은 영문으로 표시
+        lines = [f"{'stage':<22}{'count':>8}{'total(s)':>10}{'mean(ms)':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'errors':>8}"]
+        for stage, s in summary['stages'].items():
+            lines.append(f"{stage:<22}{s['count']:>8}{s['total_seconds']:>10.2f}{s['mean_seconds'] * 1000:>10.2f}"
+                         f"{s['p50_seconds'] * 1000:>10.2f}{s['p95_seconds'] * 1000:>10.2f}{s['errors']:>8}")
+        for stage, count in summary['errors'].items():
+            lines.append(f"{stage:<22}{'':>48}{count:>8}")
+        if summary['counters']:
+            lines.append(', '.join(f"{name}={value:g}" for name, value in summary['counters'].items()))
+        return '\n'.join(lines)
+
+    def prometheus_text(self, prefix: str = 'exif') -> str:
+        """Prometheus 텍스트 형식 지표"""
+        snapshot = self.snapshot()
+        lines = [f'# HELP {prefix}_stage_seconds Time spent per pipeline stage.',
+                 f'# TYPE {prefix}_stage_seconds histogram']
+        for stage, histogram in sorted(snapshot['stages'].items()):
+            cumulative = 0
+            for bound, count in zip(list(self.BUCKETS) + ['+Inf'], histogram['buckets']):
+                cumulative += count
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {histogram["sum"]:.6f}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {histogram["count"]}')
+        lines += [f'# HELP {prefix}_stage_errors_total Errors per pipeline stage.',
+                  f'# TYPE {prefix}_stage_errors_total counter']
+        lines += [f'{prefix}_stage_errors_total{{stage="{stage}"}} {count}'
+                  for stage, count in sorted(snapshot['errors'].items())]
+        for name, value in sorted(snapshot['counters'].items()):
+            lines += [f'# TYPE {prefix}_{name}_total counter', f'{prefix}_{name}_total {value:g}']
+        return '\n'.join(lines) + '\n'
+
+
+# 프로세스 전역 지표 저장소 (각 구성 요소가 기록하고 main/서비스가 출력)
+metrics = Metrics()
+
+
+def timed(stage: str) -> Callable:
+    """
+    함수 실행 시간을 전역 저장소의 단계 히스토그램에 기록하는 데코레이터
+
+    Args:
+        stage: 단계 이름
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metrics.timer(stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_metrics_server(host: str = '127.0.0.1', port: int = 9464, registry: Optional[Metrics] = None):
+    """
+    GET /metrics 로 Prometheus 텍스트 지표를 제공하는 HTTP 서버를 백그라운드 스레드에서 시작
+
+    Args:
+        host: 수신 주소
+        port: 수신 포트
+        registry: 제공할 지표 저장소 (생략 시 전역 저장소)
+
+    Returns:
+        ThreadingHTTPServer: 실행 중인 서버 (shutdown() 으로 종료)
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    registry = registry or metrics
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path != '/metrics':
+                self.send_error(404)
+                return
+            payload = registry.prometheus_text().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            logger.debug(f"{self.address_string()} {format % args}")
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"지표 엔드포인트 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
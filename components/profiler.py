@@ -0,0 +1,380 @@
+import io
+import os
+import re
+import json
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 저장소 최상위 디렉토리 (프로파일 항목을 구성 요소 파일로 귀속할 때 기준)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 메모리 할당 위치를 찾을 때 기록할 호출 스택 깊이 (깊을수록 이 저장소 코드까지 거슬러 올라가기 쉽지만 추적 비용이 커짐)
+TRACE_FRAMES = 10
+
+# 현재 프로세스에서 실행 중인 프로파일러 (작업 프로세스로 모드를 넘기고 결과를 합산할 때 사용)
+_active = None
+
+# 작업 프로세스에서 profile_call 실행 중인 프로파일 모드와, 그 작업이 다시 띄운 하위 작업 프로세스의 프로파일 데이터
+# (fork 로 복사된 _active 는 부모 프로세스로 돌아가지 않으므로 하위 데이터는 작업 결과와 함께 반환)
+_worker_mode = None
+_nested = None
+
+
+class Profiler:
+    """CPU(cProfile) 또는 메모리(tracemalloc) 프로파일을 기록하고 작업 프로세스 결과까지 합쳐 저장하는 클래스"""
+
+    MODES = ('cpu', 'memory')
+
+    def __init__(self, mode: str, output_dir: str, top: int = 30):
+        """
+        초기화 메서드
+
+        Args:
+            mode: 'cpu' 또는 'memory'
+            output_dir: 프로파일 파일 저장 디렉토리
+            top: 요약에 표시할 항목 수
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"지원되지 않는 프로파일 모드: {mode}")
+        self.mode = mode
+        self.output_dir = output_dir
+        self.top = top
+        self._profile = None
+        self._started_tracing = False
+        self._before = None
+        self._worker_stats = None  # 작업 프로세스에서 받은 cProfile 통계 합계 (pstats.Stats)
+        self._allocations = {}   # (파일, 줄) -> [크기 증가, 블록 수 증가]
+        self.worker_calls = 0
+        self.peak_bytes = 0
+        self.paths = {}
+        self._summary = ''
+        self._lock = threading.Lock()  # 서비스 모드에서는 여러 요청 스레드가 동시에 merge 함
+
+    def start(self) -> None:
+        """현재 프로세스 프로파일 시작"""
+        global _active
+        if self.mode == 'cpu':
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        else:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start(TRACE_FRAMES)
+            self._before = tracemalloc.take_snapshot()
+        _active = self
+
+    def merge(self, data: Optional[Dict[str, Any]]) -> None:
+        """
+        작업 프로세스에서 profile_call 로 받은 프로파일 데이터 합산
+
+        Args:
+            data: profile_call 이 반환한 데이터 (None 이면 무시)
+        """
+        pending = [data]
+        with self._lock:
+            while pending:
+                data = pending.pop()
+                if not data or data.get('mode') != self.mode:
+                    continue
+                # 작업 프로세스가 다시 띄운 하위 작업 프로세스의 데이터도 함께 합산
+                pending.extend(data.get('nested', ()))
+                self.worker_calls += 1
+                if self.mode == 'cpu':
+                    # 받은 즉시 합산해 오래 실행되는 서비스에서도 메모리가 호출 수에 비례해 늘지 않게 함
+                    if self._worker_stats is None:
+                        self._worker_stats = pstats.Stats()
+                    self._worker_stats.add(_StatsHolder(data['stats']))
+                else:
+                    _add_allocations(self._allocations, data['allocations'])
+                    self.peak_bytes = max(self.peak_bytes, data['peak_bytes'])
+
+    def stop(self) -> Dict[str, str]:
+        """
+        프로파일을 멈추고 덤프 파일과 요약 파일 저장
+
+        Returns:
+            Dict: 형식별 저장 경로 ('dump', 'summary')
+        """
+        global _active
+        _active = None
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.mode == 'cpu':
+            self._profile.disable()
+            return self._write_cpu()
+
+        after = tracemalloc.take_snapshot()
+        self.peak_bytes = max(self.peak_bytes, tracemalloc.get_traced_memory()[1])
+        if self._started_tracing:
+            tracemalloc.stop()
+        _add_allocations(self._allocations, _attribute_allocations(self._before, after))
+        self._before = None
+        return self._write_memory()
+
+    def summary_text(self) -> str:
+        """요약 텍스트 (stop 이후 호출)"""
+        return self._summary
+
+    def _write_cpu(self) -> Dict[str, str]:
+        """합친 cProfile 통계를 pstats 덤프와 요약으로 저장"""
+        stream = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=stream)
+        if self._worker_stats is not None:
+            stats.add(self._worker_stats)
+
+        try:
+            by_component = _attribute_cpu(stats.stats)
+        except RecursionError:
+            # 호출 그래프가 너무 깊으면 함수별 자체 시간을 그 함수의 구성 요소에 그대로 귀속
+            by_component = {}
+            for (filename, _, _), (_, _, tottime, _, _) in stats.stats.items():
+                by_component[_component(filename)] = by_component.get(_component(filename), 0.0) + tottime
+
+        lines = [f"CPU 프로파일 (작업 프로세스 호출 {self.worker_calls}건 포함, 총 {stats.total_tt:.2f}초)",
+                 '', '구성 요소별 실행 시간 (라이브러리 시간은 호출한 이 저장소 코드에 나눠 귀속, '
+                     '작업을 기다린 시간 포함):']
+        lines += [f"  {seconds:10.3f}초  {component}"
+                  for component, seconds in sorted(by_component.items(), key=lambda item: -item[1])[:self.top]]
+        lines += ['', f'누적 시간 상위 {self.top}개 함수 (이 저장소의 코드):']
+        stats.sort_stats('cumulative').print_stats(_project_pattern(), self.top)
+        lines.append(stream.getvalue().strip('\n'))
+        self._summary = '\n'.join(lines)
+
+        dump_path = os.path.join(self.output_dir, 'profile_cpu.pstats')
+        stats.dump_stats(dump_path)
+        return {'dump': dump_path, 'summary': self._write_summary('profile_cpu.txt')}
+
+    def _write_memory(self) -> Dict[str, str]:
+        """합친 할당 증가량을 JSON 덤프와 요약으로 저장"""
+        sites = sorted(self._allocations.items(), key=lambda item: -item[1][0])
+        by_component = {}
+        for (filename, _), (size, count) in sites:
+            total = by_component.setdefault(_component(filename), [0, 0])
+            total[0] += size
+            total[1] += count
+
+        lines = [f"메모리 프로파일 (작업 프로세스 호출 {self.worker_calls}건 포함, "
+                 f"최대 추적 메모리 {self.peak_bytes / 1024 / 1024:.1f}MB)",
+                 '', '구성 요소별 할당 증가량:']
+        lines += [f"  {size / 1024:12.1f}KB {count:10d}블록  {component}"
+                  for component, (size, count) in sorted(by_component.items(), key=lambda item: -item[1][0])[:self.top]]
+        lines += ['', f'할당 증가량 상위 {self.top}개 위치 (가장 가까운 이 저장소 코드 기준):']
+        lines += [f"  {size / 1024:12.1f}KB {count:10d}블록  {_display_path(filename)}:{lineno}"
+                  for (filename, lineno), (size, count) in sites[:self.top]]
+        self._summary = '\n'.join(lines)
+
+        dump_path = os.path.join(self.output_dir, 'profile_memory.json')
+        with open(dump_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'peak_bytes': self.peak_bytes,
+                'worker_calls': self.worker_calls,
+                'sites': [{'file': filename, 'line': lineno, 'size_diff': size, 'count_diff': count}
+                          for (filename, lineno), (size, count) in sites],
+            }, f, indent=2, ensure_ascii=False)
+        return {'dump': dump_path, 'summary': self._write_summary('profile_memory.txt')}
+
+    def _write_summary(self, file_name: str) -> str:
+        path = os.path.join(self.output_dir, file_name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self._summary + '\n')
+        return path
+
+    def __enter__(self) -> 'Profiler':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.paths = self.stop()
+
+
+class _StatsHolder:
+    """작업 프로세스에서 받은 통계 딕셔너리를 pstats.Stats.add 에 넘기기 위한 래퍼"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+def active_mode() -> Optional[str]:
+    """현재 프로세스에서 실행 중인 프로파일 모드 (작업 프로세스에 넘길 값, 없으면 None)"""
+    if _worker_mode:
+        return _worker_mode
+    return _active.mode if _active else None
+
+
+def merge_worker_profile(data: Optional[Dict[str, Any]]) -> None:
+    """
+    작업 프로세스 프로파일 데이터를 실행 중인 프로파일러에 합산 (프로파일 중이 아니면 무시)
+
+    작업 프로세스 안(profile_call 실행 중)에서 호출되면 그 작업의 반환 데이터에 모아 부모 프로세스로 넘김
+    """
+    if not data:
+        return
+    if _nested is not None:
+        _nested.append(data)
+    elif _active:
+        _active.merge(data)
+
+
+def profile_call(mode: Optional[str], func: Callable, *args) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    작업 프로세스에서 함수 한 번을 프로파일하며 실행
+
+    Args:
+        mode: 'cpu', 'memory' 또는 None (None 이면 프로파일 없이 실행)
+        func: 실행할 함수
+        *args: 함수 인자
+
+    Returns:
+        Tuple: (함수 반환값, 부모 프로세스에서 merge 할 프로파일 데이터 또는 None)
+    """
+    if mode not in Profiler.MODES:
+        return func(*args), None
+
+    global _worker_mode, _nested
+    previous = _worker_mode, _nested
+    _worker_mode, _nested = mode, []
+    try:
+        result, data = _profile_call(mode, func, *args)
+        if _nested:
+            data['nested'] = _nested
+        return result, data
+    finally:
+        _worker_mode, _nested = previous
+
+
+def _profile_call(mode: str, func: Callable, *args) -> Tuple[Any, Dict[str, Any]]:
+    """profile_call 에서 모드별로 함수 한 번을 프로파일"""
+    if mode == 'cpu':
+        profile = cProfile.Profile()
+        result = profile.runcall(func, *args)
+        profile.create_stats()
+        return result, {'mode': mode, 'stats': profile.stats}
+
+    # fork 로 물려받은 부모 프로세스의 추적 기록은 버리고 이번 호출의 할당만 추적하며,
+    # 스냅샷 비교는 추적을 멈춘 뒤에 해야 비교 자체의 할당까지 추적하느라 느려지지 않음
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(TRACE_FRAMES)
+    tracemalloc.clear_traces()
+    before = tracemalloc.take_snapshot()
+    try:
+        result = func(*args)
+        after = tracemalloc.take_snapshot()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, {'mode': mode, 'allocations': _attribute_allocations(before, after),
+                    'peak_bytes': peak_bytes}
+
+
+def _attribute_cpu(stats: Dict) -> Dict[str, float]:
+    """
+    함수별 자체 실행 시간을 구성 요소로 모음
+
+    외부 라이브러리 함수의 시간은 호출 그래프를 거슬러 올라가 처음 만나는 이 저장소 함수들에
+    호출 간선의 누적 시간 비율대로 나눠 귀속함
+
+    Args:
+        stats: pstats.Stats.stats
+
+    Returns:
+        Dict: 구성 요소 -> 초
+    """
+    shares = {}
+
+    def share(func, visiting):
+        # func 의 시간을 어느 구성 요소에 얼마의 비율로 귀속할지
+        if func in shares:
+            return shares[func]
+        if func in visiting:
+            # 재귀 호출(중첩 임포트 등)로 되돌아온 간선은 귀속 대상에서 제외
+            return {}
+        filename = func[0]
+        callers = stats[func][4]
+        if _in_project(filename) or not callers:
+            return {_component(filename): 1.0}
+        visiting.add(func)
+        result = {}
+        for caller, edge in callers.items():
+            if caller not in stats:
+                continue
+            for component, fraction in share(caller, visiting).items():
+                result[component] = result.get(component, 0.0) + fraction * edge[3]
+        visiting.discard(func)
+        total = sum(result.values())
+        if total <= 0:
+            # 모든 호출 경로가 재귀로 끊긴 경우 (최상위에서는 자기 구성 요소로 귀속)
+            return {} if visiting else {_component(filename): 1.0}
+        shares[func] = {component: value / total for component, value in result.items()}
+        return shares[func]
+
+    by_component = {}
+    for func, (_, _, tottime, _, _) in stats.items():
+        if tottime <= 0:
+            continue
+        for component, fraction in share(func, set()).items():
+            by_component[component] = by_component.get(component, 0.0) + tottime * fraction
+    return by_component
+
+
+def _attribute_allocations(before: tracemalloc.Snapshot,
+                           after: tracemalloc.Snapshot) -> Dict[Tuple[str, int], List[int]]:
+    """두 스냅샷의 할당 증가량을 호출 스택에서 가장 가까운 이 저장소 코드 위치로 모음 (없으면 할당 위치 그대로)"""
+    # 프로파일러와 tracemalloc 자체의 할당은 제외
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    allocations = {}
+    for diff in after.filter_traces(filters).compare_to(before.filter_traces(filters), 'traceback'):
+        if not diff.size_diff and not diff.count_diff:
+            continue
+        frame = next((frame for frame in reversed(diff.traceback) if _in_project(frame.filename)),
+                     diff.traceback[-1])
+        site = allocations.setdefault((frame.filename, frame.lineno), [0, 0])
+        site[0] += diff.size_diff
+        site[1] += diff.count_diff
+    return allocations
+
+
+def _add_allocations(total: Dict[Tuple[str, int], List[int]], other: Dict[Tuple[str, int], List[int]]) -> None:
+    for site, (size, count) in other.items():
+        entry = total.setdefault(site, [0, 0])
+        entry[0] += size
+        entry[1] += count
+
+
+def _in_project(filename: str) -> bool:
+    return filename.startswith(PROJECT_ROOT + os.sep) and f"{os.sep}site-packages{os.sep}" not in filename
+
+
+def _display_path(filename: str) -> str:
+    return os.path.relpath(filename, PROJECT_ROOT) if _in_project(filename) else filename
+
+
+def _component(filename: str) -> str:
+    """파일 경로를 구성 요소 이름으로 변환 (이 저장소 파일은 상대 경로, 외부 패키지는 [패키지명])"""
+    if _in_project(filename):
+        return os.path.relpath(filename, PROJECT_ROOT)
+    if filename.startswith('<frozen importlib'):
+        # 모듈 임포트 (작업 프로세스에서 처음 쓰는 라이브러리를 불러오는 비용)
+        return '[import]'
+    parts = filename.split(os.sep)
+    if 'site-packages' in parts:
+        index = parts.index('site-packages')
+        if index + 1 < len(parts):
+            return f"[{parts[index + 1].split('.')[0]}]"
+    if filename.startswith('<frozen'):
+        return '[stdlib]'
+    if filename.startswith('<') or filename == '~':
+        return '[builtins]'
+    return '[stdlib]'
+
+
+def _project_pattern() -> str:
+    """pstats.print_stats 에서 이 저장소 코드만 남기는 정규식"""
+    return re.escape(PROJECT_ROOT + os.sep)
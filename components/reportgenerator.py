@@ -1,28 +1,74 @@
 import os
+import glob
+import json
+import hashlib
 import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import matplotlib.pyplot as plt
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import A4
-from jinja2 import Template
-from typing import List, Dict, Any
+from components.fragmentcache import FragmentCache
+from components.metrics import metrics, timed
+from components import profiler
+from components.logconfig import init_worker_logging, worker_log_args
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Tuple, TYPE_CHECKING
+
+# reportlab, jinja2, pandas, matplotlib 은 임포트 비용이 커서 실제로 사용하는 메서드 안에서 임포트함
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 logger = logging.getLogger(__name__)
 
+# HTML 보고서 템플릿 디렉토리
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+
+# PDF/샤드 레이아웃을 바꾸면 올려서 캐시된 조각을 무효화
+FRAGMENT_LAYOUT_VERSION = '3'
+
 class ReportGenerator:
     """분석 보고서 생성을 담당하는 클래스"""
     
-    def __init__(self, output_dir: str = "reports"):
+    # 프로세스 내에서 공유하는 Jinja2 환경 (컴파일된 템플릿을 메모리에 캐시)
+    _template_env = None
+    
+    def __init__(self, output_dir: str = "reports", incremental: bool = True):
         """
         초기화 메서드
         
         Args:
             output_dir: 보고서 저장 디렉토리
+            incremental: True 이면 결과별 보고서 조각을 내용 해시로 캐시해 바뀐 부분만 다시 렌더링
         """
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        self.fragment_cache = FragmentCache(os.path.join(output_dir, '.report_cache')) if incremental else None
         logger.info(f"ReportGenerator 초기화 완료 (출력 디렉토리: {output_dir})")
     
+    @classmethod
+    def get_template_environment(cls) -> 'Environment':
+        """
+        템플릿 환경 반환 (최초 호출 시 생성)
+        
+        템플릿 바이트코드는 임시 디렉토리에 캐시되어 다음 실행에서도 컴파일을 생략함
+        
+        Returns:
+            Environment: 자동 이스케이프가 적용된 Jinja2 환경
+        """
+        if cls._template_env is None:
+            from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
+            cls._template_env = Environment(
+                loader=FileSystemLoader(TEMPLATE_DIR),
+                bytecode_cache=FileSystemBytecodeCache(),
+                autoescape=select_autoescape(['html']),
+            )
+        return cls._template_env
+    
+    @staticmethod
+    def _template_salt(name: str) -> str:
+        """템플릿 원본 해시 (템플릿이 바뀌면 캐시된 조각을 무효화하기 위한 값)"""
+        with open(os.path.join(TEMPLATE_DIR, name), 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    
+    @timed('report_pdf')
     def generate_pdf_report(self, analysis_results: List[Dict[str, Any]], 
                            output_file: str = None) -> str:
         """
@@ -40,6 +86,9 @@ class ReportGenerator:
             output_file = os.path.join(self.output_dir, f"exif_report_{timestamp}.pdf")
         
         try:
+            from reportlab.pdfgen import canvas
+            from reportlab.lib.pagesizes import A4
+            
             # PDF 캔버스 생성
             c = canvas.Canvas(output_file, pagesize=A4)
             width, height = A4
@@ -59,134 +108,317 @@ class ReportGenerator:
                     c.showPage()
                     y_position = height - 50
                 
-                exif_data = result.get('exif_data', {})
-                location_result = result.get('location_result', {})
-                time_result = result.get('time_result', {})
-                
-                # 파일 정보
-                c.setFont("Helvetica-Bold", 12)
-                c.drawString(50, y_position, f"이미지 {i+1}: {exif_data.get('file_name', '알 수 없음')}")
-                y_position -= 20
-                
-                # 카메라 정보
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(50, y_position, "카메라 정보:")
-                y_position -= 15
-                
-                c.setFont("Helvetica", 9)
-                camera_info = exif_data.get('camera', {})
-                for key, value in camera_info.items():
-                    c.drawString(60, y_position, f"{key}: {value}")
-                    y_position -= 12
-                
-                # GPS 정보
-                y_position -= 5
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(50, y_position, "위치 정보:")
-                y_position -= 15
-                
-                c.setFont("Helvetica", 9)
-                gps_info = exif_data.get('gps', {})
-                if 'coordinates' in gps_info:
-                    c.drawString(60, y_position, f"좌표: {gps_info['coordinates']}")
-                    y_position -= 12
-                    
-                    if 'address' in location_result and 'full_address' in location_result['address']:
-                        address = location_result['address']['full_address']
-                        # 긴 주소 처리
-                        if len(address) > 60:
-                            parts = [address[i:i+60] for i in range(0, len(address), 60)]
-                            for part in parts:
-                                c.drawString(60, y_position, part)
-                                y_position -= 12
-                        else:
-                            c.drawString(60, y_position, f"주소: {address}")
-                            y_position -= 12
-                
-                # 시간 정보
-                y_position -= 5
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(50, y_position, "시간 정보:")
-
-                y_position -= 15
-                
-                c.setFont("Helvetica", 9)
-                if time_result.get('has_time_data', False):
-                    if time_result.get('datetime_original'):
-                        c.drawString(60, y_position, f"촬영 시간: {time_result['datetime_original']}")
-                        y_position -= 12
-                    if time_result.get('gps_datetime'):
-                        c.drawString(60, y_position, f"GPS 시간: {time_result['gps_datetime']}")
-                        y_position -= 12
-                    if time_result.get('local_timezone'):
-                        c.drawString(60, y_position, f"시간대: {time_result['local_timezone']}")
-                        y_position -= 12
-                else:
-                    c.drawString(60, y_position, "시간 정보 없음")
-                    y_position -= 12
-                
-                # 검증 결과
-                y_position -= 5
-                c.setFont("Helvetica-Bold", 10)
-                c.drawString(50, y_position, "검증 결과:")
-                y_position -= 15
-                
-                c.setFont("Helvetica", 9)
-                # 위치 검증 결과
-                if location_result.get('has_gps_data', False):
-                    valid_text = "유효함" if location_result.get('location_valid', False) else "유효하지 않음"
-                    c.drawString(60, y_position, f"GPS 데이터: {valid_text}")
-                    y_position -= 12
-                    
-                    if location_result.get('distance_from_reference') is not None:
-                        distance = location_result['distance_from_reference']
-                        within = "예" if location_result.get('within_threshold', False) else "아니오"
-                        c.drawString(60, y_position, f"기준점과의 거리: {distance:.2f}km (허용 범위 내: {within})")
-                        y_position -= 12
-                else:
-                    c.drawString(60, y_position, "GPS 데이터 없음")
-                    y_position -= 12
-                
-                # 시간 검증 결과
-                if time_result.get('has_time_data', False):
-                    consistent = "일관성 있음" if time_result.get('consistent', False) else "불일치 있음"
-                    c.drawString(60, y_position, f"시간 정보: {consistent}")
-                    y_position -= 12
-                    
-                    # 시간 차이 표시
-                    if time_result.get('time_differences'):
-                        for diff_key, diff_value in time_result['time_differences'].items():
-                            if diff_value > 60:  # 1분 이상 차이날 경우만 표시
-                                c.drawString(60, y_position, f"{diff_key} 차이: {diff_value/60:.1f}분")
-                                y_position -= 12
-                
-                # 특이사항
-                if time_result.get('notes'):
-                    y_position -= 5
-                    c.setFont("Helvetica-Bold", 10)
-                    c.drawString(50, y_position, "특이사항:")
-                    y_position -= 15
-                    
-                    c.setFont("Helvetica", 9)
-                    for note in time_result.get('notes', [])[:3]:  # 최대 3개 노트만 표시
-                        c.drawString(60, y_position, f"- {note}")
-                        y_position -= 12
-                
-                # 구분선
-                y_position -= 10
-                c.setLineWidth(0.5)
-                c.line(50, y_position, width - 50, y_position)
-                y_position -= 20
+                y_position = self._draw_pdf_entry(c, i, result, y_position, width)
             
             # PDF 저장
             c.save()
             logger.info(f"PDF 보고서 생성 완료: {output_file}")
             return output_file
             
+        except ImportError as e:
+            logger.warning(f"reportlab 라이브러리가 설치되지 않아 PDF 보고서를 생성하지 않습니다: {e}")
+            return ""
         except Exception as e:
+            metrics.error('report_pdf')
             logger.error(f"PDF 보고서 생성 중 오류: {e}")
             return ""
     
+    @timed('report_pdf_volumes')
+    def generate_pdf_volumes(self, analysis_results: Iterable[Dict[str, Any]],
+                             volume_size: int = 1000, workers: int = 1,
+                             output_prefix: str = None) -> Dict[str, Any]:
+        """
+        분석 결과를 스트리밍하며 평균 volume_size 건씩 나눈 PDF 볼륨과 색인 PDF 생성
+        
+        한 번에 메모리에 올리는 결과는 (workers * 2) 개 볼륨 분량으로 제한되며,
+        볼륨은 별도 프로세스에서 병렬로 렌더링됨.
+        볼륨 경계와 파일 이름은 결과 내용으로 정해지므로(_content_segments) 결과가 추가/삭제되어도
+        해당 볼륨만 다시 렌더링되고, 볼륨 번호와 전체 순번은 매번 새로 쓰는 색인에만 표시됨
+        
+        Args:
+            analysis_results: 분석 결과 이터러블 (리스트 또는 제너레이터)
+            volume_size: 볼륨당 평균 이미지 수 (최소 절반, 최대 2배)
+            workers: 볼륨 렌더링 프로세스 수 (1 이하이면 현재 프로세스에서 순차 처리)
+            output_prefix: 출력 파일 경로 접두사 (기본값: output_dir/exif_report)
+            
+        Returns:
+            Dict: {'index': 색인 PDF 경로, 'volumes': 볼륨 정보 목록}
+        """
+        if not output_prefix:
+            output_prefix = os.path.join(self.output_dir, 'exif_report')
+        
+        generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        cache = self.fragment_cache.namespace('pdf_volume') if self.fragment_cache else None
+        volume_paths = []     # 볼륨 순서
+        volume_info = {}      # 볼륨 경로 -> 볼륨 정보
+        volume_keys = {}
+        
+        def jobs():
+            for batch in _content_segments(analysis_results, volume_size):
+                key = FragmentCache.make_key(batch, FRAGMENT_LAYOUT_VERSION)
+                path = f"{output_prefix}_vol-{key[:16]}.pdf"
+                volume_paths.append(path)
+                if path in volume_info or path in volume_keys:
+                    continue
+                if cache:
+                    # 내용이 같은 볼륨은 다시 렌더링하지 않고 기존 파일을 사용
+                    cached = cache.get(key)
+                    if cached and os.path.exists(path):
+                        volume_info[path] = json.loads(cached)
+                        continue
+                volume_keys[path] = key
+                yield (path, batch)
+        
+        try:
+            for volume in self._map_bounded(_render_pdf_volume, jobs(), workers):
+                volume_info[volume['path']] = volume
+                if cache:
+                    cache.put(volume_keys[volume['path']], json.dumps(volume, ensure_ascii=False))
+            if cache:
+                cache.prune()
+                logger.info(f"PDF 볼륨 캐시: {cache.hits}개 재사용, {cache.misses}개 렌더링")
+            
+            # 볼륨 번호와 전체 순번은 색인에서만 사용
+            volumes = []
+            first_index = 0
+            for number, path in enumerate(volume_paths, 1):
+                volumes.append(dict(volume_info[path], number=number, first_index=first_index))
+                first_index += volume_info[path]['count']
+            _remove_stale_files(glob.escape(output_prefix) + '_vol*.pdf', volume_paths)
+            
+            index_path = self._write_pdf_index(f"{output_prefix}_index.pdf", volumes, generated_at)
+            logger.info(f"PDF 볼륨 보고서 생성 완료: {len(volumes)}개 볼륨, 색인 {index_path}")
+            return {'index': index_path, 'volumes': volumes}
+            
+        except ImportError as e:
+            logger.warning(f"reportlab 라이브러리가 설치되지 않아 PDF 보고서를 생성하지 않습니다: {e}")
+            return {'index': "", 'volumes': []}
+        except Exception as e:
+            metrics.error('report_pdf_volumes')
+            logger.error(f"PDF 볼륨 보고서 생성 중 오류: {e}")
+            return {'index': "", 'volumes': []}
+    
+    @staticmethod
+    def _map_bounded(func: Callable, jobs: Iterable, workers: int) -> Iterator:
+        """
+        작업을 프로세스 풀에서 실행하고 입력 순서대로 결과를 반환
+        
+        진행 중인 작업을 workers 의 2배로 제한해 jobs 가 제너레이터일 때
+        메모리에 올라오는 입력이 일정하게 유지됨
+        
+        Args:
+            func: 모듈 수준 작업 함수 (피클 가능해야 함)
+            jobs: 작업 인자 이터러블
+            workers: 프로세스 수 (1 이하이면 현재 프로세스에서 순차 처리)
+            
+        Yields:
+            func 의 반환값
+        """
+        if workers <= 1:
+            for job in jobs:
+                yield func(job)
+            return
+        
+        def collect(future):
+            # 작업 프로세스에서 기록된 지표와 프로파일을 합산하고 결과만 반환
+            result, snapshot, profile = future.result()
+            metrics.merge(snapshot)
+            profiler.merge_worker_profile(profile)
+            return result
+        
+        profile_mode = profiler.active_mode()
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker_logging,
+                                 initargs=worker_log_args()) as executor:
+            for job in jobs:
+                pending.append(executor.submit(_run_job, func, job, profile_mode))
+                if len(pending) >= workers * 2:
+                    yield collect(pending.popleft())
+            while pending:
+                yield collect(pending.popleft())
+    
+    def _write_pdf_index(self, output_file: str, volumes: List[Dict[str, Any]], generated_at: str) -> str:
+        """
+        볼륨 목록과 전체 요약을 담은 색인 PDF 생성
+        
+        Args:
+            output_file: 색인 PDF 경로
+            volumes: 볼륨 정보 목록 (_render_pdf_volume 결과에 색인용 number, first_index 추가)
+            generated_at: 생성일시 문자열
+            
+        Returns:
+            str: 생성된 색인 PDF 경로
+        """
+        from reportlab.pdfgen import canvas
+        from reportlab.lib.pagesizes import A4
+        
+        c = canvas.Canvas(output_file, pagesize=A4)
+        width, height = A4
+        
+        total_images = sum(v['count'] for v in volumes)
+        gps_images = sum(v['gps_images'] for v in volumes)
+        time_images = sum(v['time_images'] for v in volumes)
+        
+        c.setFont("Helvetica-Bold", 16)
+        c.drawString(50, height - 50, "EXIF 메타데이터 분석 보고서 - 색인")
+        c.setFont("Helvetica", 10)
+        c.drawString(50, height - 70, f"생성일시: {generated_at}")
+        c.drawString(50, height - 85, f"분석 파일 수: {total_images} (GPS {gps_images}, 시간 {time_images})")
+        c.drawString(50, height - 100, f"볼륨 수: {len(volumes)}")
+        
+        y_position = height - 130
+        for volume in volumes:
+            if y_position < 80:
+                c.showPage()
+                y_position = height - 50
+            
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(50, y_position, f"볼륨 {volume['number']}: {os.path.basename(volume['path'])}")
+            y_position -= 14
+            c.setFont("Helvetica", 9)
+            c.drawString(60, y_position, f"이미지 {volume['first_index'] + 1} - {volume['first_index'] + volume['count']}: "
+                                        f"{volume['first_file']} ~ {volume['last_file']}")
+            y_position -= 20
+        
+        c.save()
+        return output_file
+    
+    @staticmethod
+    def _draw_pdf_entry(c, i: int, result: Dict[str, Any], y_position: float, width: float) -> float:
+        """
+        PDF 캔버스에 이미지 한 건의 분석 결과를 그림
+        
+        Args:
+            c: reportlab 캔버스
+            i: 보고서(볼륨)에서의 인덱스 (0부터 시작)
+            result: 이미지 분석 결과
+            y_position: 그리기 시작할 y 좌표
+            width: 페이지 폭
+            
+        Returns:
+            float: 다음 항목을 그릴 y 좌표
+        """
+        exif_data = result.get('exif_data', {})
+        location_result = result.get('location_result', {})
+        time_result = result.get('time_result', {})
+
+        # 파일 정보
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(50, y_position, f"이미지 {i+1}: {exif_data.get('file_name', '알 수 없음')}")
+        y_position -= 20
+
+        # 카메라 정보
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(50, y_position, "카메라 정보:")
+        y_position -= 15
+
+        c.setFont("Helvetica", 9)
+        camera_info = exif_data.get('camera', {})
+        for key, value in camera_info.items():
+            c.drawString(60, y_position, f"{key}: {value}")
+            y_position -= 12
+
+        # GPS 정보
+        y_position -= 5
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(50, y_position, "위치 정보:")
+        y_position -= 15
+
+        c.setFont("Helvetica", 9)
+        gps_info = exif_data.get('gps', {})
+        if 'coordinates' in gps_info:
+            c.drawString(60, y_position, f"좌표: {gps_info['coordinates']}")
+            y_position -= 12
+
+            if 'address' in location_result and 'full_address' in location_result['address']:
+                address = location_result['address']['full_address']
+                # 긴 주소 처리
+                if len(address) > 60:
+                    parts = [address[i:i+60] for i in range(0, len(address), 60)]
+                    for part in parts:
+                        c.drawString(60, y_position, part)
+                        y_position -= 12
+                else:
+                    c.drawString(60, y_position, f"주소: {address}")
+                    y_position -= 12
+
+        # 시간 정보
+        y_position -= 5
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(50, y_position, "시간 정보:")
+
+        y_position -= 15
+
+        c.setFont("Helvetica", 9)
+        if time_result.get('has_time_data', False):
+            if time_result.get('datetime_original'):
+                c.drawString(60, y_position, f"촬영 시간: {time_result['datetime_original']}")
+                y_position -= 12
+            if time_result.get('gps_datetime'):
+                c.drawString(60, y_position, f"GPS 시간: {time_result['gps_datetime']}")
+                y_position -= 12
+            if time_result.get('local_timezone'):
+                c.drawString(60, y_position, f"시간대: {time_result['local_timezone']}")
+                y_position -= 12
+        else:
+            c.drawString(60, y_position, "시간 정보 없음")
+            y_position -= 12
+
+        # 검증 결과
+        y_position -= 5
+        c.setFont("Helvetica-Bold", 10)
+        c.drawString(50, y_position, "검증 결과:")
+        y_position -= 15
+
+        c.setFont("Helvetica", 9)
+        # 위치 검증 결과
+        if location_result.get('has_gps_data', False):
+            valid_text = "유효함" if location_result.get('location_valid', False) else "유효하지 않음"
+            c.drawString(60, y_position, f"GPS 데이터: {valid_text}")
+            y_position -= 12
+
+            if location_result.get('distance_from_reference') is not None:
+                distance = location_result['distance_from_reference']
+                within = "예" if location_result.get('within_threshold', False) else "아니오"
+                c.drawString(60, y_position, f"기준점과의 거리: {distance:.2f}km (허용 범위 내: {within})")
+                y_position -= 12
+        else:
+            c.drawString(60, y_position, "GPS 데이터 없음")
+            y_position -= 12
+
+        # 시간 검증 결과
+        if time_result.get('has_time_data', False):
+            consistent = "일관성 있음" if time_result.get('consistent', False) else "불일치 있음"
+            c.drawString(60, y_position, f"시간 정보: {consistent}")
+            y_position -= 12
+
+            # 시간 차이 표시
+            if time_result.get('time_differences'):
+                for diff_key, diff_value in time_result['time_differences'].items():
+                    if diff_value > 60:  # 1분 이상 차이날 경우만 표시
+                        c.drawString(60, y_position, f"{diff_key} 차이: {diff_value/60:.1f}분")
+                        y_position -= 12
+
+        # 특이사항
+        if time_result.get('notes'):
+            y_position -= 5
+            c.setFont("Helvetica-Bold", 10)
+            c.drawString(50, y_position, "특이사항:")
+            y_position -= 15
+
+            c.setFont("Helvetica", 9)
+            for note in time_result.get('notes', [])[:3]:  # 최대 3개 노트만 표시
+                c.drawString(60, y_position, f"- {note}")
+                y_position -= 12
+
+        # 구분선
+        y_position -= 10
+        c.setLineWidth(0.5)
+        c.line(50, y_position, width - 50, y_position)
+        y_position -= 20
+        return y_position
+    
+    @timed('report_html')
     def generate_html_report(self, analysis_results: List[Dict[str, Any]], 
                             map_path: str = None, output_file: str = None) -> str:
         """
@@ -205,225 +437,10 @@ class ReportGenerator:
             output_file = os.path.join(self.output_dir, f"exif_report_{timestamp}.html")
             
         try:
-            # HTML 템플릿
-            html_template = """
-            <!DOCTYPE html>
-            <html lang="ko">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>EXIF 메타데이터 분석 보고서</title>
-                <style>
-                    body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; color: #333; }
-                    .container { max-width: 1200px; margin: 0 auto; }
-                    h1, h2, h3 { color: #2c3e50; }
-                    .header { margin-bottom: 30px; border-bottom: 1px solid #eee; padding-bottom: 20px; }
-                    .summary { background-color: #f9f9f9; padding: 15px; border-radius: 5px; margin-bottom: 30px; }
-                    .image-card { margin-bottom: 30px; border: 1px solid #ddd; border-radius: 5px; padding: 20px; }
-                    .image-header { display: flex; justify-content: space-between; border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 15px; }
-                    .image-body { display: flex; flex-wrap: wrap; }
-                    .image-section { margin-bottom: 20px; flex: 1; min-width: 300px; }
-                    .data-table { width: 100%; border-collapse: collapse; }
-                    .data-table td, .data-table th { border: 1px solid #ddd; padding: 8px; }
-                    .data-table th { background-color: #f2f2f2; text-align: left; }
-                    .map-container { margin: 30px 0; height: 500px; }
-                    .map-container iframe { width: 100%; height: 100%; border: none; }
-                    .validation-result { padding: 10px; border-radius: 5px; margin-top: 10px; }
-                    .valid { background-color: #d4edda; color: #155724; }
-                    .invalid { background-color: #f8d7da; color: #721c24; }
-                    .warning { background-color: #fff3cd; color: #856404; }
-                    .notes { background-color: #e2e3e5; color: #383d41; padding: 10px; border-radius: 5px; margin-top: 20px; }
-                </style>
-            </head>
-            <body>
-                <div class="container">
-                    <div class="header">
-                        <h1>EXIF 메타데이터 분석 보고서</h1>
-                        <p>생성일시: {{ current_datetime }}</p>
-                    </div>
-                    
-                    <div class="summary">
-                        <h2>요약</h2>
-                        <p>분석된 이미지 수: {{ total_images }}</p>
-                        <p>GPS 데이터 포함 이미지: {{ gps_images }}</p>
-                        <p>시간 데이터 포함 이미지: {{ time_images }}</p>
-                        <p>위치 검증 통과율: {{ location_valid_rate }}%</p>
-                        <p>시간 정보 일관성 통과율: {{ time_valid_rate }}%</p>
-                    </div>
-                    
-                    {% if map_path %}
-                    <div class="map-container">
-                        <h2>촬영 위치 지도</h2>
-                        <iframe src="{{ map_path }}"></iframe>
-                    </div>
-                    {% endif %}
-                    
-                    <h2>이미지 분석 결과</h2>
-                    
-                    {% for result in results %}
-                    <div class="image-card">
-                        <div class="image-header">
-                            <h3>{{ result.exif_data.file_name }}</h3>
-                        </div>
-                        
-                        <div class="image-body">
-                            <div class="image-section">
-                                <h4>카메라 정보</h4>
-                                <table class="data-table">
-                                    <tr>
-                                        <th>속성</th>
-                                        <th>값</th>
-                                    </tr>
-                                    {% for key, value in result.exif_data.camera.items() %}
-                                    <tr>
-                                        <td>{{ key }}</td>
-                                        <td>{{ value }}</td>
-                                    </tr>
-                                    {% endfor %}
-                                    {% for key, value in result.exif_data.image.items() %}
-                                    <tr>
-                                        <td>{{ key }}</td>
-                                        <td>{{ value }}</td>
-                                    </tr>
-                                    {% endfor %}
-                                </table>
-                            </div>
-                            
-                            <div class="image-section">
-                                <h4>위치 정보</h4>
-                                {% if result.location_result.has_gps_data %}
-                                <table class="data-table">
-                                    <tr>
-                                        <th>속성</th>
-                                        <th>값</th>
-                                    </tr>
-                                    <tr>
-                                        <td>좌표</td>
-                                        <td>{{ result.exif_data.gps.coordinates[0] }}, {{ result.exif_data.gps.coordinates[1] }}</td>
-                                    </tr>
-                                    {% if result.location_result.address %}
-                                    <tr>
-                                        <td>주소</td>
-                                        <td>{{ result.location_result.address.full_address }}</td>
-                                    </tr>
-                                    {% endif %}
-                                    {% if result.location_result.distance_from_reference is not none %}
-                                    <tr>
-                                        <td>기준점과의 거리</td>
-                                        <td>{{ "%.2f"|format(result.location_result.distance_from_reference) }} km</td>
-                                    </tr>
-                                    {% endif %}
-                                </table>
-                                
-                                <div class="validation-result {% if result.location_result.location_valid %}valid{% else %}invalid{% endif %}">
-                                    위치 데이터 검증: 
-                                    {% if result.location_result.location_valid %}
-                                        유효함
-                                    {% else %}
-                                        유효하지 않음
-                                    {% endif %}
-                                </div>
-                                
-                                {% if result.location_result.within_threshold is not none %}
-                                <div class="validation-result {% if result.location_result.within_threshold %}valid{% else %}warning{% endif %}">
-                                    허용 범위 내 위치: 
-                                    {% if result.location_result.within_threshold %}
-                                        예
-                                    {% else %}
-                                        아니오
-                                    {% endif %}
-                                </div>
-                                {% endif %}
-                                
-                                {% else %}
-                                <p>GPS 데이터 없음</p>
-                                {% endif %}
-                            </div>
-                            
-                            <div class="image-section">
-                                <h4>시간 정보</h4>
-                                {% if result.time_result.has_time_data %}
-                                <table class="data-table">
-                                    <tr>
-                                        <th>속성</th>
-                                        <th>값</th>
-                                    </tr>
-                                    {% if result.time_result.datetime_original %}
-                                    <tr>
-                                        <td>촬영 시간</td>
-                                        <td>{{ result.time_result.datetime_original }}</td>
-                                    </tr>
-                                    {% endif %}
-                                    {% if result.time_result.datetime_digitized %}
-                                    <tr>
-                                        <td>기록 시간</td>
-                                        <td>{{ result.time_result.datetime_digitized }}</td>
-                                    </tr>
-                                    {% endif %}
-                                    {% if result.time_result.gps_datetime %}
-                                    <tr>
-                                        <td>GPS 시간</td>
-                                        <td>{{ result.time_result.gps_datetime }}</td>
-                                    </tr>
-                                    {% endif %}
-                                    {% if result.time_result.local_timezone %}
-                                    <tr>
-                                        <td>현지 시간대</td>
-                                        <td>{{ result.time_result.local_timezone }}</td>
-                                    </tr>
-                                    {% endif %}
-                                </table>
-                                
-                                <div class="validation-result {% if result.time_result.consistent %}valid{% else %}warning{% endif %}">
-                                    시간 정보 일관성: 
-                                    {% if result.time_result.consistent %}
-                                        일관성 있음
-                                    {% else %}
-                                        불일치 있음
-                                    {% endif %}
-                                </div>
-                                
-                                {% if result.time_result.time_differences %}
-                                <h5>시간 차이</h5>
-                                <table class="data-table">
-                                    <tr>
-                                        <th>비교 항목</th>
-                                        <th>차이 (초)</th>
-                                    </tr>
-                                    {% for key, value in result.time_result.time_differences.items() %}
-                                    <tr>
-                                        <td>{{ key }}</td>
-                                        <td>{{ value }}</td>
-                                    </tr>
-                                    {% endfor %}
-                                </table>
-                                {% endif %}
-                                
-                                {% else %}
-                                <p>시간 데이터 없음</p>
-                                {% endif %}
-                            </div>
-                        </div>
-                        
-                        {% if result.time_result.notes %}
-                        <div class="notes">
-                            <h4>특이사항</h4>
-                            <ul>
-                                {% for note in result.time_result.notes %}
-                                <li>{{ note }}</li>
-                                {% endfor %}
-                            </ul>
-                        </div>
-                        {% endif %}
-                    </div>
-                    {% endfor %}
-                </div>
-            </body>
-            </html>
-            """
+            from markupsafe import Markup
             
             # Jinja2 사용하여 HTML 생성
-            template = Template(html_template)
+            template = self.get_template_environment().get_template('report.html')
             
             # 요약 통계 계산
             total_images = len(analysis_results)
@@ -441,8 +458,25 @@ class ReportGenerator:
             # 상대 경로로 지도 경로 변환
             map_rel_path = os.path.relpath(map_path, self.output_dir) if map_path else None
             
-            # HTML 렌더링
-            html_content = template.render(
+            # 이미지별 카드는 결과 내용 해시로 캐시하고 새로 추가되거나 바뀐 결과만 렌더링
+            card_template = self.get_template_environment().get_template('report_card.html')
+            cache = self.fragment_cache.namespace('html_card') if self.fragment_cache else None
+            card_salt = self._template_salt('report_card.html') if cache else ''
+            
+            def cards():
+                for result in analysis_results:
+                    if cache:
+                        key = cache.make_key(result, card_salt)
+                        card = cache.get(key)
+                        if card is None:
+                            card = card_template.render(result=result)
+                            cache.put(key, card)
+                    else:
+                        card = card_template.render(result=result)
+                    yield Markup(card)
+            
+            # HTML 렌더링 (전체 문자열을 만들지 않고 파일로 바로 스트리밍)
+            template.stream(
                 current_datetime=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 total_images=total_images,
                 gps_images=gps_images,
@@ -450,20 +484,124 @@ class ReportGenerator:
                 location_valid_rate=location_valid_rate,
                 time_valid_rate=time_valid_rate,
                 map_path=map_rel_path,
-                results=analysis_results
-            )
+                cards=cards()
+            ).dump(output_file, encoding='utf-8')
+            if cache:
+                cache.prune()
+                logger.info(f"HTML 카드 캐시: {cache.hits}개 재사용, {cache.misses}개 렌더링")
             
-            # HTML 파일 저장
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-                
             logger.info(f"HTML 보고서 생성 완료: {output_file}")
             return output_file
             
+        except ImportError as e:
+            logger.warning(f"jinja2 라이브러리가 설치되지 않아 HTML 보고서를 생성하지 않습니다: {e}")
+            return ""
         except Exception as e:
+            metrics.error('report_html')
             logger.error(f"HTML 보고서 생성 중 오류: {e}")
             return ""
     
+    @timed('report_html_sharded')
+    def generate_sharded_html_report(self, analysis_results: Iterable[Dict[str, Any]],
+                                     map_path: str = None, output_file: str = None,
+                                     shard_size: int = 500, workers: int = 1) -> str:
+        """
+        요약/검색용 색인 페이지와 필요할 때 로드되는 결과 샤드로 나눈 HTML 보고서 생성
+        
+        색인 페이지는 결과 수와 관계없이 작게 유지되며, 목록은 가상 스크롤로
+        화면에 보이는 행만 그리고 해당 샤드만 로드함.
+        샤드 경계와 파일 이름은 결과 내용으로 정해지므로 결과가 추가/삭제되어도 해당 샤드만 다시 작성됨
+        
+        Args:
+            analysis_results: 분석 결과 이터러블 (리스트 또는 제너레이터)
+            map_path: 생성된 지도 HTML 파일 경로
+            output_file: 색인 HTML 파일 경로
+            shard_size: 샤드당 평균 이미지 수 (최소 절반, 최대 2배)
+            workers: 샤드 작성 프로세스 수
+            
+        Returns:
+            str: 생성된 색인 HTML 파일 경로
+        """
+        if not output_file:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_file = os.path.join(self.output_dir, f"exif_report_{timestamp}.html")
+        
+        try:
+            output_dir = os.path.dirname(os.path.abspath(output_file))
+            shard_dir_name = os.path.splitext(os.path.basename(output_file))[0] + '_shards'
+            shard_dir = os.path.join(output_dir, shard_dir_name)
+            os.makedirs(shard_dir, exist_ok=True)
+            
+            stats = {'total': 0, 'gps': 0, 'time': 0, 'location_valid': 0, 'time_valid': 0}
+            
+            def shard_jobs():
+                for batch in _content_segments(analysis_results, shard_size):
+                    # 요약 통계는 샤드를 넘기기 전에 누적
+                    for r in batch:
+                        location_result = r.get('location_result', {})
+                        time_result = r.get('time_result', {})
+                        stats['total'] += 1
+                        stats['gps'] += 1 if location_result.get('has_gps_data', False) else 0
+                        stats['time'] += 1 if time_result.get('has_time_data', False) else 0
+                        stats['location_valid'] += 1 if location_result.get('location_valid', False) else 0
+                        stats['time_valid'] += 1 if time_result.get('consistent', False) else 0
+                    key = FragmentCache.make_key(batch, FRAGMENT_LAYOUT_VERSION)
+                    path = os.path.join(shard_dir, f"shard-{key[:16]}.js")
+                    shard_offsets.append(stats['total'] - len(batch))
+                    shard_files.append(os.path.basename(path))
+                    if path in shard_keys:
+                        continue
+                    shard_keys[path] = key
+                    # 내용이 같은 샤드는 다시 쓰지 않음
+                    if cache and cache.get(key) is not None and os.path.exists(path):
+                        continue
+                    yield (path, batch)
+            
+            cache = self.fragment_cache.namespace('html_shard') if self.fragment_cache else None
+            shard_keys = {}
+            shard_files = []
+            shard_offsets = []    # 샤드별 첫 결과의 전체 순번
+            for path in self._map_bounded(_write_html_shard, shard_jobs(), workers):
+                if cache:
+                    cache.put(shard_keys[path], '')
+            if cache:
+                cache.prune()
+                logger.info(f"HTML 샤드 캐시: {cache.hits}개 재사용, {cache.misses}개 작성")
+            _remove_stale_files(os.path.join(glob.escape(shard_dir), 'shard*.js'),
+                                [os.path.join(shard_dir, name) for name in shard_files])
+            
+            map_rel_path = os.path.relpath(map_path, output_dir) if map_path else None
+            manifest = {
+                'total': stats['total'],
+                'shard_dir': shard_dir_name,
+                'shard_files': shard_files,
+                'shard_offsets': shard_offsets,
+            }
+            
+            template = self.get_template_environment().get_template('report_index.html')
+            template.stream(
+                current_datetime=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                total_images=stats['total'],
+                gps_images=stats['gps'],
+                time_images=stats['time'],
+                location_valid_rate=int(stats['location_valid'] / stats['gps'] * 100) if stats['gps'] else 0,
+                time_valid_rate=int(stats['time_valid'] / stats['time'] * 100) if stats['time'] else 0,
+                map_path=map_rel_path,
+                manifest=manifest
+            ).dump(output_file, encoding='utf-8')
+            
+            logger.info(f"샤드 HTML 보고서 생성 완료: {output_file} ({len(shard_files)}개 샤드)")
+            return output_file
+            
+        except ImportError as e:
+            logger.warning(f"jinja2 라이브러리가 설치되지 않아 HTML 보고서를 생성하지 않습니다: {e}")
+            return ""
+        except Exception as e:
+            metrics.error('report_html_sharded')
+            logger.error(f"샤드 HTML 보고서 생성 중 오류: {e}")
+            return ""
+    
+    @timed('report_visualization')
     def generate_data_visualization(self, analysis_results: List[Dict[str, Any]], 
                                    output_file: str = None) -> str:
         """
@@ -481,61 +619,320 @@ class ReportGenerator:
             output_file = os.path.join(self.output_dir, f"exif_visualization_{timestamp}.png")
         
         try:
-            # 분석 데이터 추출
-            file_names = []
-            has_gps = []
-            has_time = []
-            location_valid = []
-            time_consistent = []
+            import numpy as np
+            import pandas as pd
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
             
+            # 결과를 한 번만 순회해 평탄화한 뒤 이후 집계는 모두 벡터 연산으로 처리
+            rows = []
             for result in analysis_results:
                 exif_data = result.get('exif_data', {})
                 location_result = result.get('location_result', {})
                 time_result = result.get('time_result', {})
-                
-                file_names.append(os.path.basename(exif_data.get('file_path', 'unknown')))
-                has_gps.append(1 if location_result.get('has_gps_data', False) else 0)
-                has_time.append(1 if time_result.get('has_time_data', False) else 0)
-                location_valid.append(1 if location_result.get('location_valid', False) else 0)
-                time_consistent.append(1 if time_result.get('consistent', False) else 0)
-            
-            # 인덱스 생성
-            indices = list(range(len(file_names)))
-            
-            # 그래프 생성
-            plt.figure(figsize=(12, 8))
-            
-            # 이미지별 데이터 유무 막대 그래프
-            plt.subplot(2, 1, 1)
-            bar_width = 0.35
-            plt.bar(indices, has_gps, bar_width, label='GPS 데이터')
-            plt.bar([i + bar_width for i in indices], has_time, bar_width, label='시간 데이터')
-            plt.xlabel('이미지')
-            plt.ylabel('데이터 유무')
-            plt.title('이미지별 메타데이터 유무')
-            plt.xticks([i + bar_width/2 for i in indices], file_names, rotation=45, ha='right')
-            plt.legend()
-            plt.tight_layout()
-            
-            # 검증 결과 그래프
-            plt.subplot(2, 1, 2)
-            bar_width = 0.35
-            plt.bar(indices, location_valid, bar_width, label='위치 유효')
-            plt.bar([i + bar_width for i in indices], time_consistent, bar_width, label='시간 일관성')
-            plt.xlabel('이미지')
-            plt.ylabel('검증 결과')
-            plt.title('이미지별 검증 결과')
-            plt.xticks([i + bar_width/2 for i in indices], file_names, rotation=45, ha='right')
-            plt.legend()
-            plt.tight_layout()
-            
-            # 이미지 저장
-            plt.savefig(output_file)
-            plt.close()
+                camera = exif_data.get('camera', {})
+                coords = exif_data.get('gps', {}).get('coordinates')
+                rows.append((
+                    location_result.get('has_gps_data', False),
+                    time_result.get('has_time_data', False),
+                    location_result.get('location_valid', False),
+                    time_result.get('consistent', False),
+                    location_result.get('distance_from_reference'),
+                    location_result.get('within_threshold'),
+                    time_result.get('datetime_original'),
+                    ' '.join(v for v in (camera.get('Make'), camera.get('Model')) if v) or '알 수 없음',
+                    coords[0] if coords else None,
+                    coords[1] if coords else None,
+                ))
+            
+            df = pd.DataFrame(rows, columns=[
+                'has_gps', 'has_time', 'location_valid', 'time_consistent', 'distance',
+                'within', 'datetime_original', 'camera', 'latitude', 'longitude'])
+            df['distance'] = pd.to_numeric(df['distance'], errors='coerce')
+            df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
+            df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+            df['captured'] = pd.to_datetime(df['datetime_original'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+            
+            # pyplot 전역 상태 없이 Agg 캔버스에 직접 렌더링 (헤드리스, 스레드 안전)
+            fig = Figure(figsize=(15, 9))
+            FigureCanvasAgg(fig)
+            axes = fig.subplots(2, 3)
+            
+            def no_data(ax, title):
+                ax.set_title(title)
+                ax.text(0.5, 0.5, '데이터 없음', ha='center', va='center', transform=ax.transAxes)
+                ax.set_xticks([])
+                ax.set_yticks([])
+            
+            # 1. 메타데이터 보유율 및 검증 통과율
+            ax = axes[0, 0]
+            total = len(df)
+            gps_total = int(df['has_gps'].sum())
+            time_total = int(df['has_time'].sum())
+            within_known = df['within'].notna()
+            rates = {
+                'GPS': gps_total / total if total else 0,
+                '시간': time_total / total if total else 0,
+                '위치 유효': df['location_valid'].sum() / gps_total if gps_total else 0,
+                '시간 일관성': df['time_consistent'].sum() / time_total if time_total else 0,
+                '허용 범위 내': df.loc[within_known, 'within'].astype(bool).sum() / within_known.sum()
+                              if within_known.any() else 0,
+            }
+            ax.bar(list(rates.keys()), [v * 100 for v in rates.values()], color='#2D7DD2')
+            ax.set_ylim(0, 100)
+            ax.set_ylabel('%')
+            ax.set_title(f'보유율 / 통과율 (전체 {total}개)')
+            ax.tick_params(axis='x', rotation=30)
+            
+            # 2. 기준점과의 거리 분포
+            ax = axes[0, 1]
+            distances = df['distance'].dropna().to_numpy()
+            if distances.size:
+                ax.hist(distances, bins=min(50, max(5, int(np.sqrt(distances.size)))), color='#4CAF50')
+                ax.set_xlabel('km')
+                ax.set_ylabel('이미지 수')
+                ax.set_title('기준점과의 거리 분포')
+            else:
+                no_data(ax, '기준점과의 거리 분포')
+            
+            # 3. 일자별 촬영 수
+            ax = axes[0, 2]
+            captured = df['captured'].dropna()
+            if not captured.empty:
+                per_day = captured.dt.floor('D').value_counts().sort_index()
+                ax.plot(per_day.index, per_day.to_numpy(), marker='o' if len(per_day) < 60 else None)
+                ax.set_ylabel('이미지 수')
+                ax.set_title('일자별 촬영 수')
+                ax.tick_params(axis='x', rotation=30)
+            else:
+                no_data(ax, '일자별 촬영 수')
+            
+            # 4. 시간대(시)별 촬영 수
+            ax = axes[1, 0]
+            if not captured.empty:
+                per_hour = np.bincount(captured.dt.hour.to_numpy(), minlength=24)
+                ax.bar(np.arange(24), per_hour, color='#2D7DD2')
+                ax.set_xticks(range(0, 24, 3))
+                ax.set_xlabel('시')
+                ax.set_ylabel('이미지 수')
+                ax.set_title('시간대별 촬영 수')
+            else:
+                no_data(ax, '시간대별 촬영 수')
+            
+            # 5. 카메라별 이미지 수 (상위 10개)
+            ax = axes[1, 1]
+            per_camera = df['camera'].value_counts()
+            if len(per_camera) > 10:
+                per_camera = pd.concat([per_camera.iloc[:10], pd.Series({'기타': per_camera.iloc[10:].sum()})])
+            ax.barh(per_camera.index[::-1], per_camera.to_numpy()[::-1], color='#FF9800')
+            ax.set_xlabel('이미지 수')
+            ax.set_title('카메라별 이미지 수')
+            
+            # 6. GPS 촬영 위치 밀도
+            ax = axes[1, 2]
+            located = df[['longitude', 'latitude']].dropna()
+            if not located.empty:
+                density, x_edges, y_edges = np.histogram2d(
+                    located['longitude'].to_numpy(), located['latitude'].to_numpy(), bins=50)
+                mesh = ax.pcolormesh(x_edges, y_edges, density.T, cmap='viridis')
+                fig.colorbar(mesh, ax=ax, label='이미지 수')
+                ax.set_xlabel('경도')
+                ax.set_ylabel('위도')
+                ax.set_title('촬영 위치 밀도')
+            else:
+                no_data(ax, '촬영 위치 밀도')
+            
+            fig.tight_layout()
+            fig.savefig(output_file)
             
             logger.info(f"데이터 시각화 생성 완료: {output_file}")
             return output_file
             
+        except ImportError as e:
+            logger.warning(f"pandas/matplotlib 라이브러리가 설치되지 않아 데이터 시각화를 생성하지 않습니다: {e}")
+            return ""
         except Exception as e:
+            metrics.error('report_visualization')
             logger.error(f"데이터 시각화 생성 중 오류: {e}")
-            return ""
\ No newline at end of file
+            return ""
+
+
+def _run_job(func: Callable, job: Any, profile_mode: str = None) -> Tuple[Any, Dict[str, Any], Dict[str, Any]]:
+    """
+    작업 프로세스에서 _map_bounded 작업 한 개 실행
+
+    Returns:
+        Tuple: (func 반환값, 지표 스냅샷, 프로파일 데이터 또는 None)
+    """
+    # fork 로 복사된 부모의 지표나 이전 작업의 지표가 섞이지 않도록 비우고 시작
+    metrics.reset()
+    result, profile = profiler.profile_call(profile_mode, func, job)
+    return result, metrics.snapshot(reset=True), profile
+
+
+def _render_pdf_volume(job: Tuple[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    PDF 볼륨 한 개를 렌더링 (ProcessPoolExecutor 작업 단위이므로 모듈 수준 함수)
+    
+    반복되는 머리글/바닥글은 폼 XObject 로 한 번만 정의하고 페이지마다 참조함.
+    볼륨 번호, 전체 순번, 생성일시는 색인에만 표시하므로 볼륨 내용은 결과 목록으로만 결정됨
+    
+    Args:
+        job: (출력 경로, 결과 목록)
+        
+    Returns:
+        Dict: 색인 작성용 볼륨 정보
+    """
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import A4
+    
+    output_file, results = job
+    c = canvas.Canvas(output_file, pagesize=A4)
+    width, height = A4
+    
+    def file_name(result):
+        return result.get('exif_data', {}).get('file_name', '알 수 없음')
+    
+    # 페이지 공통 요소 (폼 XObject)
+    c.beginForm('page_furniture')
+    c.setFont("Helvetica-Bold", 10)
+    c.drawString(50, height - 35, f"EXIF 메타데이터 분석 보고서 - {file_name(results[0])} ~ {file_name(results[-1])}")
+    c.setLineWidth(0.5)
+    c.line(50, height - 42, width - 50, height - 42)
+    c.line(50, 40, width - 50, 40)
+    c.endForm()
+    
+    def start_page():
+        c.doForm('page_furniture')
+        c.setFont("Helvetica", 8)
+        c.drawRightString(width - 50, 28, str(c.getPageNumber()))
+        return height - 70
+    
+    y_position = start_page()
+    for offset, result in enumerate(results):
+        if y_position < 100:  # 페이지 넘김
+            c.showPage()
+            y_position = start_page()
+        y_position = ReportGenerator._draw_pdf_entry(c, offset, result, y_position, width)
+    
+    c.save()
+    
+    return {
+        'path': output_file,
+        'count': len(results),
+        'first_file': file_name(results[0]),
+        'last_file': file_name(results[-1]),
+        'gps_images': sum(1 for r in results if r.get('location_result', {}).get('has_gps_data', False)),
+        'time_images': sum(1 for r in results if r.get('time_result', {}).get('has_time_data', False)),
+    }
+
+
+def _html_shard_record(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    샤드 HTML 보고서에서 사용하는 평탄화된 결과 레코드
+    
+    Args:
+        result: 이미지 분석 결과
+        
+    Returns:
+        Dict: 목록/상세 표시와 검색에 필요한 필드만 담은 레코드
+    """
+    exif_data = result.get('exif_data', {})
+    location_result = result.get('location_result', {})
+    time_result = result.get('time_result', {})
+    camera = exif_data.get('camera', {})
+    address = location_result.get('address') or {}
+    
+    record = {
+        'name': exif_data.get('file_name', '알 수 없음'),
+        'path': exif_data.get('file_path', ''),
+        'camera': ' '.join(v for v in (camera.get('Make'), camera.get('Model')) if v),
+        'coordinates': list(exif_data.get('gps', {}).get('coordinates', ())) or None,
+        'address': address.get('full_address'),
+        'has_gps': location_result.get('has_gps_data', False),
+        'location_valid': location_result.get('location_valid', False),
+        'distance': location_result.get('distance_from_reference'),
+        'within': location_result.get('within_threshold'),
+        'has_time': time_result.get('has_time_data', False),
+        'time': time_result.get('datetime_original'),
+        'digitized': time_result.get('datetime_digitized'),
+        'gps_time': time_result.get('gps_datetime'),
+        'timezone': time_result.get('local_timezone'),
+        'consistent': time_result.get('consistent') if time_result.get('has_time_data') else None,
+        'notes': time_result.get('notes', []),
+    }
+    record['search'] = ' '.join(
+        str(record[key]) for key in ('name', 'path', 'camera', 'address', 'time', 'timezone') if record[key]
+    ).lower()
+    return record
+
+
+def _write_html_shard(job: Tuple[str, List[Dict[str, Any]]]) -> str:
+    """
+    HTML 보고서 샤드 한 개를 작성 (ProcessPoolExecutor 작업 단위이므로 모듈 수준 함수)
+    
+    file:// 에서도 로드되도록 JSON 대신 콜백을 호출하는 스크립트로 저장
+    
+    Args:
+        job: (출력 경로, 결과 목록)
+        
+    Returns:
+        str: 작성된 샤드 파일 경로
+    """
+    output_file, results = job
+    records = [_html_shard_record(result) for result in results]
+    with open(output_file, 'w', encoding='utf-8') as f:
+        # 샤드는 순서와 무관하게 재사용되므로 번호 대신 파일 이름으로 자신을 알림
+        f.write(f"window.exifShardLoaded({json.dumps(os.path.basename(output_file))}, ")
+        json.dump(records, f, ensure_ascii=False, separators=(',', ':'))
+        f.write(");\n")
+    return output_file
+
+
+def _content_segments(results: Iterable[Dict[str, Any]], target_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """
+    결과를 내용 기준 경계로 나눠 순서대로 반환 (PDF 볼륨/HTML 샤드 분할)
+
+    결과 경로의 해시로 경계를 정하므로 결과 하나가 추가/삭제되어도 그 결과가 속한 조각만 바뀌고
+    나머지 조각은 내용이 같아 캐시를 재사용함 (고정 크기로 자르면 뒤쪽 조각이 모두 밀림).
+    조각 크기는 target_size 의 절반 이상 2배 이하이며 평균은 target_size 정도
+
+    Args:
+        results: 분석 결과 이터러블
+        target_size: 조각당 평균 결과 수
+
+    Yields:
+        List[Dict]: 결과 조각
+    """
+    target = max(1, target_size)
+    min_size = max(1, target // 2)
+    max_size = target * 2
+    modulus = max(1, target - min_size + 1)
+    segment = []
+    for result in results:
+        segment.append(result)
+        exif_data = result.get('exif_data', {})
+        name = str(exif_data.get('file_path') or exif_data.get('file_name') or '')
+        boundary = int(hashlib.sha1(name.encode('utf-8')).hexdigest()[:8], 16) % modulus == 0
+        if len(segment) >= max_size or (boundary and len(segment) >= min_size):
+            yield segment
+            segment = []
+    if segment:
+        yield segment
+
+
+def _remove_stale_files(pattern: str, keep: Iterable[str]) -> None:
+    """
+    이번 실행에서 만들지 않은 이전 볼륨/샤드 파일 삭제
+
+    Args:
+        pattern: 삭제 대상 glob 패턴
+        keep: 유지할 파일 경로
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    for path in glob.glob(pattern):
+        if os.path.abspath(path) not in keep:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"이전 보고서 파일 삭제 실패: {path}: {e}")
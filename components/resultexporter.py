@@ -0,0 +1,326 @@
+import os
+import csv
+import json
+import time
+import logging
+from datetime import datetime
+from typing import Dict, Any, Optional, Sequence, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class ResultExporter:
+    """분석 결과를 평탄화된 고정 스키마로 CSV/Parquet/Arrow IPC 파일에 스트리밍 기록하는 클래스"""
+
+    # (열 이름, 타입) - 타입은 'string', 'int', 'float', 'bool', 'timestamp'
+    SCHEMA = [
+        ('file_path', 'string'),
+        ('file_name', 'string'),
+        ('format', 'string'),
+        ('width', 'int'),
+        ('height', 'int'),
+        ('camera_make', 'string'),
+        ('camera_model', 'string'),
+        ('lens_make', 'string'),
+        ('lens_model', 'string'),
+        ('focal_length', 'string'),
+        ('f_number', 'string'),
+        ('iso', 'string'),
+        ('exposure_time', 'string'),
+        ('latitude', 'float'),
+        ('longitude', 'float'),
+        ('altitude', 'float'),
+        ('has_gps', 'bool'),
+        ('location_valid', 'bool'),
+        ('address', 'string'),
+        ('country', 'string'),
+        ('city', 'string'),
+        ('distance_km', 'float'),
+        ('within_threshold', 'bool'),
+        ('datetime_original', 'timestamp'),
+        ('datetime_digitized', 'timestamp'),
+        ('gps_datetime', 'timestamp'),
+        ('local_timezone', 'string'),
+        ('has_time', 'bool'),
+        ('time_consistent', 'bool'),
+        ('max_time_difference_s', 'float'),
+        ('notes', 'string'),
+        ('manifest', 'string'),
+    ]
+
+    FORMATS = ('csv', 'parquet', 'arrow')
+
+    EXTENSIONS = {'csv': '.csv', 'parquet': '.parquet', 'arrow': '.arrow'}
+
+    def __init__(self, output_dir: str, formats: Sequence[str] = ('csv',),
+                 row_group_size: int = 10000, base_name: str = 'exif_results', append: bool = False,
+                 rotate_rows: int = 0, rotate_seconds: float = 0.0):
+        """
+        초기화 메서드
+
+        Args:
+            output_dir: 결과물 저장 디렉토리
+            formats: 출력 형식 목록 ('csv', 'parquet', 'arrow')
+            row_group_size: 한 번에 기록할 행 수 (Parquet 행 그룹/Arrow 레코드 배치 크기)
+            base_name: 출력 파일 이름 (확장자 제외)
+            append: True 이면 기존 CSV 뒤에 이어 쓰고, 이어 쓸 수 없는 Parquet/Arrow 는
+                    '<base_name>-<시각>' 이름의 조각 파일로 기록 (감시 모드에서 실행 내내 사용)
+            rotate_rows: 이어 쓰기 모드에서 Parquet/Arrow 조각 파일이 이 행 수 이상이 되면 닫고 다음 조각으로 교체
+                         (행 그룹 단위로 확인하므로 최대 row_group_size 행까지 넘칠 수 있음, 0 이면 행 수로 교체하지 않음)
+            rotate_seconds: 이어 쓰기 모드에서 조각 파일을 연 지 이 시간(초)이 지나면 교체 (0 이면 시간으로 교체하지 않음)
+
+        Parquet/Arrow 파일은 닫혀야 푸터가 기록되어 읽을 수 있으므로, 이어 쓰기 모드의 조각 파일은
+        교체되거나 close 될 때 읽을 수 있게 됨. 조각 파일은 첫 행이 기록될 때 열리므로 빈 조각은 만들지 않음
+        """
+        self.output_dir = output_dir
+        self.row_group_size = max(1, row_group_size)
+        self.columns = [name for name, _ in self.SCHEMA]
+        self.paths = {}
+        self.rows_written = 0
+        self.append = append
+        self.base_name = base_name
+        self.rotate_rows = max(0, rotate_rows)
+        self.rotate_seconds = max(0.0, rotate_seconds)
+        self._buffer = []
+        self._csv_file = None
+        self._csv_writer = None
+        self._arrow_schema = None
+        self._arrow_writers = {}
+        self._columnar = []
+        self._part_rows = 0
+        self._part_started = 0.0
+        os.makedirs(output_dir, exist_ok=True)
+
+        formats = [fmt for fmt in formats if fmt in self.FORMATS]
+        columnar = [fmt for fmt in formats if fmt != 'csv']
+        if columnar:
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                self._arrow_schema = pa.schema([(name, self._arrow_type(pa, kind)) for name, kind in self.SCHEMA])
+            except ImportError:
+                logger.warning("pyarrow 라이브러리가 설치되지 않아 Parquet/Arrow 내보내기를 건너뜁니다.")
+                formats = [fmt for fmt in formats if fmt == 'csv']
+
+        if 'csv' in formats:
+            path = os.path.join(output_dir, base_name + self.EXTENSIONS['csv'])
+            write_header = not append or not os.path.exists(path) or os.path.getsize(path) == 0
+            self._csv_file = open(path, 'a' if append else 'w', encoding='utf-8', newline='')
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=self.columns)
+            if write_header:
+                self._csv_writer.writeheader()
+            self.paths['csv'] = path
+
+        self._columnar = [fmt for fmt in formats if fmt != 'csv']
+        if self._columnar and not append:
+            self._open_part(base_name)
+
+    def _open_part(self, name: str) -> None:
+        """Parquet/Arrow 파일(이어 쓰기 모드에서는 조각 파일)을 새로 염"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        for fmt in self._columnar:
+            path = os.path.join(self.output_dir, name + self.EXTENSIONS[fmt])
+            if fmt == 'parquet':
+                self._arrow_writers[fmt] = pq.ParquetWriter(path, self._arrow_schema)
+            else:
+                self._arrow_writers[fmt] = pa.ipc.new_file(path, self._arrow_schema)
+            self.paths[fmt] = path
+        self._part_rows = 0
+        self._part_started = time.monotonic()
+
+    def _close_part(self) -> None:
+        """열린 Parquet/Arrow 파일을 닫음 (푸터가 기록되어 읽을 수 있게 됨)"""
+        for writer in self._arrow_writers.values():
+            writer.close()
+        self._arrow_writers = {}
+
+    def _rotation_due(self) -> bool:
+        """이어 쓰기 모드에서 현재 조각 파일을 교체할 때인지 여부"""
+        if not self.append or not self._arrow_writers:
+            return False
+        if self.rotate_rows and self._part_rows >= self.rotate_rows:
+            return True
+        return bool(self.rotate_seconds) and time.monotonic() - self._part_started >= self.rotate_seconds
+
+    @staticmethod
+    def _arrow_type(pa, kind: str):
+        """스키마 타입 이름에 해당하는 Arrow 타입"""
+        return {
+            'string': pa.string(),
+            'int': pa.int32(),
+            'float': pa.float64(),
+            'bool': pa.bool_(),
+            'timestamp': pa.timestamp('s'),
+        }[kind]
+
+    @staticmethod
+    def flatten(result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        중첩된 분석 결과를 스키마 열 딕셔너리로 변환
+
+        Args:
+            result: 이미지 분석 결과
+
+        Returns:
+            Dict: 열 이름 -> 값 (없는 값은 None)
+        """
+        exif_data = result.get('exif_data', {})
+        location_result = result.get('location_result', {})
+        time_result = result.get('time_result', {})
+        camera = exif_data.get('camera', {})
+        image = exif_data.get('image', {})
+        gps = exif_data.get('gps', {})
+        image_info = exif_data.get('image_info') or {}
+        size = image_info.get('size') or (None, None)
+        address = location_result.get('address') or {}
+        address_components = address.get('components') or {}
+        differences = time_result.get('time_differences') or {}
+
+        return {
+            'file_path': exif_data.get('file_path'),
+            'file_name': exif_data.get('file_name'),
+            'format': image_info.get('format'),
+            'width': size[0],
+            'height': size[1],
+            'camera_make': camera.get('Make'),
+            'camera_model': camera.get('Model'),
+            'lens_make': camera.get('LensMake'),
+            'lens_model': camera.get('LensModel'),
+            'focal_length': image.get('FocalLength'),
+            'f_number': image.get('FNumber'),
+            'iso': image.get('ISOSpeedRatings'),
+            'exposure_time': image.get('ExposureTime'),
+            'latitude': gps.get('latitude'),
+            'longitude': gps.get('longitude'),
+            'altitude': gps.get('altitude'),
+            'has_gps': location_result.get('has_gps_data', False),
+            'location_valid': location_result.get('location_valid', False),
+            'address': address.get('full_address'),
+            'country': address_components.get('country'),
+            'city': address_components.get('city') or address_components.get('town'),
+            'distance_km': location_result.get('distance_from_reference'),
+            'within_threshold': location_result.get('within_threshold'),
+            'datetime_original': _parse_timestamp(time_result.get('datetime_original')),
+            'datetime_digitized': _parse_timestamp(time_result.get('datetime_digitized')),
+            'gps_datetime': _parse_timestamp(time_result.get('gps_datetime')),
+            'local_timezone': time_result.get('local_timezone'),
+            'has_time': time_result.get('has_time_data', False),
+            'time_consistent': time_result.get('consistent') if time_result.get('has_time_data') else None,
+            'max_time_difference_s': max(differences.values()) if differences else None,
+            'notes': '; '.join(time_result.get('notes', [])) or None,
+            'manifest': json.dumps(result['manifest'], ensure_ascii=False) if result.get('manifest') else None,
+        }
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """
+        분석 결과 한 건 추가 (row_group_size 만큼 모이면 파일에 기록)
+
+        Args:
+            result: 이미지 분석 결과
+        """
+        self._buffer.append(self.flatten(result))
+        if len(self._buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        버퍼에 모인 행을 행 그룹 한 개로 기록
+
+        이어 쓰기 모드에서는 기록할 행이 없어도 조각 파일 교체 조건을 확인하므로
+        감시 모드처럼 오래 열어 두는 경우 유휴 중에도 주기적으로 호출하면 됨
+        """
+        if self._buffer:
+            rows, self._buffer = self._buffer, []
+
+            if self._csv_writer:
+                self._csv_writer.writerows(
+                    {k: (v.isoformat(sep=' ') if isinstance(v, datetime) else v) for k, v in row.items()}
+                    for row in rows)
+                self._csv_file.flush()
+
+            if self._columnar:
+                import pyarrow as pa
+                if not self._arrow_writers:
+                    self._open_part(f"{self.base_name}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}")
+                table = pa.Table.from_pylist(rows, schema=self._arrow_schema)
+                for writer in self._arrow_writers.values():
+                    writer.write_table(table)
+                self._part_rows += len(rows)
+
+            self.rows_written += len(rows)
+            logger.debug(f"내보내기 행 그룹 기록: {len(rows)}행 (누적 {self.rows_written}행)")
+
+        if self._rotation_due():
+            logger.info(f"내보내기 조각 파일 교체: {self._part_rows}행 "
+                        f"({', '.join(self.paths[fmt] for fmt in self._columnar)})")
+            self._close_part()
+
+    def close(self) -> Dict[str, str]:
+        """
+        남은 행을 기록하고 파일을 닫음
+
+        Returns:
+            Dict: 형식별 출력 파일 경로
+        """
+        try:
+            self.flush()
+        finally:
+            if self._csv_file:
+                self._csv_file.close()
+                self._csv_file = None
+                self._csv_writer = None
+            self._close_part()
+        logger.info(f"결과 내보내기 완료: {self.rows_written}행 ({', '.join(self.paths.values())})")
+        return self.paths
+
+    def __enter__(self) -> 'ResultExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class NdjsonWriter:
+    """분석 결과를 한 줄에 JSON 객체 한 개씩 스트림(표준 출력 등)에 즉시 기록하는 클래스"""
+
+    def __init__(self, stream: TextIO):
+        """
+        초기화 메서드
+
+        Args:
+            stream: 출력 텍스트 스트림 (보통 sys.stdout)
+        """
+        self.stream = stream
+        self.rows_written = 0
+
+    def write(self, result: Dict[str, Any]) -> None:
+        """
+        분석 결과 한 건 기록
+
+        줄마다 flush 하므로 읽는 쪽이 느리면 파이프 버퍼가 찬 시점에 쓰기가 블록되어
+        분석도 함께 멈춤 (처리 대기 결과가 메모리에 쌓이지 않음)
+
+        Args:
+            result: 이미지 분석 결과
+        """
+        line = json.dumps(result, ensure_ascii=False, separators=(',', ':'), default=str)
+        try:
+            self.stream.write(line + '\n')
+            self.stream.flush()
+        except BrokenPipeError:
+            # 종료 시 남은 버퍼를 비우다 다시 오류가 나지 않도록 출력을 /dev/null 로 돌림
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, self.stream.fileno())
+            raise
+        self.rows_written += 1
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """분석 결과의 'YYYY-MM-DD HH:MM:SS' 문자열을 datetime 으로 변환"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return None
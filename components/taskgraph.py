@@ -0,0 +1,130 @@
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, Callable, List, Tuple
+from components.metrics import metrics
+from components import profiler
+from components.logconfig import init_worker_logging, worker_log_args
+
+logger = logging.getLogger(__name__)
+
+
+class TaskGraph:
+    """의존 관계가 있는 작업을 프로세스 풀에서 실행하는 소규모 작업 그래프"""
+
+    def __init__(self):
+        """초기화 메서드"""
+        self.tasks = {}
+
+    def add(self, name: str, func: Callable, args: Tuple = (), deps: List[str] = None) -> None:
+        """
+        작업 추가
+
+        작업 함수는 args 뒤에 선행 작업 결과 딕셔너리({작업 이름: 결과})를 마지막 인자로 받음.
+        선행 작업이 실패하면 해당 결과는 None 으로 전달됨
+
+        Args:
+            name: 작업 이름
+            func: 모듈 수준 작업 함수 (피클 가능해야 함)
+            args: 작업 인자
+            deps: 먼저 끝나야 하는 작업 이름 목록
+        """
+        self.tasks[name] = (func, args, [d for d in (deps or []) if d != name])
+
+    def run(self, workers: int = 1) -> Tuple[Dict[str, Any], Dict[str, float], Dict[str, str]]:
+        """
+        선행 작업이 끝난 작업부터 병렬 실행
+
+        Args:
+            workers: 프로세스 수 (1 이하이면 현재 프로세스에서 순차 실행)
+
+        Returns:
+            Tuple: (작업별 결과, 작업별 소요 시간(초), 작업별 오류 메시지)
+        """
+        results, timings, errors = {}, {}, {}
+        remaining = dict(self.tasks)
+
+        def ready():
+            # 그래프에 없는 의존 작업은 무시
+            return [name for name, (_, _, deps) in remaining.items()
+                    if all(d in results or d not in self.tasks for d in deps)]
+
+        def finish(name, outcome):
+            result, elapsed, error = outcome
+            results[name] = result
+            timings[name] = elapsed
+            if error:
+                errors[name] = error
+                logger.error(f"작업 실패: {name} ({elapsed:.2f}초): {error}")
+            else:
+                logger.info(f"작업 완료: {name} ({elapsed:.2f}초)")
+
+        if workers <= 1:
+            while remaining:
+                names = ready()
+                if not names:
+                    break
+                for name in names:
+                    func, args, deps = remaining.pop(name)
+                    finish(name, _run_task(func, args, {d: results.get(d) for d in deps}))
+        else:
+            running = {}
+            profile_mode = profiler.active_mode()
+            with ProcessPoolExecutor(max_workers=min(workers, max(1, len(self.tasks))),
+                                     initializer=init_worker_logging, initargs=worker_log_args()) as executor:
+                while remaining or running:
+                    for name in ready():
+                        func, args, deps = remaining.pop(name)
+                        future = executor.submit(_run_task_in_process, func, args, {d: results.get(d) for d in deps},
+                                                 profile_mode)
+                        running[future] = name
+                    if not running:
+                        break
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        try:
+                            outcome, snapshot, profile = future.result()
+                            metrics.merge(snapshot)
+                            profiler.merge_worker_profile(profile)
+                            finish(name, outcome)
+                        except Exception as e:
+                            # 작업 프로세스 자체가 비정상 종료된 경우
+                            finish(name, (None, 0.0, str(e)))
+
+        for name in remaining:
+            errors[name] = "선행 작업 순환 의존"
+            logger.error(f"작업을 실행할 수 없음 (순환 의존): {name}")
+
+        return results, timings, errors
+
+
+def _run_task(func: Callable, args: Tuple, dep_results: Dict[str, Any]) -> Tuple[Any, float, str]:
+    """
+    작업 한 개 실행 (예외를 문자열로 바꿔 다른 작업에 영향을 주지 않도록 격리)
+
+    Returns:
+        Tuple: (결과, 소요 시간(초), 오류 메시지 또는 None)
+    """
+    start = time.perf_counter()
+    try:
+        return func(*args, dep_results), time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+def _run_task_in_process(func: Callable, args: Tuple, dep_results: Dict[str, Any],
+                         profile_mode: str = None) -> Tuple[Tuple, Dict[str, Any], Dict[str, Any]]:
+    """
+    작업 프로세스에서 작업 한 개 실행 후 그 동안 기록된 지표와 프로파일을 함께 반환 (부모 프로세스에서 합산)
+
+    Args:
+        profile_mode: 부모 프로세스에서 실행 중인 프로파일 모드 (없으면 None)
+
+    Returns:
+        Tuple: (_run_task 결과, 지표 스냅샷, 프로파일 데이터 또는 None)
+    """
+    # fork 로 복사된 부모의 지표나 이전 작업의 지표가 섞이지 않도록 비우고 시작
+    metrics.reset()
+    outcome, profile = profiler.profile_call(profile_mode, _run_task, func, args, dep_results)
+    return outcome, metrics.snapshot(reset=True), profile
@@ -1,6 +1,7 @@
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional
+from components.metrics import metrics, timed
 
 logger = logging.getLogger(__name__)
 
@@ -42,8 +43,14 @@ class TimeAnalyzer:
         # 캐시 확인
         cache_key = f"{latitude:.4f},{longitude:.4f}"
         if cache_key in self.timezone_cache:
+            metrics.increment('timezone_cache_hits')
             return self.timezone_cache[cache_key]
             
+        with metrics.timer('timezone_lookup'):
+            return self._lookup_timezone(latitude, longitude, cache_key)
+    
+    def _lookup_timezone(self, latitude: float, longitude: float, cache_key: str) -> Optional[str]:
+        """timezonefinder 로 시간대를 조회하고 캐시에 저장"""
         try:
             from timezonefinder import TimezoneFinder
             tf = TimezoneFinder()
@@ -60,9 +67,11 @@ class TimeAnalyzer:
             logger.warning("timezonefinder 라이브러리가 설치되지 않았습니다.")
             return None
         except Exception as e:
+            metrics.error('timezone_lookup')
             logger.error(f"시간대 정보 조회 중 오류: {e}")
             return None
     
+    @timed('time_analysis')
     def analyze_time_consistency(self, exif_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         EXIF 데이터의 시간 정보 일관성 분석
@@ -1,8 +1,13 @@
 import os
+import time
+import queue
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import filedialog, ttk
-from PIL import Image, ImageTk
+from gui.previewcache import PreviewCache
+from gui.resultlist import VirtualResultList
 import io
 import math
 
@@ -28,6 +33,9 @@ class ModernUI:
         'small': ('Helvetica', 9),
     }
     
+    # 결과 목록 행 높이 (픽셀)
+    ROW_HEIGHT = 22
+    
     @staticmethod
     def apply_style(root):
         """스타일 적용"""
@@ -83,8 +91,19 @@ class ModernUI:
                        foreground=ModernUI.COLORS['primary'],
                        font=ModernUI.FONTS['subheader'])
         
-        # 리스트박스 스타일 (tk 위젯이므로 ttk 스타일 직접 적용 불가)
-        # 실제 위젯 생성 시 적용
+        # 결과 목록(Treeview) 스타일 - 행 높이는 가상 스크롤 계산에 사용되므로 고정
+        style.configure('Treeview', 
+                       background=ModernUI.COLORS['background'],
+                       fieldbackground=ModernUI.COLORS['background'],
+                       foreground=ModernUI.COLORS['foreground'],
+                       font=ModernUI.FONTS['body'],
+                       rowheight=ModernUI.ROW_HEIGHT)
+        style.configure('Treeview.Heading', 
+                       background=ModernUI.COLORS['secondary'],
+                       font=ModernUI.FONTS['small'])
+        style.map('Treeview', 
+                 background=[('selected', ModernUI.COLORS['primary'])],
+                 foreground=[('selected', 'white')])
         
         # 추가 스타일 - 액션 버튼
         style.configure('Action.TButton', 
@@ -115,6 +134,28 @@ class ExifAnalyzerGUI:
     """EXIF 메타데이터 분석 도구 GUI 클래스"""
     ICON_PATH = os.path.join(os.path.dirname(__file__), '../icon/GC_3rd_smartsicurity.ico')
     
+    # 작업 스레드 메시지 큐 폴링 주기와 한 번에 처리할 최대 메시지 수 (화면 갱신이 밀리지 않도록 제한)
+    POLL_INTERVAL_MS = 100
+    MAX_MESSAGES_PER_POLL = 500
+    
+    # 미리보기 크기 (프레임 크기에 맞게 조정)와 선택 항목 앞뒤로 미리 디코딩할 이미지 수
+    PREVIEW_SIZE = (246, 196)
+    PREFETCH_RADIUS = 3
+    
+    # 분석 중 새 GPS 좌표가 들어왔을 때 지도를 다시 만드는 최소 간격 (초)
+    MAP_REFRESH_INTERVAL = 5.0
+    
+    # 상세 정보 텍스트 태그 (위젯 생성 시 한 번만 설정)
+    DETAIL_TAGS = {
+        'header': {'font': ModernUI.FONTS['subheader'], 'foreground': ModernUI.COLORS['primary']},
+        'subheader': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['primary']},
+        'key': {'font': ModernUI.FONTS['body'], 'foreground': '#555555'},
+        'value': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['foreground']},
+        'valid': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['accent']},
+        'invalid': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['warning']},
+        'important': {'font': ModernUI.FONTS['subheader'], 'foreground': ModernUI.COLORS['foreground']}
+    }
+    
     def __init__(self, root, analyzer):
         """
         초기화 메서드
@@ -127,14 +168,28 @@ class ExifAnalyzerGUI:
         self.analyzer = analyzer
         self.reference_location = None
         self.analysis_results = []
-        self.image_cache = {}  # 이미지 캐시
+        self.detail_cache = {}  # 결과 인덱스 -> 렌더링된 상세 정보
+        self.preview_cache = PreviewCache(self.analyzer.extractor.load_preview, self.PREVIEW_SIZE)
+        
+        # 분석/보고서 작업은 작업 스레드에서 실행하고 결과는 큐로 받아 메인 스레드에서 반영
+        self.message_queue = queue.Queue()
+        self.worker = None
+        self.analysis_started_at = None
+        
+        # 지도는 같은 파일에 쓰므로 전용 스레드 하나에서 순서대로 생성 (분석 중 갱신과 완료 후 생성 공용)
+        self.map_executor = ThreadPoolExecutor(max_workers=1)
+        self.map_coordinates = []
+        self.map_labels = []
+        self.map_built_points = 0
+        self.map_refresh_pending = False
+        self.map_refreshed_at = 0.0
         
         # 스타일 적용
         self.style = ModernUI.apply_style(root)
         
         # 창 설정
         self.root.title("EXIF Location Validator")
-        self.root.geometry("1000x800")
+        self.root.geometry("1200x800")
         
         # 창 아이콘 설정
         if os.path.exists(self.ICON_PATH):
@@ -145,6 +200,10 @@ class ExifAnalyzerGUI:
         
         # 위젯 생성
         self._create_widgets()
+        
+        # 분석 결과와 진행 상황은 작업 스레드에서 호출되므로 큐에 넣기만 함
+        self.analyzer.add_result_listener(lambda result: self.message_queue.put(('result', result)))
+        self.analyzer.add_progress_listener(lambda done, total: self.message_queue.put(('progress', (done, total))))
     
     def _create_widgets(self):
         """GUI 위젯 생성"""
@@ -217,9 +276,14 @@ class ExifAnalyzerGUI:
         action_frame = ttk.Frame(input_frame)
         action_frame.pack(fill="x", padx=10, pady=(0, 10))
         
-        analyze_button = ttk.Button(action_frame, text="Run Analysis", 
-                                   command=self._run_analysis, style='Action.TButton')
-        analyze_button.pack(pady=5, ipadx=10, ipady=5)
+        self.analyze_button = ttk.Button(action_frame, text="Run Analysis", 
+                                        command=self._run_analysis, style='Action.TButton')
+        self.analyze_button.pack(side="left", expand=True, anchor="e", padx=(0, 10), pady=5, ipadx=10, ipady=5)
+        
+        self.cancel_button = ttk.Button(action_frame, text="Cancel", 
+                                       command=self._cancel_analysis, style='Warning.TButton')
+        self.cancel_button.pack(side="left", expand=True, anchor="w", pady=5, ipadx=10, ipady=5)
+        self.cancel_button.state(['disabled'])
         
         # === 메인 컨텐츠 영역 ===
         content_frame = ttk.Frame(main_container)
@@ -233,32 +297,20 @@ class ExifAnalyzerGUI:
         ttk.Label(left_panel, text="Image List", 
                  font=ModernUI.FONTS['subheader']).pack(anchor="w", pady=(0, 10))
         
-        # 이미지 목록 컨테이너
-        list_container = ttk.Frame(left_panel, width=250)
-        list_container.pack(fill="both", expand=True)
-        
-        # 이미지 목록 및 스크롤바
-        list_frame = ttk.Frame(list_container)
-        list_frame.pack(fill="both", expand=True)
-        
-        self.image_listbox = tk.Listbox(list_frame, 
-                                      bg=ModernUI.COLORS['background'],
-                                      fg=ModernUI.COLORS['foreground'],
-                                      selectbackground=ModernUI.COLORS['primary'],
-                                      selectforeground='white',
-                                      font=ModernUI.FONTS['body'],
-                                      borderwidth=1,
-                                      relief="solid",
-                                      highlightthickness=0,
-                                      width=30)
-        self.image_listbox.pack(side="left", fill="both", expand=True)
-        self.image_listbox.bind('<<ListboxSelect>>', self._select_image_from_list)
-        
-        # 스크롤바 추가
-        list_scrollbar = ttk.Scrollbar(list_frame, orient="vertical", 
-                                      command=self.image_listbox.yview)
-        list_scrollbar.pack(side="right", fill="y")
-        self.image_listbox.config(yscrollcommand=list_scrollbar.set)
+        # 검색 필터 (파일명, 경로, 카메라, 주소, 시간대)
+        filter_frame = ttk.Frame(left_panel)
+        filter_frame.pack(fill="x", pady=(0, 5))
+        
+        ttk.Label(filter_frame, text="Filter:", 
+                 font=ModernUI.FONTS['body']).pack(side="left", padx=(0, 5))
+        
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', lambda *args: self.result_list.set_filter(self.filter_var.get()))
+        ttk.Entry(filter_frame, textvariable=self.filter_var).pack(side="left", fill="x", expand=True)
+        
+        # 이미지 목록 (보이는 행만 만드는 가상 목록, 열 제목 클릭 시 정렬)
+        self.result_list = VirtualResultList(left_panel, self._select_image_from_list, ModernUI.ROW_HEIGHT)
+        self.result_list.pack(fill="both", expand=True)
         
         # 이미지 미리보기 영역
         preview_frame = ttk.LabelFrame(left_panel, text="Preview", width=250, height=200)
@@ -306,21 +358,21 @@ class ExifAnalyzerGUI:
         basic_info_frame = ttk.LabelFrame(scroll_frame, text="Basic Information")
         basic_info_frame.pack(fill="x", expand=False, padx=10, pady=(10, 5))
         
-        self.basic_text = self._create_styled_text(basic_info_frame, height=10)
+        self.basic_text = self._create_styled_text(basic_info_frame, height=10, tags=self.DETAIL_TAGS)
         self.basic_text.pack(fill="both", expand=True, padx=5, pady=5)
         
         # GPS 정보 섹션
         gps_info_frame = ttk.LabelFrame(scroll_frame, text="GPS Information")
         gps_info_frame.pack(fill="x", expand=False, padx=10, pady=5)
         
-        self.gps_text = self._create_styled_text(gps_info_frame, height=10)
+        self.gps_text = self._create_styled_text(gps_info_frame, height=10, tags=self.DETAIL_TAGS)
         self.gps_text.pack(fill="both", expand=True, padx=5, pady=5)
         
         # 시간 정보 섹션
         time_info_frame = ttk.LabelFrame(scroll_frame, text="Time Information")
         time_info_frame.pack(fill="x", expand=False, padx=10, pady=5)
         
-        self.time_text = self._create_styled_text(time_info_frame, height=10)
+        self.time_text = self._create_styled_text(time_info_frame, height=10, tags=self.DETAIL_TAGS)
         self.time_text.pack(fill="both", expand=True, padx=5, pady=5)
         
         # --- 두 번째 탭: 지도 ---
@@ -373,8 +425,9 @@ class ExifAnalyzerGUI:
         report_button_frame = ttk.Frame(report_frame)
         report_button_frame.pack(fill="x", padx=10, pady=10)
         
-        ttk.Button(report_button_frame, text="Generate report", 
-                  command=self._generate_reports, style="Action.TButton").pack(pady=5, ipadx=10, ipady=5)
+        self.report_button = ttk.Button(report_button_frame, text="Generate report", 
+                                       command=self._generate_reports, style="Action.TButton")
+        self.report_button.pack(pady=5, ipadx=10, ipady=5)
         
         # 결과 텍스트 영역
         report_result_frame = ttk.Frame(report_frame)
@@ -411,13 +464,16 @@ class ExifAnalyzerGUI:
                               relief="sunken", anchor="w",
                               background=ModernUI.COLORS['secondary'],
                               padding=(10, 5))
-        status_bar.pack(fill="x")
+        status_bar.pack(side="left", fill="x", expand=True)
+        
+        self.progress_bar = ttk.Progressbar(status_frame, mode='determinate', length=200)
+        self.progress_bar.pack(side="right", padx=(10, 0))
         
         # 보고서 경로 저장용
         self.report_paths = {}
     
-    def _create_styled_text(self, parent, height=10):
-        """스타일이 적용된 텍스트 위젯 생성"""
+    def _create_styled_text(self, parent, height=10, tags=None):
+        """스타일이 적용된 텍스트 위젯 생성 (tags: 태그 이름 -> 스타일)"""
         text = tk.Text(parent, 
                       height=height,
                       wrap="word",
@@ -434,6 +490,9 @@ class ExifAnalyzerGUI:
         scrollbar.pack(side="right", fill="y")
         text.configure(yscrollcommand=scrollbar.set)
         
+        for tag, style in (tags or {}).items():
+            text.tag_configure(tag, **style)
+        
         return text
     
     def _select_file(self):
@@ -465,24 +524,11 @@ class ExifAnalyzerGUI:
     def _show_image_preview(self, image_path):
         """이미지 미리보기 표시"""
         try:
-            # 이미지 로드 및 리사이즈
-            image = Image.open(image_path)
-            
-            # 미리보기 크기 계산 (비율 유지)
-            preview_width = 246  # 프레임 크기에 맞게 조정
-            preview_height = 196
-            
-            # 비율 계산
-            img_width, img_height = image.size
-            ratio = min(preview_width / img_width, preview_height / img_height)
-            new_width = int(img_width * ratio)
-            new_height = int(img_height * ratio)
-            
-            # 이미지 리사이즈
-            image = image.resize((new_width, new_height), Image.LANCZOS)
-            
-            # ImageTk 객체 생성
-            photo = ImageTk.PhotoImage(image)
+            # 캐시된 미리보기 사용 (없으면 내장 썸네일 또는 축소 디코딩으로 생성)
+            photo = self.preview_cache.get(image_path)
+            if photo is None:
+                self._clear_image_preview()
+                return
             
             # 라벨에 이미지 표시
             self.preview_label.config(image=photo)
@@ -544,277 +590,364 @@ class ExifAnalyzerGUI:
             self._show_status("Error: Invalid tolerance value.", is_error=True)
             return
         
-        # 분석 시작
-        self._show_status("Analyzing...")
-        self.root.update()
+        if self.worker is not None:
+            self._show_status("Error: Another task is still running.", is_error=True)
+            return
+        
+        # 이전 결과 초기화 후 작업 스레드에서 분석 시작 (결과는 도착하는 대로 목록에 추가)
+        self.analysis_results = []
+        self._clear_image_list()
+        self._clear_image_preview()
+        self.preview_cache.clear()
+        self.analyzer.cancel_event.clear()
+        self.analysis_started_at = time.monotonic()
+        self.map_coordinates, self.map_labels = [], []
+        self.map_built_points = 0
+        self.map_refreshed_at = self.analysis_started_at
         
-        # 이미지 분석 수행
+        self._show_status("Analyzing...")
+        self._set_busy(True, cancellable=True)
+        self._start_worker(self._analysis_worker, path, self.reference_location, max_distance)
+    
+    def _analysis_worker(self, path, reference_location, max_distance):
+        """분석 작업 스레드 (Tk 위젯에 접근하지 않고 큐로만 결과를 전달)"""
         try:
             if os.path.isdir(path):
-                self.analysis_results = self.analyzer.analyze_directory(
-                    path, self.reference_location, max_distance)
+                results = self.analyzer.analyze_directory(path, reference_location, max_distance)
             else:
-                result = self.analyzer.analyze_image(
-                    path, self.reference_location, max_distance)
-                if 'error' not in result:
-                    self.analysis_results = [result]
-                else:
-                    self.analysis_results = []
-            
-            # 결과 표시
-            self._update_image_list()
-            self._generate_map()
+                results = self.analyzer.analyze_paths([(path, {})], reference_location, max_distance)
             
-            if self.analysis_results:
-                self._show_status(f"Analysis completed: {len(self.analysis_results)} Images")
-            else:
-                self._show_status("Analysis completed: No valid EXIF ​​data.")
-                
+            # 지도도 작업 스레드에서 생성 (취소된 경우 그때까지의 결과로 생성, 분석 중 갱신한 지도와 같으면 재사용)
+            coordinates_list, labels = self.analyzer.location_validator.collect_map_points(results)
+            map_path, has_coordinates = self.map_executor.submit(self._build_map, coordinates_list, labels).result()
+            self.message_queue.put(('analysis_done', {
+                'cancelled': self.analyzer.cancel_event.is_set(),
+                'map_path': map_path,
+                'has_coordinates': has_coordinates,
+            }))
         except Exception as e:
-            self._show_status(f"An error occurred: {str(e)}", is_error=True)
+            self.message_queue.put(('error', str(e)))
+    
+    def _cancel_analysis(self):
+        """진행 중인 분석 취소 (현재 이미지 처리가 끝나면 중단)"""
+        if self.worker is not None:
+            self.analyzer.cancel_event.set()
+            self.cancel_button.state(['disabled'])
+            self._show_status("Cancelling...")
+    
+    def _start_worker(self, target, *args):
+        """작업 스레드 시작 및 메시지 큐 폴링 예약"""
+        self.worker = threading.Thread(target=target, args=args, daemon=True)
+        self.worker.start()
+        self.root.after(self.POLL_INTERVAL_MS, self._poll_queue)
+    
+    def _poll_queue(self):
+        """작업 스레드가 보낸 메시지 처리 (메인 스레드에서 after() 로 주기적으로 실행)"""
+        new_results = []
+        progress = None
+        events = []
+        
+        for _ in range(self.MAX_MESSAGES_PER_POLL):
+            try:
+                kind, payload = self.message_queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'result':
+                new_results.append(payload)
+            elif kind == 'progress':
+                progress = payload  # 진행 상황은 마지막 값만 반영
+            elif kind == 'map':
+                self._show_partial_map(*payload)
+            else:
+                events.append((kind, payload))
+        
+        if new_results:
+            self._append_results(new_results)
+        if progress:
+            self._update_progress(*progress)
+        
+        for kind, payload in events:
+            self.worker = None
+            self._set_busy(False)
+            if kind == 'analysis_done':
+                self._finish_analysis(payload)
+            elif kind == 'reports_done':
+                self._show_reports(payload)
+            elif kind == 'report_error':
+                self._show_status(f"An error occurred: {payload}", is_error=True)
+                self.report_text.insert(tk.END, f"An error occurred while generating the report: {payload}")
+            elif kind == 'error':
+                self._show_status(f"An error occurred: {payload}", is_error=True)
+        
+        if self.worker is not None or not self.message_queue.empty():
+            self.root.after(self.POLL_INTERVAL_MS, self._poll_queue)
+    
+    def _set_busy(self, busy, cancellable=False):
+        """작업 중 버튼 상태와 진행 표시줄 설정"""
+        self.analyze_button.state(['disabled'] if busy else ['!disabled'])
+        self.report_button.state(['disabled'] if busy else ['!disabled'])
+        self.cancel_button.state(['!disabled'] if busy and cancellable else ['disabled'])
+        
+        self.progress_bar.stop()
+        if busy:
+            # 전체 수를 알기 전까지는 진행 중 표시만
+            self.progress_bar.configure(mode='indeterminate', value=0)
+            self.progress_bar.start(15)
+        else:
+            self.progress_bar.configure(mode='determinate', value=0)
+    
+    def _update_progress(self, done, total):
+        """진행률과 남은 시간 표시"""
+        if self.analyzer.cancel_event.is_set():
+            return
+        elapsed = time.monotonic() - self.analysis_started_at
+        if total:
+            if str(self.progress_bar.cget('mode')) != 'determinate':
+                self.progress_bar.stop()
+                self.progress_bar.configure(mode='determinate', maximum=total)
+            self.progress_bar.configure(value=done)
+            remaining = (total - done) * elapsed / done if done else 0
+            self._show_status(f"Analyzing... {done}/{total} ({done * 100 // total}%) - "
+                              f"ETA {self._format_duration(remaining)}")
+        else:
+            self._show_status(f"Analyzing... {done} files ({self._format_duration(elapsed)} elapsed)")
+    
+    @staticmethod
+    def _format_duration(seconds):
+        """초를 '1m 05s' 형식으로 변환"""
+        minutes, seconds = divmod(int(seconds + 0.5), 60)
+        return f"{minutes}m {seconds:02d}s" if minutes else f"{seconds}s"
+    
+    def _finish_analysis(self, outcome):
+        """분석 완료 처리 (메인 스레드)"""
+        self._show_map(outcome['map_path'], outcome['has_coordinates'])
+        
+        elapsed = self._format_duration(time.monotonic() - self.analysis_started_at)
+        if outcome['cancelled']:
+            self._show_status(f"Analysis cancelled: {len(self.analysis_results)} Images ({elapsed})")
+        elif self.analysis_results:
+            self._show_status(f"Analysis completed: {len(self.analysis_results)} Images ({elapsed})")
+        else:
+            self._show_status("Analysis completed: No valid EXIF ​​data.")
     
     def _show_status(self, message, is_error=False):
         """상태 메시지 표시"""
         self.status_var.set(message)
         # 에러 메시지는 붉은색으로 표시 (직접 라벨에 적용할 수 없어 별도 강조 없음)
     
-    def _update_image_list(self):
-        """이미지 목록 업데이트"""
-        self.image_listbox.delete(0, tk.END)
-        self.image_cache = {}  # 이미지 캐시 초기화
-        
-        for i, result in enumerate(self.analysis_results):
-            exif_data = result.get('exif_data', {})
-            file_name = exif_data.get('file_name', f"Image {i+1}")
-            file_path = exif_data.get('file_path', '')
-
-            # 파일명 표시
-            self.image_listbox.insert(tk.END, file_name)
-            
-            # 이미지 캐시에 경로 저장
-            self.image_cache[i] = file_path
-        
-        if self.analysis_results:
-            self.image_listbox.select_set(0)
-            self._select_image_from_list(None)
+    def _clear_image_list(self):
+        """이미지 목록 초기화"""
+        self.result_list.clear()
+        self.detail_cache = {}
     
-    def _select_image_from_list(self, event):
+    def _append_results(self, new_results):
+        """분석 중 도착한 결과를 이미지 목록에 추가"""
+        first_index = len(self.analysis_results)
+        self.analysis_results.extend(new_results)
+        self.result_list.append(new_results)
+        
+        coordinates_list, labels = self.analyzer.location_validator.collect_map_points(new_results)
+        self.map_coordinates.extend(coordinates_list)
+        self.map_labels.extend(labels)
+        self._refresh_map()
+        
+        # 첫 결과가 도착하면 바로 선택해 상세 정보 표시
+        if first_index == 0 and len(self.result_list.index):
+            self.result_list.select(self.result_list.index.view[0])
+    
+    def _result_path(self, index):
+        """결과 인덱스에 해당하는 이미지 경로"""
+        return self.analysis_results[index].get('exif_data', {}).get('file_path', '')
+    
+    def _select_image_from_list(self, selected_index):
         """이미지 목록에서 선택 시 처리"""
-        if not self.analysis_results:
+        if not 0 <= selected_index < len(self.analysis_results):
             return
             
-        try:
-            selected_index = self.image_listbox.curselection()[0]
-            self._display_image_details(selected_index)
-            
-            # 이미지 미리보기 업데이트
-            if selected_index in self.image_cache:
-                file_path = self.image_cache[selected_index]
-                if file_path and os.path.exists(file_path):
-                    self._show_image_preview(file_path)
-                else:
-                    self._clear_image_preview()
-        except IndexError:
-            pass
+        self._display_image_details(selected_index)
+        
+        # 이미지 미리보기 업데이트
+        file_path = self._result_path(selected_index)
+        if file_path and os.path.exists(file_path):
+            self._show_image_preview(file_path)
+        else:
+            self._clear_image_preview()
+        
+        # 방향키로 이어서 탐색할 때 바로 표시되도록 현재 목록 순서의 앞뒤 이미지를 미리 디코딩
+        self.preview_cache.prefetch(
+            self._result_path(i) for i in self.result_list.neighbours(self.PREFETCH_RADIUS))
     
     def _display_image_details(self, index):
-        """선택된 이미지의 상세 정보 표시"""
+        """선택된 이미지의 상세 정보 표시 (렌더링된 내용은 결과별로 한 번만 만들어 재사용)"""
         if not 0 <= index < len(self.analysis_results):
             return
+        
+        details = self.detail_cache.get(index)
+        if details is None:
+            details = self._render_details(self.analysis_results[index])
+            self.detail_cache[index] = details
+        
+        # 위젯마다 삭제 1회와 (텍스트, 태그) 쌍을 한꺼번에 넘기는 insert 1회로 갱신
+        for text_widget, segments in zip((self.basic_text, self.gps_text, self.time_text), details):
+            text_widget.delete(1.0, tk.END)
+            text_widget.insert(tk.END, *segments)
+    
+    @staticmethod
+    def _render_details(result):
+        """
+        상세 정보 패널 내용 생성
+        
+        Args:
+            result: 이미지 분석 결과
             
-        result = self.analysis_results[index]
+        Returns:
+            Tuple: (기본 정보, GPS 정보, 시간 정보) 별 Text.insert 인자 (텍스트, 태그, 텍스트, 태그, ...)
+        """
         exif_data = result.get('exif_data', {})
         location_result = result.get('location_result', {})
         time_result = result.get('time_result', {})
         
-        # 텍스트 위젯 스타일 설정
-        text_tags = {
-            'header': {'font': ModernUI.FONTS['subheader'], 'foreground': ModernUI.COLORS['primary']},
-            'subheader': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['primary']},
-            'key': {'font': ModernUI.FONTS['body'], 'foreground': '#555555'},
-            'value': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['foreground']},
-            'valid': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['accent']},
-            'invalid': {'font': ModernUI.FONTS['body'], 'foreground': ModernUI.COLORS['warning']},
-            'important': {'font': ModernUI.FONTS['subheader'], 'foreground': ModernUI.COLORS['foreground']}
-        }
-        
-        # 기본 정보 표시
-        self.basic_text.delete(1.0, tk.END)
-        
-        # 태그 설정
-        for tag, style in text_tags.items():
-            self.basic_text.tag_configure(tag, **style)
+        # 기본 정보
+        basic = []
         
         # 파일 정보
-        self.basic_text.insert(tk.END, "File Information\n", 'header')
-        self.basic_text.insert(tk.END, "File Name: ", 'key')
-        self.basic_text.insert(tk.END, f"{exif_data.get('file_name', 'Unknown')}\n", 'value')
-        self.basic_text.insert(tk.END, "File Path: ", 'key')
-        self.basic_text.insert(tk.END, f"{exif_data.get('file_path', 'Unknown')}\n\n", 'value')
-        
-        # 이미지 정보
-        self.basic_text.insert(tk.END, "Image Information\n", 'subheader')
-        if 'image_info' in exif_data:
-            img_info = exif_data['image_info']
-            for key, value in img_info.items():
-                self.basic_text.insert(tk.END, f"{key}: ", 'key')
-                self.basic_text.insert(tk.END, f"{value}\n", 'value')
-        else:
-            self.basic_text.insert(tk.END, "No Image Information\n", 'value')
-        
-        # 카메라 정보
-        self.basic_text.insert(tk.END, "\nCamera Information\n", 'subheader')
-        camera_info = exif_data.get('camera', {})
-        if camera_info:
-            for key, value in camera_info.items():
-                self.basic_text.insert(tk.END, f"{key}: ", 'key')
-                self.basic_text.insert(tk.END, f"{value}\n", 'value')
-        else:
-            self.basic_text.insert(tk.END, "No Camera Information\n", 'value')
-        
-        # 이미지 촬영 정보
-        self.basic_text.insert(tk.END, "\nShooting Settings\n", 'subheader')
-        image_info = exif_data.get('image', {})
-        if image_info:
-            for key, value in image_info.items():
-                self.basic_text.insert(tk.END, f"{key}: ", 'key')
-                self.basic_text.insert(tk.END, f"{value}\n", 'value')
-        else:
-            self.basic_text.insert(tk.END, "No shooting information\n", 'value')
-        
-        # GPS 정보 표시
-        self.gps_text.delete(1.0, tk.END)
-        
-        # 태그 설정
-        for tag, style in text_tags.items():
-            self.gps_text.tag_configure(tag, **style)
+        basic += ["File Information\n", 'header']
+        basic += ["File Name: ", 'key', f"{exif_data.get('file_name', 'Unknown')}\n", 'value']
+        basic += ["File Path: ", 'key', f"{exif_data.get('file_path', 'Unknown')}\n\n", 'value']
+        
+        # 이미지 정보, 카메라 정보, 이미지 촬영 정보
+        for title, info, empty in (("Image Information\n", exif_data.get('image_info'), "No Image Information\n"),
+                                   ("\nCamera Information\n", exif_data.get('camera'), "No Camera Information\n"),
+                                   ("\nShooting Settings\n", exif_data.get('image'), "No shooting information\n")):
+            basic += [title, 'subheader']
+            if info:
+                for key, value in info.items():
+                    basic += [f"{key}: ", 'key', f"{value}\n", 'value']
+            else:
+                basic += [empty, 'value']
         
+        # GPS 정보
+        gps = []
         if location_result.get('has_gps_data', False):
-            self.gps_text.insert(tk.END, "GPS Coordinate Information\n", 'header')
+            gps += ["GPS Coordinate Information\n", 'header']
             
             gps_info = exif_data.get('gps', {})
             if 'coordinates' in gps_info:
                 coords = gps_info['coordinates']
-                self.gps_text.insert(tk.END, "latitude: ", 'key')
-                self.gps_text.insert(tk.END, f"{coords[0]}\n", 'value')
-                self.gps_text.insert(tk.END, "longitude: ", 'key')
-                self.gps_text.insert(tk.END, f"{coords[1]}\n", 'value')
+                gps += ["latitude: ", 'key', f"{coords[0]}\n", 'value']
+                gps += ["longitude: ", 'key', f"{coords[1]}\n", 'value']
             
             if 'altitude' in gps_info:
-                self.gps_text.insert(tk.END, "Altitude: ", 'key')
-                self.gps_text.insert(tk.END, f"{gps_info['altitude']}m\n", 'value')
+                gps += ["Altitude: ", 'key', f"{gps_info['altitude']}m\n", 'value']
             
             if 'datetime' in gps_info:
-                self.gps_text.insert(tk.END, "GPS Time: ", 'key')
-                self.gps_text.insert(tk.END, f"{gps_info['datetime']}\n", 'value')
+                gps += ["GPS Time: ", 'key', f"{gps_info['datetime']}\n", 'value']
             
             # 주소 정보
-            self.gps_text.insert(tk.END, "\nLocation Information\n", 'subheader')
+            gps += ["\nLocation Information\n", 'subheader']
             if 'address' in location_result and 'full_address' in location_result['address']:
-                self.gps_text.insert(tk.END, "Address: ", 'key')
-                self.gps_text.insert(tk.END, f"{location_result['address']['full_address']}\n", 'value')
+                gps += ["Address: ", 'key', f"{location_result['address']['full_address']}\n", 'value']
             
             # 기준점과의 거리
-            self.gps_text.insert(tk.END, "\nBaseline Verification\n", 'subheader')
+            gps += ["\nBaseline Verification\n", 'subheader']
             if location_result.get('distance_from_reference') is not None:
                 distance = location_result['distance_from_reference']
-                within = location_result.get('within_threshold', False)
-                
-                self.gps_text.insert(tk.END, "Reference Point Distance: ", 'key')
-                self.gps_text.insert(tk.END, f"{distance:.2f}km\n", 'value')
-                
-                self.gps_text.insert(tk.END, "Within Acceptable Range: ", 'key')
-                if within:
-                    self.gps_text.insert(tk.END, "Yes ✓\n", 'valid')
+                gps += ["Reference Point Distance: ", 'key', f"{distance:.2f}km\n", 'value']
+                gps += ["Within Acceptable Range: ", 'key']
+                if location_result.get('within_threshold', False):
+                    gps += ["Yes ✓\n", 'valid']
                 else:
-                    self.gps_text.insert(tk.END, "No ✗\n", 'invalid')
+                    gps += ["No ✗\n", 'invalid']
             
             # 검증 결과
-            self.gps_text.insert(tk.END, "\nVerification Results: ", 'important')
+            gps += ["\nVerification Results: ", 'important']
             if location_result.get('location_valid', False):
-                self.gps_text.insert(tk.END, "Location verification passed ✓", 'valid')
+                gps += ["Location verification passed ✓", 'valid']
             else:
-                self.gps_text.insert(tk.END, "Location verification failed ✗", 'invalid')
+                gps += ["Location verification failed ✗", 'invalid']
         else:
-            self.gps_text.insert(tk.END, "No GPS Data", 'value')
-        
-        # 시간 정보 표시
-        self.time_text.delete(1.0, tk.END)
-        
-        # 태그 설정
-        for tag, style in text_tags.items():
-            self.time_text.tag_configure(tag, **style)
+            gps += ["No GPS Data", 'value']
         
+        # 시간 정보
+        times = []
         if time_result.get('has_time_data', False):
-            self.time_text.insert(tk.END, "Time Information\n", 'header')
+            times += ["Time Information\n", 'header']
             
-            if time_result.get('datetime_original'):
-                self.time_text.insert(tk.END, "Shooting Time: ", 'key')
-                self.time_text.insert(tk.END, f"{time_result['datetime_original']}\n", 'value')
-                
-            if time_result.get('datetime_digitized'):
-                self.time_text.insert(tk.END, "Record Time: ", 'key')
-                self.time_text.insert(tk.END, f"{time_result['datetime_digitized']}\n", 'value')
-                
-            if time_result.get('gps_datetime'):
-                self.time_text.insert(tk.END, "GPS Time: ", 'key')
-                self.time_text.insert(tk.END, f"{time_result['gps_datetime']}\n", 'value')
-                
-            if time_result.get('local_timezone'):
-                self.time_text.insert(tk.END, "Local Time Zone: ", 'key')
-                self.time_text.insert(tk.END, f"{time_result['local_timezone']}\n", 'value')
+            for key, label in (('datetime_original', "Shooting Time: "), ('datetime_digitized', "Record Time: "),
+                               ('gps_datetime', "GPS Time: "), ('local_timezone', "Local Time Zone: ")):
+                if time_result.get(key):
+                    times += [label, 'key', f"{time_result[key]}\n", 'value']
             
             # 시간 차이
             if time_result.get('time_differences'):
-                self.time_text.insert(tk.END, "\nTime Difference\n", 'subheader')
+                times += ["\nTime Difference\n", 'subheader']
                 for key, value in time_result['time_differences'].items():
-                    self.time_text.insert(tk.END, f"{key}: ", 'key')
-                    self.time_text.insert(tk.END, f" ({value/60:.1f} minutes) {value:.1f} seconds\n", 'value')
+                    times += [f"{key}: ", 'key', f" ({value/60:.1f} minutes) {value:.1f} seconds\n", 'value']
             
             # 시간 일관성
-            self.time_text.insert(tk.END, "\nVerification Results: ", 'important')
+            times += ["\nVerification Results: ", 'important']
             if time_result.get('consistent', False):
-                self.time_text.insert(tk.END, "Check Time Consistency ✓", 'valid')
+                times += ["Check Time Consistency ✓", 'valid']
             else:
-                self.time_text.insert(tk.END, "Time Mismatch Detected ✗", 'invalid')
+                times += ["Time Mismatch Detected ✗", 'invalid']
             
             # 특이사항
             if time_result.get('notes'):
-                self.time_text.insert(tk.END, "\n\nSignificant\n", 'subheader')
+                times += ["\n\nSignificant\n", 'subheader']
                 for note in time_result.get('notes', []):
-                    self.time_text.insert(tk.END, f"• {note}\n", 'value')
+                    times += [f"• {note}\n", 'value']
         else:
-            self.time_text.insert(tk.END, "No Time Data", 'value')
+            times += ["No Time Data", 'value']
+        
+        return tuple(basic), tuple(gps), tuple(times)
     
-    def _generate_map(self):
-        """지도 생성"""
-        if not self.analysis_results:
+    def _build_map(self, coordinates_list, labels):
+        """
+        지도 생성 (지도 스레드에서 호출, 좌표/레이블/옵션이 같으면 기존 지도 재사용)
+        
+        Returns:
+            Tuple: (지도 파일 경로 또는 빈 문자열, GPS 좌표가 있는지 여부)
+        """
+        if not coordinates_list:
+            return "", False
+        
+        map_path = self.analyzer.location_validator.create_map(
+            coordinates_list, labels, 
+            os.path.join(self.analyzer.output_dir, 'location_map.html')
+        )
+        return map_path, True
+    
+    def _refresh_map(self):
+        """분석 중 새 좌표가 쌓이면 일정 간격으로 지도를 백그라운드에서 갱신 (메인 스레드)"""
+        if (self.map_refresh_pending or len(self.map_coordinates) == self.map_built_points
+                or time.monotonic() - self.map_refreshed_at < self.MAP_REFRESH_INTERVAL):
             return
-            
-        coordinates_list = []
-        labels = []
-        
-        for result in self.analysis_results:
-            exif_data = result.get('exif_data', {})
-            if 'gps' in exif_data and 'coordinates' in exif_data['gps']:
-                coordinates_list.append(exif_data['gps']['coordinates'])
-                labels.append(exif_data.get('file_name', 'unknown'))
-        
-        if coordinates_list:
-            map_path = self.analyzer.location_validator.create_map(
-                coordinates_list, labels, 
-                os.path.join(self.analyzer.output_dir, 'location_map.html')
-            )
-            
-            if map_path:
-                self.report_paths['map'] = map_path
-                self.map_label.config(text=f"The map has been created: {os.path.basename(map_path)}",
-                                    foreground=ModernUI.COLORS['foreground'])
-                self.map_button.state(['!disabled'])
-            else:
-                self.map_label.config(text="Failed to create map.",
-                                    foreground=ModernUI.COLORS['warning'])
-                self.map_button.state(['disabled'])
+        
+        self.map_refresh_pending = True
+        self.map_built_points = len(self.map_coordinates)
+        started_at = self.analysis_started_at
+        future = self.map_executor.submit(self._build_map, list(self.map_coordinates), list(self.map_labels))
+        future.add_done_callback(lambda f: self.message_queue.put(
+            ('map', (started_at, *(("", True) if f.exception() else f.result())))))
+    
+    def _show_partial_map(self, started_at, map_path, has_coordinates):
+        """분석 중 갱신된 지도 표시 (이전 분석에서 요청한 지도는 무시)"""
+        self.map_refresh_pending = False
+        self.map_refreshed_at = time.monotonic()
+        if started_at == self.analysis_started_at and self.worker is not None:
+            self._show_map(map_path, has_coordinates)
+    
+    def _show_map(self, map_path, has_coordinates):
+        """지도 생성 결과 표시 (메인 스레드)"""
+        if map_path:
+            self.report_paths['map'] = map_path
+            self.map_label.config(text=f"The map has been created: {os.path.basename(map_path)}",
+                                foreground=ModernUI.COLORS['foreground'])
+            self.map_button.state(['!disabled'])
+        elif has_coordinates:
+            self.map_label.config(text="Failed to create map.",
+                                foreground=ModernUI.COLORS['warning'])
+            self.map_button.state(['disabled'])
         else:
             self.map_label.config(text="No GPS data available to create map.",
                                 foreground="#999999")
@@ -832,60 +965,66 @@ class ExifAnalyzerGUI:
         if not self.analysis_results:
             self._show_status("Error: There is no data to generate report.", is_error=True)
             return
+        if self.worker is not None:
+            self._show_status("Error: Another task is still running.", is_error=True)
+            return
             
         self._show_status("Generating Report...")
-        self.root.update()
         
+        # 기존 보고서 결과 초기화
+        self.report_text.delete(1.0, tk.END)
+        self.pdf_button.state(['disabled'])
+        self.html_button.state(['disabled'])
+        self.vis_button.state(['disabled'])
+        
+        # 보고서는 작업 스레드에서 생성 (생성 중 목록 변경이 섞이지 않도록 결과 목록을 복사해 전달)
+        self._set_busy(True)
+        self._start_worker(self._report_worker, self.report_format_var.get(), list(self.analysis_results))
+    
+    def _report_worker(self, output_format, results):
+        """보고서 작업 스레드"""
         try:
-            # 기존 보고서 결과 초기화
-            self.report_text.delete(1.0, tk.END)
-            self.pdf_button.state(['disabled'])
-            self.html_button.state(['disabled'])
-            self.vis_button.state(['disabled'])
-            
-            # 스타일 태그 설정
-            self.report_text.tag_configure('header', font=ModernUI.FONTS['subheader'], 
-                                         foreground=ModernUI.COLORS['primary'])
-            self.report_text.tag_configure('path', font=ModernUI.FONTS['body'], 
-                                         foreground=ModernUI.COLORS['foreground'])
+            self.analyzer.results = results
+            self.message_queue.put(('reports_done', self.analyzer.generate_reports(output_format)))
+        except Exception as e:
+            self.message_queue.put(('report_error', str(e)))
+    
+    def _show_reports(self, report_paths):
+        """보고서 생성 결과 표시 (메인 스레드)"""
+        # 스타일 태그 설정
+        self.report_text.tag_configure('header', font=ModernUI.FONTS['subheader'], 
+                                     foreground=ModernUI.COLORS['primary'])
+        self.report_text.tag_configure('path', font=ModernUI.FONTS['body'], 
+                                     foreground=ModernUI.COLORS['foreground'])
+        
+        if report_paths:
+            self.report_paths.update(report_paths)
             
-            # 보고서 생성
-            output_format = self.report_format_var.get()
-            self.analyzer.results = self.analysis_results
-            report_paths = self.analyzer.generate_reports(output_format)
+            # 결과 표시
+            self.report_text.insert(tk.END, "The report has been generated\n\n", 'header')
             
-            if report_paths:
-                self.report_paths.update(report_paths)
-                
-                # 결과 표시
-                self.report_text.insert(tk.END, "The report has been generated\n\n", 'header')
+            for report_type, path in report_paths.items():
+                pretty_type = {
+                    'pdf': 'PDF Report',
+                    'html': 'HTML Report',
+                    'visualization': 'Visualization Results'
+                }.get(report_type, report_type)
                 
-                for report_type, path in report_paths.items():
-                    pretty_type = {
-                        'pdf': 'PDF Report',
-                        'html': 'HTML Report',
-                        'visualization': 'Visualization Results'
-                    }.get(report_type, report_type)
-                    
-                    self.report_text.insert(tk.END, f"{pretty_type}:\n", 'header')
-                    self.report_text.insert(tk.END, f"{path}\n\n", 'path')
-                    
-                    # 버튼 활성화
-                    if report_type == 'pdf':
-                        self.pdf_button.state(['!disabled'])
-                    elif report_type == 'html':
-                        self.html_button.state(['!disabled'])
-                    elif report_type == 'visualization':
-                        self.vis_button.state(['!disabled'])
-                
-                self._show_status("Report Generation Complete")
-            else:
-                self.report_text.insert(tk.END, "Failed to generate report.")
-                self._show_status("ERROR: Failed to generate report", is_error=True)
+                self.report_text.insert(tk.END, f"{pretty_type}:\n", 'header')
+                self.report_text.insert(tk.END, f"{path}\n\n", 'path')
                 
-        except Exception as e:
-            self._show_status(f"An error occurred: {str(e)}", is_error=True)
-            self.report_text.insert(tk.END, f"An error occurred while generating the report: {str(e)}")
+                # 버튼 활성화
+                if report_type == 'pdf':
+                    self.pdf_button.state(['!disabled'])
+                elif report_type == 'html':
+                    self.html_button.state(['!disabled'])
+                elif report_type == 'visualization':
+                    self.vis_button.state(['!disabled'])
+            
+            self._show_status("Report Generation Complete")
+        else:
+            self.report_text.insert(tk.END, "Failed to generate report.")
+            self._show_status("ERROR: Failed to generate report", is_error=True)
     
     def _open_report(self, report_type):
         """특정 타입의 보고서 열기"""
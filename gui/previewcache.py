@@ -0,0 +1,96 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+
+class PreviewCache:
+    """미리보기 PhotoImage 를 최근 사용 순으로 보관하고 이웃 이미지를 미리 디코딩하는 캐시"""
+
+    def __init__(self, loader: Callable[[str, Tuple[int, int]], Any], size: Tuple[int, int],
+                 max_items: int = 256, max_decoded: int = 32):
+        """
+        초기화 메서드
+
+        Args:
+            loader: (경로, 최대 크기) 를 받아 축소된 PIL 이미지 또는 None 을 반환하는 함수
+            size: 미리보기 최대 (폭, 높이)
+            max_items: 보관할 PhotoImage 최대 개수
+            max_decoded: 미리 디코딩해 두는 PIL 이미지 최대 개수
+        """
+        self.loader = loader
+        self.size = size
+        self.max_items = max_items
+        self.max_decoded = max_decoded
+        # PhotoImage 는 Tk 객체이므로 메인 스레드에서만 생성/접근
+        self._photos = OrderedDict()
+        # 백그라운드 스레드가 디코딩한 PIL 이미지 (메인 스레드에서 PhotoImage 로 변환)
+        self._decoded = OrderedDict()
+        self._lock = threading.Lock()
+        self._wanted = set()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def get(self, path: str) -> Optional[Any]:
+        """
+        미리보기 PhotoImage 반환 (메인 스레드에서 호출)
+
+        Args:
+            path: 이미지 경로
+
+        Returns:
+            Optional[PhotoImage]: 미리보기 이미지 또는 None (디코딩 실패)
+        """
+        photo = self._photos.get(path)
+        if photo is not None:
+            self._photos.move_to_end(path)
+            return photo
+
+        with self._lock:
+            image = self._decoded.pop(path, None)
+        if image is None:
+            image = self.loader(path, self.size)
+            if image is None:
+                return None
+
+        from PIL import ImageTk
+        photo = ImageTk.PhotoImage(image)
+        self._photos[path] = photo
+        while len(self._photos) > self.max_items:
+            self._photos.popitem(last=False)
+        return photo
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """
+        주어진 경로를 백그라운드에서 미리 디코딩 (이전 요청 중 아직 처리되지 않은 경로는 취소)
+
+        Args:
+            paths: 곧 표시될 가능성이 높은 이미지 경로 (가까운 순)
+        """
+        # 한도를 넘게 요청하면 먼저 디코딩된 가까운 경로가 밀려나므로 한도까지만 요청
+        paths = [p for p in paths if p and p not in self._photos][:self.max_decoded]
+        with self._lock:
+            self._wanted = set(paths)
+        for path in paths:
+            self._executor.submit(self._decode, path)
+
+    def clear(self) -> None:
+        """캐시 비우기 (새 분석 시작 시)"""
+        self._photos.clear()
+        with self._lock:
+            self._decoded.clear()
+            self._wanted = set()
+
+    def _decode(self, path: str) -> None:
+        """백그라운드 디코딩 작업 (선택이 바뀌어 더 이상 필요 없는 경로는 건너뜀)"""
+        with self._lock:
+            if path not in self._wanted or path in self._decoded:
+                return
+        image = self.loader(path, self.size)
+        if image is None:
+            return
+        with self._lock:
+            if path not in self._wanted:
+                return
+            self._decoded[path] = image
+            while len(self._decoded) > self.max_decoded:
+                self._decoded.popitem(last=False)
@@ -0,0 +1,311 @@
+from tkinter import ttk
+from typing import Any, Callable, Dict, List
+
+
+class ResultIndex:
+    """결과 목록의 표시 값, 정렬 키, 검색 문자열을 미리 계산해 두는 메모리 색인"""
+
+    # (열 이름, 제목, 폭)
+    COLUMNS = (
+        ('name', 'File', 130),
+        ('distance', 'Distance', 70),
+        ('time', 'Shooting Time', 125),
+        ('camera', 'Camera', 90),
+        ('validity', 'Valid', 50),
+    )
+
+    def __init__(self):
+        """초기화 메서드"""
+        self.rows = []       # 결과 인덱스 -> 표시 값 튜플
+        self.search = []     # 결과 인덱스 -> 소문자 검색 문자열
+        self.keys = {name: [] for name, _, _ in self.COLUMNS}  # 열 -> 결과 인덱스별 정렬 키
+        self.view = []       # 현재 필터/정렬이 적용된 결과 인덱스 목록
+        self.query = ''
+        self.sort_column = None
+        self.descending = False
+
+    def __len__(self) -> int:
+        return len(self.view)
+
+    def append(self, results: List[Dict[str, Any]]) -> None:
+        """
+        결과 추가 (필터에 맞는 결과만 현재 목록에 반영)
+
+        Args:
+            results: 추가할 분석 결과 목록 (결과 인덱스는 추가된 순서)
+        """
+        first_index = len(self.rows)
+        for result in results:
+            values, keys, search = self._describe(result)
+            self.rows.append(values)
+            self.search.append(search)
+            for name, key in keys.items():
+                self.keys[name].append(key)
+
+        added = [i for i in range(first_index, len(self.rows)) if self._matches(i)]
+        self.view.extend(added)
+        if added and self.sort_column:
+            self._sort()
+
+    def set_filter(self, query: str) -> None:
+        """
+        검색어로 목록 필터링 (파일명, 경로, 카메라, 주소, 시간대 부분 일치)
+
+        Args:
+            query: 검색어 (빈 문자열이면 전체)
+        """
+        self.query = query.strip().lower()
+        self.view = [i for i in range(len(self.rows)) if self._matches(i)]
+        if self.sort_column:
+            self._sort()
+
+    def sort_by(self, column: str) -> None:
+        """
+        열 기준 정렬 (같은 열을 다시 지정하면 순서 반전)
+
+        Args:
+            column: COLUMNS 의 열 이름
+        """
+        if self.sort_column == column:
+            self.descending = not self.descending
+        else:
+            self.sort_column = column
+            self.descending = False
+        self._sort()
+
+    def _matches(self, index: int) -> bool:
+        return not self.query or self.query in self.search[index]
+
+    def _sort(self) -> None:
+        """값이 없는 결과는 정렬 방향과 관계없이 마지막에 둠"""
+        keys = self.keys[self.sort_column]
+        present = [i for i in self.view if keys[i] is not None]
+        missing = [i for i in self.view if keys[i] is None]
+        present.sort(key=keys.__getitem__, reverse=self.descending)
+        self.view = present + missing
+
+    @staticmethod
+    def _describe(result: Dict[str, Any]):
+        """결과 한 건의 (표시 값, 정렬 키, 검색 문자열)"""
+        exif_data = result.get('exif_data', {})
+        location_result = result.get('location_result', {})
+        time_result = result.get('time_result', {})
+        camera_info = exif_data.get('camera', {})
+        address = location_result.get('address') or {}
+
+        name = exif_data.get('file_name', 'Unknown')
+        distance = location_result.get('distance_from_reference')
+        shot_at = time_result.get('datetime_original')
+        camera = ' '.join(v for v in (camera_info.get('Make'), camera_info.get('Model')) if v)
+
+        # 위치/시간 검증 결과 (데이터가 없으면 '-')
+        has_gps = location_result.get('has_gps_data', False)
+        location_ok = location_result.get('location_valid', False) and location_result.get('within_threshold') is not False
+        has_time = time_result.get('has_time_data', False)
+        time_ok = time_result.get('consistent', False)
+        validity = ' '.join('-' if not present else ('✓' if ok else '✗')
+                            for present, ok in ((has_gps, location_ok), (has_time, time_ok)))
+        problems = (1 if has_gps and not location_ok else 0) + (1 if has_time and not time_ok else 0)
+
+        values = (name, f"{distance:.2f}km" if distance is not None else '', shot_at or '', camera, validity)
+        keys = {
+            'name': name.lower(),
+            'distance': distance,
+            'time': shot_at,
+            'camera': camera.lower() or None,
+            'validity': problems,
+        }
+        search = ' '.join(str(v) for v in (name, exif_data.get('file_path'), camera, address.get('full_address'),
+                                           time_result.get('local_timezone'), shot_at) if v).lower()
+        return values, keys, search
+
+
+class VirtualResultList(ttk.Frame):
+    """화면에 보이는 행만 Treeview 에 만드는 가상 스크롤 결과 목록"""
+
+    def __init__(self, parent, on_select: Callable[[int], None], row_height: int = 22):
+        """
+        초기화 메서드
+
+        Args:
+            parent: 부모 위젯
+            on_select: 선택된 결과 인덱스를 받는 함수
+            row_height: Treeview 행 높이 (스타일의 rowheight 와 같아야 함)
+        """
+        super().__init__(parent)
+        self.on_select = on_select
+        self.row_height = row_height
+        self.index = ResultIndex()
+        self.offset = 0          # 첫 번째로 보이는 행의 목록 내 위치
+        self.visible_rows = 20   # 실제 높이에 맞춰 <Configure> 에서 갱신
+        self.selected = None     # 선택된 결과 인덱스
+        self._refreshing = False
+
+        columns = [name for name, _, _ in ResultIndex.COLUMNS]
+        self.tree = ttk.Treeview(self, columns=columns, show='headings', selectmode='browse')
+        for name, title, width in ResultIndex.COLUMNS:
+            self.tree.heading(name, text=title, command=lambda c=name: self.sort_by(c))
+            self.tree.column(name, width=width, minwidth=40, stretch=(name == 'name'))
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        # Treeview 자체 스크롤 대신 목록 전체 기준 스크롤바 사용
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.tree.bind('<Configure>', self._on_configure)
+        self.tree.bind('<<TreeviewSelect>>', self._on_tree_select)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self._on_mousewheel)
+        for sequence, step in (('<Up>', -1), ('<Down>', 1), ('<Prior>', 'page_up'), ('<Next>', 'page_down'),
+                               ('<Home>', 'home'), ('<End>', 'end')):
+            self.tree.bind(sequence, lambda event, step=step: self._on_key(step))
+
+    def clear(self) -> None:
+        """목록 초기화"""
+        self.index = ResultIndex()
+        self.offset = 0
+        self.selected = None
+        self.refresh()
+
+    def append(self, results: List[Dict[str, Any]]) -> None:
+        """분석 중 도착한 결과 추가 (보이는 범위가 바뀔 때만 행을 다시 만듦)"""
+        shown = len(self.index)
+        self.index.append(results)
+        if self.index.sort_column or shown < self.offset + self.visible_rows:
+            self.refresh()
+        else:
+            self._update_scrollbar()
+
+    def set_filter(self, query: str) -> None:
+        """검색어 필터 적용"""
+        self.index.set_filter(query)
+        self.offset = 0
+        self.refresh()
+        if self.selected is not None and self.selected in self.index.view:
+            self.see(self.selected)
+
+    def sort_by(self, column: str) -> None:
+        """열 제목 클릭 시 정렬"""
+        self.index.sort_by(column)
+        arrow = ' ▼' if self.index.descending else ' ▲'
+        for name, title, _ in ResultIndex.COLUMNS:
+            self.tree.heading(name, text=title + (arrow if name == column else ''))
+        if self.selected is not None and self.selected in self.index.view:
+            self.see(self.selected)
+        else:
+            self.refresh()
+
+    def select(self, result_index: int) -> None:
+        """결과 선택 (보이도록 스크롤 후 on_select 호출)"""
+        self.selected = result_index
+        self.see(result_index)
+        self.on_select(result_index)
+
+    def see(self, result_index: int) -> None:
+        """결과가 보이도록 스크롤"""
+        try:
+            position = self.index.view.index(result_index)
+        except ValueError:
+            return
+        if position < self.offset:
+            self.offset = position
+        elif position >= self.offset + self.visible_rows:
+            self.offset = position - self.visible_rows + 1
+        self.refresh()
+
+    def neighbours(self, radius: int) -> List[int]:
+        """현재 목록 순서에서 선택 항목 앞뒤의 결과 인덱스 (가까운 순)"""
+        if self.selected is None:
+            return []
+        view = self.index.view
+        try:
+            position = view.index(self.selected)
+        except ValueError:
+            return []
+        result = []
+        for offset in range(1, radius + 1):
+            for p in (position + offset, position - offset):
+                if 0 <= p < len(view):
+                    result.append(view[p])
+        return result
+
+    def refresh(self) -> None:
+        """현재 스크롤 위치의 행만 Treeview 에 다시 채움"""
+        total = len(self.index)
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        window = self.index.view[self.offset:self.offset + self.visible_rows]
+
+        self._refreshing = True
+        try:
+            self.tree.delete(*self.tree.get_children())
+            for result_index in window:
+                self.tree.insert('', 'end', iid=str(result_index), values=self.index.rows[result_index])
+            if self.selected is not None and self.tree.exists(str(self.selected)):
+                self.tree.selection_set(str(self.selected))
+                self.tree.focus(str(self.selected))
+        finally:
+            self._refreshing = False
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        """목록 전체 대비 현재 보이는 범위를 스크롤바에 반영"""
+        total = len(self.index)
+        if total:
+            self.scrollbar.set(self.offset / total, min(1.0, (self.offset + self.visible_rows) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _on_configure(self, event) -> None:
+        """위젯 높이에 맞춰 만들 행 수 갱신 (머리글 높이만큼 한 행을 뺌)"""
+        rows = max(1, event.height // self.row_height - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.refresh()
+
+    def _on_scrollbar(self, *args) -> None:
+        """스크롤바 이동 ('moveto' 또는 'scroll' 명령)"""
+        if args[0] == 'moveto':
+            self.offset = int(float(args[1]) * len(self.index))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (self.visible_rows if args[2] == 'pages' else 1)
+            self.offset += step
+        self.refresh()
+
+    def _on_mousewheel(self, event) -> str:
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.offset -= 3
+        else:
+            self.offset += 3
+        self.refresh()
+        return 'break'
+
+    def _on_key(self, step) -> str:
+        """방향키/페이지 키로 목록 전체에서 선택 이동"""
+        view = self.index.view
+        if not view:
+            return 'break'
+        try:
+            position = view.index(self.selected) if self.selected is not None else -1
+        except ValueError:
+            position = -1
+        if step == 'home':
+            position = 0
+        elif step == 'end':
+            position = len(view) - 1
+        elif step == 'page_up':
+            position -= self.visible_rows
+        elif step == 'page_down':
+            position += self.visible_rows
+        else:
+            position += step
+        self.select(view[max(0, min(position, len(view) - 1))])
+        return 'break'
+
+    def _on_tree_select(self, event) -> None:
+        """마우스로 행을 선택한 경우 (refresh 중 selection_set 으로 발생한 이벤트는 무시)"""
+        if self._refreshing:
+            return
+        selection = self.tree.selection()
+        if selection and int(selection[0]) != self.selected:
+            self.selected = int(selection[0])
+            self.on_select(self.selected)
@@ -2,87 +2,227 @@ import os
 import sys
 import time
 import json
+import signal
 import logging
 from datetime import datetime
 from typing import Dict, List, Tuple, Any, Optional, Union
 
-# 필요한 라이브러리 설치 확인 및 임포트
+# 분석에 반드시 필요한 라이브러리만 확인
+# (보고서, 지도, GUI 라이브러리는 해당 기능을 사용할 때 임포트되며 없으면 그 기능만 건너뜀)
 try:
     import exifread
-    from PIL import Image
-    import piexif
-    import folium
-    import pytz
-    import geopy
-    from geopy.geocoders import Nominatim
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import A4
-    import pandas as pd
-    import matplotlib.pyplot as plt
-    from jinja2 import Template
-    import tkinter as tk
-    from tkinter import filedialog, ttk
-    import webbrowser
-    from timezonefinder import TimezoneFinder
 except ImportError as e:
     print(f"필요한 라이브러리를 설치해주세요: {e}")
     print("pip install -r requirements.txt")
     sys.exit(1)
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("log/exif_analyzer.log"),
-        logging.StreamHandler()
-    ]
-)
-
 logger = logging.getLogger("EXIF_Analyzer")
 
 # ====== 사용자 정의 모듈 ======
 from components.exifanalyzer import ExifAnalyzer
-from components.exifextractor import ExifExtractor
-from components.locationvalidator import LocationValidator
-from components.timeanalyzer import TimeAnalyzer
-from components.reportgenerator import ReportGenerator
+from components.archivereader import ArchiveReader
+from components.manifestreader import ManifestReader
+from components.resultexporter import ResultExporter, NdjsonWriter
+from components.folderwatcher import FolderWatcher
+from components.metrics import metrics, start_metrics_server
+from components.profiler import Profiler
+from components.logconfig import configure_logging
+
+
+def watch_directory(analyzer: ExifAnalyzer, args, reference_location: Optional[Tuple[float, float]],
+                    export_formats: List[str], status) -> None:
+    """
+    감시 모드: 디렉토리에 새로 들어오거나 수정된 이미지만 배치로 분석해 누적 결과와 내보내기 파일에 추가
+
+    Args:
+        analyzer: ExifAnalyzer 인스턴스
+        args: 명령행 인자
+        reference_location: 기준 위치 (위도, 경도)
+        export_formats: 내보내기 형식 목록 (비어 있으면 내보내지 않음)
+        status: 진행 메시지 출력 스트림
+    """
+    # 오래 실행되므로 결과는 메모리에 쌓지 않고 누적 결과 파일(NDJSON)에만 기록
+    analyzer.retain_results = False
+    results_path = os.path.join(args.output, 'watch_results.ndjson')
+    batch = {'done': 0}
+    analyzer.add_progress_listener(lambda done, total: batch.update(done=done))
+
+    total = 0
+    with FolderWatcher(args.path, analyzer.extractor.is_supported_format,
+                       os.path.join(args.output, '.watch_state.json'), args.watch_interval) as watcher, \
+            open(results_path, 'a', encoding='utf-8') as results_file:
+        analyzer.add_result_listener(NdjsonWriter(results_file).write)
+
+        def stop(signum, frame):
+            # 예외를 올리지 않고 종료 요청만 기록하고 대기를 깨움: 분석 중이면 현재 이미지까지만 처리하고,
+            # 내보내기/상태 파일 기록은 끊기지 않고 끝난 뒤 루프가 종료됨
+            analyzer.cancel_event.set()
+            watcher.wake()
+
+        signal.signal(signal.SIGINT, stop)
+        signal.signal(signal.SIGTERM, stop)
+
+        # 내보내기 파일은 실행 내내 하나의 작성기로 이어 쓰고 Parquet/Arrow 는 행 수/시간 기준으로 조각 파일을 교체
+        exporter = None
+        if export_formats:
+            exporter = ResultExporter(args.output, export_formats, args.export_row_group_size, append=True,
+                                      rotate_rows=args.export_rotate_rows, rotate_seconds=args.export_rotate_seconds)
+            analyzer.add_result_listener(exporter.write)
+        mode = 'inotify' if watcher.uses_inotify else f"{args.watch_interval}초 간격 폴링"
+        print(f"디렉토리 감시 중: {args.path} ({mode}, Ctrl+C 로 종료)", file=status)
+        try:
+            while not analyzer.cancel_event.is_set():
+                if exporter:
+                    # 직전 배치의 행을 기록하고, 유휴 중에도 시간 기준 조각 파일 교체를 확인
+                    exporter.flush()
+                paths = watcher.scan()
+                if paths:
+                    batch['done'] = 0
+                    analyzer.analyze_paths([(path, {}) for path in paths], reference_location, args.max_distance)
+                    # 처리한 파일만 기록 (중단된 경우 나머지는 다음 실행에서 분석)
+                    watcher.commit(paths[:batch['done']])
+                    total += analyzer.result_count
+                    print(f"[{datetime.now():%H:%M:%S}] {batch['done']}개 파일 분석, "
+                          f"{analyzer.result_count}개 결과 추가 (누적 {total}개)", file=status)
+                    continue
+                watcher.wait()
+        finally:
+            if exporter:
+                analyzer.result_listeners.remove(exporter.write)
+                exporter.close()
+    print(f"감시 종료: 이번 실행에서 {total}개 결과 추가 ({results_path})", file=status)
 
-# GUI 모듈은 선택적으로 처리
-try:
-    from gui.gui import ExifAnalyzerGUI
-except ImportError:
-    ExifAnalyzerGUI = None
+
+def report_skipped(status) -> None:
+    """
+    EXIF 또는 GPS 데이터가 없어 건너뛴 이미지 수를 출력
+
+    Args:
+        status: 진행 메시지 출력 스트림
+    """
+    without_exif = metrics.count('images_without_exif')
+    without_gps = metrics.count('images_without_gps')
+    if without_exif or without_gps:
+        print(f"EXIF 데이터 없음: {without_exif:g}개, GPS 데이터 없음: {without_gps:g}개", file=status)
+
+
+def report_metrics(args, status) -> None:
+    """
+    단계별 지표 요약을 출력하고 요청 시 JSON 으로 저장
+
+    Args:
+        args: 명령행 인자
+        status: 진행 메시지 출력 스트림
+    """
+    print("단계별 처리 지표:", file=status)
+    print(metrics.summary_text(), file=status)
+    if args.metrics_json:
+        try:
+            print(f"지표 저장 완료: {metrics.write_json(args.metrics_json)}", file=status)
+        except OSError as e:
+            print(f"오류: 지표를 저장하지 못했습니다: {e}", file=status)
 
 
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description='EXIF 메타데이터 분석 및 위치 검증 도구')
-    parser.add_argument('--path', type=str, help='분석할 이미지 파일 또는 디렉토리 경로')
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument('--path', type=str, help='분석할 이미지 파일, 디렉토리 또는 ZIP/TAR 아카이브 경로')
+    source_group.add_argument('--from-manifest', type=str, metavar='FILE',
+                              help='분석할 경로 목록 파일 (줄 또는 NUL 구분, 탭으로 메타데이터 열 추가 가능)')
+    source_group.add_argument('--from-stdin', action='store_true', help='표준 입력에서 분석할 경로 목록 읽기')
     parser.add_argument('--output', type=str, default='output', help='결과물 저장 디렉토리')
     parser.add_argument('--ref-location', type=str, help='기준 위치 (위도,경도 형식)')
     parser.add_argument('--max-distance', type=float, default=1.0, help='허용 최대 거리 (km)')
     parser.add_argument('--report-format', type=str, default='all', choices=['pdf', 'html', 'all'], help='보고서 출력 형식')
+    parser.add_argument('--pdf-volume-size', type=int, default=0,
+                        help='PDF 보고서를 평균 N개 이미지 단위 볼륨과 색인으로 분할 (0이면 단일 파일, 볼륨 경계는 파일 경로로 정해져 재실행 시 바뀐 볼륨만 렌더링)')
+    parser.add_argument('--html-shard-size', type=int, default=0,
+                        help='HTML 보고서를 색인 페이지와 평균 N개 이미지 단위 샤드로 분할 (0이면 단일 페이지)')
     parser.add_argument('--gui', action='store_true', help='GUI 모드로 실행')
+    parser.add_argument('--watch', action='store_true',
+                        help='--path 디렉토리를 계속 감시하며 새로 들어오거나 수정된 이미지만 분석 (Ctrl+C 로 종료)')
+    parser.add_argument('--serve', action='store_true',
+                        help='작업 프로세스를 미리 띄워 두고 HTTP 로 분석 요청을 받는 서비스 모드 (Ctrl+C 로 종료)')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='서비스 모드 수신 주소')
+    parser.add_argument('--port', type=int, default=8765, help='서비스 모드 수신 포트')
+    parser.add_argument('--socket', type=str, metavar='PATH', help='서비스 모드에서 TCP 대신 사용할 Unix 소켓 경로')
+    parser.add_argument('--max-concurrent', type=int, default=8,
+                        help='서비스 모드에서 동시에 처리할 분석 요청 수 (초과 요청은 503 응답)')
+    parser.add_argument('--max-batch', type=int, default=1000, help='서비스 모드 일괄 분석 요청 한 건의 최대 경로 수')
+    parser.add_argument('--watch-interval', type=float, default=2.0,
+                        help='감시 모드 폴링 간격 및 복사 완료 확인 간격 (초)')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='아카이브 멤버 동시 분석 수, 보고서 병렬 작성 및 서비스 모드 작업 프로세스 수')
+    parser.add_argument('--manifest-delimiter', type=str, default='auto', choices=['auto', 'newline', 'nul'],
+                        help='경로 목록 레코드 구분자')
+    parser.add_argument('--format', type=str, default='text', choices=['text', 'ndjson'],
+                        help='출력 형식 (ndjson: 분석 결과를 한 줄에 하나씩 표준 출력으로 스트리밍하고 보고서는 생성하지 않음)')
+    parser.add_argument('--export', type=str, metavar='FORMATS',
+                        help='분석 중 결과를 표 형식으로 내보내기 (쉼표 구분: csv, parquet, arrow)')
+    parser.add_argument('--export-row-group-size', type=int, default=10000,
+                        help='내보내기 파일에 한 번에 기록할 행 수')
+    parser.add_argument('--export-rotate-rows', type=int, default=1000000,
+                        help='감시 모드에서 Parquet/Arrow 조각 파일을 교체할 행 수 (0이면 행 수로 교체하지 않음)')
+    parser.add_argument('--export-rotate-seconds', type=float, default=3600.0,
+                        help='감시 모드에서 Parquet/Arrow 조각 파일을 교체할 간격 (초, 0이면 시간으로 교체하지 않음, '
+                             '조각 파일은 교체되거나 종료될 때 읽을 수 있게 됨)')
+    parser.add_argument('--metrics-json', type=str, metavar='FILE',
+                        help='실행 종료 시 단계별 소요 시간/카운터 지표를 JSON 으로 저장할 경로')
+    parser.add_argument('--metrics-port', type=int, metavar='PORT',
+                        help='감시 모드에서 Prometheus 지표(/metrics)를 제공할 포트')
+    parser.add_argument('--profile', type=str, choices=Profiler.MODES,
+                        help='실행 전체를 프로파일해 출력 디렉토리에 저장 (cpu: cProfile, memory: tracemalloc, 작업 프로세스 포함)')
+    parser.add_argument('--profile-top', type=int, default=30, help='프로파일 요약에 표시할 항목 수')
+    parser.add_argument('--log-level', type=str.upper, default='INFO', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='로그 레벨 (이미지별 처리 기록은 DEBUG)')
 
     args = parser.parse_args()
+    # 로그 파일 쓰기는 별도 스레드에서 처리 (분석 중에는 큐에 넣기만 함)
+    configure_logging(args.log_level)
+
+    # ndjson 모드에서는 표준 출력을 결과 전용으로 쓰고 진행 메시지는 표준 오류로 출력
+    status = sys.stderr if args.format == 'ndjson' else sys.stdout
 
     os.makedirs(args.output, exist_ok=True)
+    if not args.profile:
+        run(args, status)
+        return
+
+    with Profiler(args.profile, args.output, args.profile_top) as profile:
+        run(args, status)
+    print(f"프로파일 요약 ({args.profile}):", file=status)
+    print(profile.summary_text(), file=status)
+    print(f"프로파일 저장 완료: {profile.paths['dump']}, {profile.paths['summary']}", file=status)
+
+
+def run(args, status) -> None:
+    """
+    명령행 인자에 따라 GUI, 서비스, 감시 또는 일괄 분석 실행
+
+    Args:
+        args: 명령행 인자
+        status: 진행 메시지 출력 스트림
+    """
     analyzer = ExifAnalyzer(args.output)
 
     # GUI 실행 시
     if args.gui:
-        if ExifAnalyzerGUI:
-            root = tk.Tk()
-            app = ExifAnalyzerGUI(root, analyzer)
-            root.mainloop()
-        else:
+        # GUI 모듈(tkinter)은 선택적으로 처리
+        try:
+            import tkinter as tk
+            from gui.gui import ExifAnalyzerGUI
+        except ImportError:
             print("GUI 모듈이 없습니다. gui.py를 확인하세요.")
+            return
+        root = tk.Tk()
+        app = ExifAnalyzerGUI(root, analyzer)
+        root.mainloop()
         return
 
-    if not args.path:
-        print("오류: 이미지 파일 또는 디렉토리 경로를 지정해야 합니다.")
+    if not (args.serve or args.path or args.from_manifest or args.from_stdin):
+        print("오류: 이미지 파일 또는 디렉토리 경로를 지정해야 합니다.", file=status)
         return
 
     reference_location = None
@@ -94,33 +234,110 @@ def main():
                 lon = float(parts[1].strip())
                 reference_location = (lat, lon)
         except ValueError:
-            print("오류: 유효한 기준 위치 형식이 아닙니다. (예: 37.5665,126.9780)")
+            print("오류: 유효한 기준 위치 형식이 아닙니다. (예: 37.5665,126.9780)", file=status)
             return
 
+    if args.serve:
+        # --ref-location/--max-distance 는 요청에 값이 없을 때의 기본값
+        from components.analysisservice import AnalysisService
+        with AnalysisService(args.output, args.workers, args.max_concurrent, args.max_batch,
+                             reference_location, args.max_distance) as service:
+            address = args.socket or f"http://{args.host}:{args.port}"
+            print(f"분석 서비스 실행 중: {address} (작업 프로세스 {service.workers}개, Ctrl+C 로 종료)", file=status)
+            try:
+                service.serve(args.host, args.port, args.socket)
+            except FileExistsError as e:
+                print(f"오류: {e}", file=status)
+        return
+
+    export_formats = []
+    if args.export:
+        export_formats = [fmt.strip().lower() for fmt in args.export.split(',') if fmt.strip()]
+        unknown = [fmt for fmt in export_formats if fmt not in ResultExporter.FORMATS]
+        if unknown:
+            print(f"오류: 지원되지 않는 내보내기 형식: {', '.join(unknown)}", file=status)
+            return
+
+    if args.format == 'ndjson':
+        analyzer.add_result_listener(NdjsonWriter(sys.stdout).write)
+        analyzer.retain_results = False
+
+    if args.watch:
+        if not (args.path and os.path.isdir(args.path)):
+            print("오류: 감시 모드는 --path 로 디렉토리를 지정해야 합니다.", file=status)
+            return
+        metrics_server = start_metrics_server(port=args.metrics_port) if args.metrics_port else None
+        try:
+            watch_directory(analyzer, args, reference_location, export_formats, status)
+        finally:
+            if metrics_server:
+                metrics_server.shutdown()
+        report_metrics(args, status)
+        return
+
+    exporter = None
+    if export_formats:
+        # 분석이 진행되는 동안 결과를 행 그룹 단위로 기록
+        exporter = ResultExporter(args.output, export_formats, args.export_row_group_size)
+        analyzer.add_result_listener(exporter.write)
+
     results = []
-    if os.path.isdir(args.path):
-        print(f"디렉토리 분석 중: {args.path}")
-        results = analyzer.analyze_directory(args.path, reference_location, args.max_distance)
-    else:
-        print(f"이미지 분석 중: {args.path}")
-        result = analyzer.analyze_image(args.path, reference_location, args.max_distance)
-        if 'error' not in result:
-            results = [result]
+    try:
+        if args.from_manifest:
+            print(f"경로 목록 분석 중: {args.from_manifest}", file=status)
+            with open(args.from_manifest, 'rb') as manifest:
+                entries = ManifestReader(manifest, args.manifest_delimiter)
+                results = analyzer.analyze_paths(entries, reference_location, args.max_distance)
+        elif args.from_stdin:
+            print("표준 입력 경로 목록 분석 중", file=sys.stderr)
+            entries = ManifestReader(sys.stdin.buffer, args.manifest_delimiter)
+            results = analyzer.analyze_paths(entries, reference_location, args.max_distance)
+        elif os.path.isdir(args.path):
+            print(f"디렉토리 분석 중: {args.path}", file=status)
+            results = analyzer.analyze_directory(args.path, reference_location, args.max_distance)
+        elif ArchiveReader.is_archive(args.path):
+            print(f"아카이브 분석 중: {args.path}", file=status)
+            results = analyzer.analyze_archive(args.path, reference_location, args.max_distance, args.workers)
+        else:
+            print(f"이미지 분석 중: {args.path}", file=status)
+            # 단일 이미지도 경로 목록으로 분석해야 결과 전달과 보고서 데이터가 같은 방식으로 처리됨
+            results = analyzer.analyze_paths([(args.path, {})], reference_location, args.max_distance)
+    finally:
+        if exporter:
+            export_paths = exporter.close()
+            if export_paths:
+                print(f"결과 내보내기 완료 ({exporter.rows_written}행):", file=status)
+                for export_format, path in export_paths.items():
+                    print(f"  {export_format}: {path}", file=status)
+
+    if not analyzer.result_count:
+        print("분석 결과가 없습니다.", file=status)
+        report_skipped(status)
+        report_metrics(args, status)
+        return
 
-    if not results:
-        print("분석 결과가 없습니다.")
+    print(f"{analyzer.result_count}개의 이미지 분석 완료", file=status)
+    report_skipped(status)
+    format_stats = analyzer.extractor.get_format_stats()
+    if format_stats:
+        print("형식별 처리 통계:", file=status)
+        for format_name, stats in format_stats.items():
+            print(f"  {format_name}: {stats['count']}개, {stats['seconds']:.2f}초 (평균 {stats['avg_ms']:.1f}ms)", file=status)
+    if args.format == 'ndjson':
+        report_metrics(args, status)
         return
 
-    print(f"{len(results)}개의 이미지 분석 완료")
-    print("보고서 생성 중...")
-    report_paths = analyzer.generate_reports(args.report_format)
+    print("보고서 생성 중...", file=status)
+    report_paths = analyzer.generate_reports(args.report_format, args.pdf_volume_size, args.workers,
+                                             args.html_shard_size)
 
     if report_paths:
-        print("보고서 생성 완료:")
+        print("보고서 생성 완료:", file=status)
         for report_type, path in report_paths.items():
-            print(f"  {report_type}: {path}")
+            print(f"  {report_type}: {path}", file=status)
     else:
-        print("보고서 생성에 실패했습니다.")
+        print("보고서 생성에 실패했습니다.", file=status)
+    report_metrics(args, status)
 
 
 if __name__ == "__main__":